@@ -0,0 +1,307 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from objectives import OBJECTIVES
+from optimizers.differential_evolution import DifferentialEvolution
+from optimizers.genetic_algorithm import GeneticAlgorithm
+from optimizers.instrumentation import Instrumentation
+
+"benchmark suite: every optimizer on every OBJECTIVES entry across dimensions, population sizes and seeds"
+
+# Each factory builds a fresh optimizer from (population_size, generations, seed).
+# Both use the batched code paths, which is what scales to large dims.
+OPTIMIZERS = {
+    'ga': lambda population_size, generations, seed: GeneticAlgorithm(
+        population_size, 0.1, 0.9, generations, mode='generational', seed=seed),
+    'de': lambda population_size, generations, seed: DifferentialEvolution(
+        population_size=population_size, generations=generations, vectorized=True, seed=seed),
+}
+
+# objectives whose variables have a physical meaning and cannot be scaled
+FIXED_DIMS = {'1'}
+
+
+def scaled_bounds(bounds, dims):
+    """Repeat a bounds list cyclically up to dims entries."""
+    return [bounds[i % len(bounds)] for i in range(dims)]
+
+
+def scaled_objective(key, dims):
+    """
+    Batched objective, bounds and direction for OBJECTIVES[key] at `dims`
+    variables, or None when the objective only exists at its native size.
+    """
+    obj = OBJECTIVES[key]
+    if dims != obj['dims'] and key in FIXED_DIMS:
+        return None
+    return obj['batch_func'], scaled_bounds(obj['bounds'], dims), obj['minimize']
+
+
+def _run(optimizer, objective, dims, population_size, generations, seed, instr=None):
+    fitness_fn, bounds, minimize = scaled_objective(objective, dims)
+    opt = OPTIMIZERS[optimizer](population_size, generations, seed)
+    return opt.run(fitness_fn, bounds, minimize=minimize, instrumentation=instr)
+
+
+def run_case(optimizer, objective, dims, population_size, generations=50, seed=0, track_memory=True):
+    """
+    Run one configuration and return its measurements.
+
+    Timings come from a plain run; peak memory (tracemalloc, Python and
+    numpy allocations) from a second identical run, since tracing slows
+    allocation down enough to distort the timings.
+
+    Returns:
+        dict with the configuration, 'best_value', 'n_evaluations', 'wall_s',
+        'evaluations_per_s', 'generation_latency_s' (median per generation),
+        'phases_s', 'peak_memory_bytes' (None without track_memory) and
+        'curve', a list of [evaluations, best value] pairs, one per generation.
+    """
+    instr = Instrumentation()
+    result = _run(optimizer, objective, dims, population_size, generations, seed, instr)
+    summary = result['instrumentation']
+    elapsed = np.array([r['elapsed_s'] for r in instr.records])
+    latency = float(np.median(np.diff(elapsed, prepend=0.0))) if len(elapsed) else 0.0
+
+    peak = None
+    if track_memory:
+        tracemalloc.start()
+        try:
+            _run(optimizer, objective, dims, population_size, generations, seed,
+                 Instrumentation(keep_records=False))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'optimizer': optimizer,
+        'objective': objective,
+        'dims': dims,
+        'population_size': population_size,
+        'generations': generations,
+        'seed': seed,
+        'best_value': float(result['best_value']),
+        'n_evaluations': int(result['n_evaluations']),
+        'wall_s': summary['total_s'],
+        'evaluations_per_s': summary['evaluations_per_s'],
+        'generation_latency_s': latency,
+        'phases_s': summary['phases_s'],
+        'peak_memory_bytes': peak,
+        'curve': [[r['n_evaluations'], r['best_value']] for r in instr.records],
+    }
+
+
+def _finite(value):
+    return value is not None and bool(np.isfinite(value))
+
+
+def _json_safe(obj):
+    """Copy of obj with non-finite floats replaced by None, so it dumps as strict JSON."""
+    if isinstance(obj, dict):
+        return {k: _json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(v) for v in obj]
+    if isinstance(obj, float) and not np.isfinite(obj):
+        return None
+    return obj
+
+
+def case_key(case):
+    return (case['optimizer'], case['objective'], case['dims'], case['population_size'], case['generations'])
+
+
+def aggregate(cases):
+    """
+    Combine the seeds of each (optimizer, objective, dims, population_size,
+    generations) configuration: medians for throughput and latency, the largest peak
+    memory, mean/std of the best value and the mean best-vs-evaluations curve.
+
+    Non-finite best values (Scherrer reaches inf at theta = pi/2, and failed
+    objectives give NaN) are left out of the best-value statistics and
+    counted in 'non_finite'; the statistics are None when no seed is finite.
+    Curve points are averaged over the finite seeds in the same way.
+    """
+    groups = {}
+    for case in cases:
+        groups.setdefault(case_key(case), []).append(case)
+    rows = []
+    for (optimizer, objective, dims, population_size, generations), group in groups.items():
+        best = np.array([c['best_value'] for c in group], dtype=float)
+        finite = np.isfinite(best)
+        n_points = min(len(c['curve']) for c in group)
+        curves = np.array([c['curve'][:n_points] for c in group], dtype=float).reshape(len(group), n_points, 2)
+        values = curves[:, :, 1]
+        ok = np.isfinite(values)
+        counts = ok.sum(axis=0)
+        curve_best = np.where(ok, values, 0.0).sum(axis=0) / np.maximum(counts, 1)
+        curve = [[float(e), float(v) if n else None]
+                 for e, v, n in zip(curves[:, :, 0].mean(axis=0), curve_best, counts)]
+        peaks = [c['peak_memory_bytes'] for c in group if c['peak_memory_bytes'] is not None]
+        rows.append({
+            'optimizer': optimizer,
+            'objective': objective,
+            'dims': dims,
+            'population_size': population_size,
+            'generations': generations,
+            'seeds': len(group),
+            'minimize': OBJECTIVES[objective]['minimize'],
+            'best_value_mean': float(best[finite].mean()) if finite.any() else None,
+            'best_value_std': float(best[finite].std()) if finite.any() else None,
+            'non_finite': int((~finite).sum()),
+            'evaluations_per_s': float(np.median([c['evaluations_per_s'] for c in group])),
+            'generation_latency_s': float(np.median([c['generation_latency_s'] for c in group])),
+            'peak_memory_bytes': max(peaks) if peaks else None,
+            'curve': curve,
+        })
+    return rows
+
+
+def environment():
+    import sklearn
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'sklearn': sklearn.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+    }
+
+
+def run_suite(optimizers=None, objectives=None, dims=(3, 10, 100, 1000), population_sizes=(20, 50),
+              seeds=(0, 1, 2), generations=50, track_memory=True, verbose=False):
+    """
+    Run every optimizer on every objective for each dims, population size
+    and seed. Scherrer ('1') only runs at its native 4 variables; the other
+    objectives repeat their 3-variable bounds up to `dims`.
+
+    Returns:
+        dict with 'environment', 'config', the raw 'cases' and the per
+        configuration 'summary' (see aggregate()), ready for save_results().
+    """
+    optimizers = list(optimizers or OPTIMIZERS)
+    objectives = list(objectives or OBJECTIVES)
+    config = {
+        'optimizers': optimizers, 'objectives': objectives, 'dims': list(dims),
+        'population_sizes': list(population_sizes), 'seeds': list(seeds),
+        'generations': generations, 'track_memory': track_memory,
+    }
+    cases = []
+    start = time.perf_counter()
+    for objective in objectives:
+        native = OBJECTIVES[objective]['dims']
+        for d in sorted({native if objective in FIXED_DIMS else d for d in dims}):
+            for optimizer in optimizers:
+                for population_size in population_sizes:
+                    for seed in seeds:
+                        case = run_case(optimizer, objective, d, population_size, generations, seed, track_memory)
+                        cases.append(case)
+                        if verbose:
+                            print(f"{optimizer:>3} obj {objective} dims {d:>5} pop {population_size:>4} seed {seed}: "
+                                  f"{case['evaluations_per_s']:>12.0f} evals/s, best {case['best_value']:.4g}")
+    return {
+        'environment': environment(),
+        'config': config,
+        'elapsed_s': time.perf_counter() - start,
+        'cases': cases,
+        'summary': aggregate(cases),
+    }
+
+
+def save_results(results, path):
+    """Write results as strict JSON; inf/NaN values are stored as null."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(_json_safe(results), f, indent=2, allow_nan=False)
+    return path
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(baseline, current, speed_tolerance=0.2, memory_tolerance=0.2, quality_tolerance=0.1):
+    """
+    Flag regressions of `current` against `baseline` (results dicts or
+    their 'summary' lists), matched by configuration.
+
+    A configuration regresses when its evaluations/s drop, or its generation
+    latency or peak memory grow, by more than the given fraction, or when its
+    mean best value gets worse by more than quality_tolerance relative to the
+    baseline (absolute when the baseline is 0). More seeds ending on a
+    non-finite best value than in the baseline is flagged as 'non_finite';
+    the best-value check only runs when both means are finite. Timing
+    tolerances should be generous: results from different machines are not
+    comparable.
+
+    Returns:
+        list of dicts with the configuration, 'metric', 'baseline' and 'current'.
+    """
+    def rows(results):
+        summary = results['summary'] if isinstance(results, dict) else results
+        return {case_key(r): r for r in summary}
+
+    base, cur = rows(baseline), rows(current)
+    regressions = []
+
+    def flag(key, metric, old, new):
+        optimizer, objective, dims, population_size, generations = key
+        regressions.append({'optimizer': optimizer, 'objective': objective, 'dims': dims,
+                            'population_size': population_size, 'generations': generations, 'metric': metric,
+                            'baseline': old, 'current': new})
+
+    for key in sorted(base.keys() & cur.keys()):
+        old, new = base[key], cur[key]
+        if new['evaluations_per_s'] < old['evaluations_per_s'] * (1.0 - speed_tolerance):
+            flag(key, 'evaluations_per_s', old['evaluations_per_s'], new['evaluations_per_s'])
+        if new['generation_latency_s'] > old['generation_latency_s'] * (1.0 + speed_tolerance):
+            flag(key, 'generation_latency_s', old['generation_latency_s'], new['generation_latency_s'])
+        if old['peak_memory_bytes'] and new['peak_memory_bytes'] is not None:
+            if new['peak_memory_bytes'] > old['peak_memory_bytes'] * (1.0 + memory_tolerance):
+                flag(key, 'peak_memory_bytes', old['peak_memory_bytes'], new['peak_memory_bytes'])
+        if new.get('non_finite', 0) > old.get('non_finite', 0):
+            flag(key, 'non_finite', old.get('non_finite', 0), new['non_finite'])
+        if _finite(old['best_value_mean']) and _finite(new['best_value_mean']):
+            worse = old['best_value_mean'] - new['best_value_mean']
+            if old['minimize']:
+                worse = -worse
+            scale = abs(old['best_value_mean']) or 1.0
+            if worse > quality_tolerance * scale:
+                flag(key, 'best_value_mean', old['best_value_mean'], new['best_value_mean'])
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark GA and DE on the OBJECTIVES registry.")
+    parser.add_argument('--optimizers', nargs='+', choices=sorted(OPTIMIZERS), default=sorted(OPTIMIZERS))
+    parser.add_argument('--objectives', nargs='+', choices=sorted(OBJECTIVES), default=sorted(OBJECTIVES))
+    parser.add_argument('--dims', nargs='+', type=int, default=[3, 10, 100, 1000])
+    parser.add_argument('--population-sizes', nargs='+', type=int, default=[20, 50])
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0, 1, 2])
+    parser.add_argument('--generations', type=int, default=50)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--output', default='output/benchmark.json')
+    parser.add_argument('--baseline', help="earlier results file to check for regressions")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.optimizers, args.objectives, args.dims, args.population_sizes, args.seeds,
+                        args.generations, track_memory=not args.no_memory, verbose=True)
+    save_results(results, args.output)
+    print(f"\n{len(results['cases'])} runs in {results['elapsed_s']:.1f} s, results written to {args.output}")
+    if args.baseline:
+        regressions = compare(load_results(args.baseline), results)
+        for r in regressions:
+            print(f"REGRESSION {r['optimizer']} obj {r['objective']} dims {r['dims']} pop {r['population_size']}: "
+                  f"{r['metric']} {r['baseline']:.4g} -> {r['current']:.4g}")
+        print(f"{len(regressions)} regression(s) against {args.baseline}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
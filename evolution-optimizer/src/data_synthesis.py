@@ -1,10 +1,13 @@
 import numpy as np
 from sklearn.preprocessing import MinMaxScaler
 
-def generate_synthetic_dataset(n_samples=400, noise=0.02, random_state=42):
-    rng = np.random.default_rng(random_state)
-    # 9 synthesis variables (X)
-    X = rng.uniform(0, 1, size=(n_samples, 9))
+def synthesis_yield(X, noise=0.0, random_state=None):
+    """
+    Ground-truth yield of raw (unscaled) synthesis variables, shape (n, 9).
+    This is the hidden function the synthetic dataset samples; with noise > 0
+    it behaves like a (noisy) lab measurement.
+    """
+    X = np.atleast_2d(X)
     # Hidden nonlinear relationship (choose a few dominant vars)
     y = (
         3.5 * X[:, 0]**0.7 +
@@ -15,7 +18,30 @@ def generate_synthetic_dataset(n_samples=400, noise=0.02, random_state=42):
         0.5 * X[:, 1] +
         0.3 * X[:, 4] * X[:, 7]
     )
-    y = y + rng.normal(0, noise, size=n_samples)
+    if noise > 0:
+        y = y + np.random.default_rng(random_state).normal(0, noise, size=len(y))
+    return y
+
+def make_yield_oracle(scaler_X, noise=0.02, random_state=None):
+    """
+    Batched "experiment" on scaled candidates: maps them back to raw units
+    with scaler_X and returns their noisy synthesis_yield.
+    """
+    rng = np.random.default_rng(random_state)
+
+    def oracle(X_scaled):
+        raw = scaler_X.inverse_transform(np.atleast_2d(X_scaled))
+        return synthesis_yield(np.clip(raw, 0.0, 1.0), noise=noise, random_state=rng)
+
+    oracle.batched = True
+    return oracle
+
+def generate_synthetic_dataset(n_samples=400, noise=0.02, random_state=42):
+    # random_state may be an int, SeedSequence or np.random.Generator
+    rng = np.random.default_rng(random_state)
+    # 9 synthesis variables (X)
+    X = rng.uniform(0, 1, size=(n_samples, 9))
+    y = synthesis_yield(X, noise=noise, random_state=rng)
     y = y.reshape(-1, 1)
     # Scale X to [0,1], keep y as-is or scale if desired
     scaler_X = MinMaxScaler()
@@ -2,7 +2,59 @@ import numpy as np
 import math
 import matplotlib.pyplot as plt
 from sklearn.manifold import MDS
+from scipy.spatial.distance import pdist, cdist, squareform
 from sklearn.preprocessing import StandardScaler
+from optimizers.rng import make_rng
+
+
+def bounds_scale(bounds):
+    """Per-dimension 1/range factors (0 for degenerate bounds)."""
+    span = np.array([hi - lo for lo, hi in bounds], dtype=float)
+    return np.divide(1.0, span, out=np.zeros_like(span), where=span > 0)
+
+
+def normalized_pdist(points, bounds):
+    """Condensed matrix of bounds-normalized Euclidean distances between rows of points."""
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    return pdist(points * bounds_scale(bounds))
+
+
+def pairwise_distance_stats(points, bounds, block_size=None):
+    """
+    Min, mean and max of the bounds-normalized pairwise distances.
+    With block_size set, the upper triangle is walked in row blocks of that
+    size so memory stays O(block_size * n) instead of O(n^2).
+    """
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    n = len(points)
+    if n < 2:
+        return {'min': 0.0, 'mean': 0.0, 'max': 0.0, 'pairs': 0}
+    if block_size is None:
+        d = normalized_pdist(points, bounds)
+        return {'min': float(d.min()), 'mean': float(d.mean()), 'max': float(d.max()), 'pairs': len(d)}
+    scaled = points * bounds_scale(bounds)
+    total, count, d_min, d_max = 0.0, 0, np.inf, 0.0
+    for start in range(0, n - 1, block_size):
+        rows = scaled[start:start + block_size]
+        block = cdist(rows, scaled[start + 1:])
+        # keep only pairs (i, j) with j > i
+        upper = np.arange(len(rows))[:, None] <= np.arange(block.shape[1])[None, :]
+        d = block[upper]
+        total += d.sum()
+        count += len(d)
+        d_min = min(d_min, d.min())
+        d_max = max(d_max, d.max())
+    return {'min': float(d_min), 'mean': float(total / count), 'max': float(d_max), 'pairs': count}
+
+
+def select_diverse_batch(candidates, scores, q, bounds, known=None, diversity_weight=0.5):
+    """
+    Choose q candidates that score well and are spread out, avoiding the
+    already measured points in `known`. See MaxMinDiversification.select_from_candidates.
+    """
+    selector = MaxMinDiversification(bounds, num_samples=q, initial_samples=known)
+    return selector.select_from_candidates(candidates, scores, q, diversity_weight)
+
 
 class MaxMinDiversification:
     """
@@ -10,42 +62,67 @@ class MaxMinDiversification:
     Useful for chemical recipes where you want to explore diverse parameter combinations.
     """
     
-    def __init__(self, bounds, num_samples=10, initial_samples=None):
+    def __init__(self, bounds, num_samples=10, initial_samples=None, seed=None):
         """
         Args:
             bounds: list of (min, max) tuples for each parameter
             num_samples: number of diverse samples to generate
             initial_samples: optional list of initial parameter sets (recipes)
+            seed: int, SeedSequence or np.random.Generator for reproducible sampling
         """
         self.bounds = bounds
         self.num_samples = num_samples
         self.dims = len(bounds)
+        self.rng = make_rng(seed)
         self.samples = []
         
         if initial_samples is not None:
             self.samples = [np.array(s) for s in initial_samples]
     
+    def _scale(self):
+        """Per-dimension 1/range factors (0 for degenerate bounds)."""
+        return bounds_scale(self.bounds)
+
     def _distance(self, point1, point2):
         """Euclidean distance between two points (normalized by bounds)."""
-        normalized_diff = []
-        for i, (p1, p2) in enumerate(zip(point1, point2)):
-            lo, hi = self.bounds[i]
-            range_val = hi - lo
-            if range_val > 0:
-                normalized_diff.append(((p1 - p2) / range_val) ** 2)
-            else:
-                normalized_diff.append(0)
-        return math.sqrt(sum(normalized_diff))
-    
+        diff = (np.asarray(point1, dtype=float) - np.asarray(point2, dtype=float)) * self._scale()
+        return math.sqrt(float(np.dot(diff, diff)))
+
+    def _distances_to_point(self, points, point, scale):
+        """Normalized distance from every row of points to one point, in one broadcast."""
+        diff = (points - point) * scale
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+    def _min_distances_to_samples(self, points, scale):
+        """Running minimum distance from every row of points to the current samples."""
+        min_dist = np.full(len(points), np.inf)
+        for s in self.samples:
+            np.minimum(min_dist, self._distances_to_point(points, s, scale), out=min_dist)
+        return min_dist
+
+    def _random_points(self, n):
+        """Draw n uniform points inside the bounds as one (n, dims) matrix."""
+        lower = np.array([lo for lo, _ in self.bounds], dtype=float)
+        upper = np.array([hi for _, hi in self.bounds], dtype=float)
+        return self.rng.uniform(lower, upper, size=(n, self.dims))
+
     def _min_distance_to_samples(self, candidate):
         """Find minimum distance from candidate to existing samples."""
         if len(self.samples) == 0:
             return float('inf')
-        return min(self._distance(candidate, s) for s in self.samples)
+        candidate = np.asarray(candidate, dtype=float)[None, :]
+        return float(self._min_distances_to_samples(candidate, self._scale())[0])
     
     def generate_diverse_samples(self, candidates_per_iteration=100):
         """
         Generate diverse parameter sets using Max-Min strategy.
+
+        All candidates are drawn up front as one pool matrix
+        (candidates_per_iteration per sample still to pick) together with a
+        running min-distance vector against the selected samples. Each pick is
+        the argmax of that vector, after which the vector is updated with a
+        single broadcasted distance computation to the new sample, so there is
+        no Python-level loop over candidates or dimensions.
         
         Args:
             candidates_per_iteration: number of random candidates to evaluate per iteration
@@ -55,37 +132,81 @@ class MaxMinDiversification:
         """
         # If no initial samples, start with a random one
         if len(self.samples) == 0:
-            initial = np.array([np.random.uniform(lo, hi) for lo, hi in self.bounds])
+            initial = self._random_points(1)[0]
             self.samples.append(initial)
-        
+        remaining = self.num_samples - len(self.samples)
+        if remaining <= 0:
+            return self.samples
+
+        scale = self._scale()
+        pool = self._random_points(candidates_per_iteration * remaining)
+        min_dist = self._min_distances_to_samples(pool, scale)
+
         # Iteratively add samples that maximize minimum distance
-        while len(self.samples) < self.num_samples:
-            # Generate random candidates
-            candidates = []
-            for _ in range(candidates_per_iteration):
-                candidate = np.array([np.random.uniform(lo, hi) for lo, hi in self.bounds])
-                min_dist = self._min_distance_to_samples(candidate)
-                candidates.append((min_dist, candidate))
-            
-            # Select candidate with maximum minimum distance
-            best_candidate = max(candidates, key=lambda x: x[0])
-            self.samples.append(best_candidate[1])
+        for _ in range(remaining):
+            best = int(np.argmax(min_dist))
+            pick = pool[best].copy()
+            self.samples.append(pick)
+            np.minimum(min_dist, self._distances_to_point(pool, pick, scale), out=min_dist)
         
         return self.samples
-    
-    def get_diversity_score(self):
+
+    def select_from_candidates(self, candidates, scores=None, q=None, diversity_weight=0.5):
+        """
+        Greedily pick q rows of a fixed candidate set (e.g. a GA population),
+        trading each row's score against its distance to what is already
+        selected (existing samples included, so measured points repel too).
+
+        Each pick maximizes (1 - w) * score + w * min_distance, both scaled
+        to [0, 1]; w = 1 is pure Max-Min, w = 0 is pure top-q by score. The
+        running min-distance vector is updated as in generate_diverse_samples.
+
+        Returns:
+            (selected rows, their indices into candidates); rows are also
+            appended to self.samples.
+        """
+        candidates = np.atleast_2d(np.asarray(candidates, dtype=float))
+        n = len(candidates)
+        q = min(q or self.num_samples, n)
+        if scores is None:
+            score = np.zeros(n)
+        else:
+            scores = np.asarray(scores, dtype=float)
+            span = np.ptp(scores)
+            score = (scores - scores.min()) / span if span > 0 else np.zeros(n)
+
+        scale = self._scale()
+        min_dist = self._min_distances_to_samples(candidates, scale)
+        available = np.ones(n, dtype=bool)
+        chosen = []
+        for _ in range(q):
+            finite = np.isfinite(min_dist) & available
+            d_max = min_dist[finite].max() if finite.any() else 0.0
+            spread = np.where(np.isfinite(min_dist), min_dist / d_max if d_max > 0 else 0.0, 1.0)
+            utility = (1.0 - diversity_weight) * score + diversity_weight * spread
+            utility[~available] = -np.inf
+            best = int(np.argmax(utility))
+            chosen.append(best)
+            available[best] = False
+            pick = candidates[best].copy()
+            self.samples.append(pick)
+            np.minimum(min_dist, self._distances_to_point(candidates, pick, scale), out=min_dist)
+        chosen = np.array(chosen, dtype=int)
+        return candidates[chosen], chosen
+
+    def pairwise_distances(self):
+        """Condensed bounds-normalized distance matrix of the current samples."""
+        return normalized_pdist(self.samples, self.bounds)
+
+    def get_distance_stats(self, block_size=None):
+        """Min/mean/max pairwise distance; block_size bounds memory for large sample sets."""
+        return pairwise_distance_stats(self.samples, self.bounds, block_size=block_size)
+
+    def get_diversity_score(self, block_size=None):
         """Calculate diversity score (average pairwise distance)."""
         if len(self.samples) < 2:
             return 0.0
-        
-        total_dist = 0
-        count = 0
-        for i in range(len(self.samples)):
-            for j in range(i + 1, len(self.samples)):
-                total_dist += self._distance(self.samples[i], self.samples[j])
-                count += 1
-        
-        return total_dist / count if count > 0 else 0.0
+        return self.get_distance_stats(block_size)['mean']
     
     def visualize_mds(self, output_path="output/maxmin_mds_projection.png", 
                       compare_random=True, param_names=None):
@@ -109,23 +230,21 @@ class MaxMinDiversification:
         
         # Generate random samples for comparison
         if compare_random:
-            random_samples = np.array([
-                [np.random.uniform(lo, hi) for lo, hi in self.bounds]
-                for _ in range(len(self.samples))
-            ])
+            random_samples = self._random_points(len(self.samples))
             all_samples = np.vstack([maxmin_samples, random_samples])
             labels = ['MaxMin'] * len(maxmin_samples) + ['Random'] * len(random_samples)
         else:
             all_samples = maxmin_samples
             labels = ['MaxMin'] * len(maxmin_samples)
         
-        # Normalize data
-        scaler = StandardScaler()
-        all_samples_normalized = scaler.fit_transform(all_samples)
+        # One bounds-normalized distance matrix feeds MDS, the heatmap and the score
+        full_distances = squareform(normalized_pdist(all_samples, self.bounds))
+        n_maxmin = len(maxmin_samples)
+        distance_matrix = full_distances[:n_maxmin, :n_maxmin]
         
         # Apply MDS
-        mds = MDS(n_components=2, random_state=42, dissimilarity='euclidean')
-        samples_2d = mds.fit_transform(all_samples_normalized)
+        mds = MDS(n_components=2, random_state=42, dissimilarity='precomputed')
+        samples_2d = mds.fit_transform(full_distances)
         
         # Create figure with subplots
         fig = plt.figure(figsize=(14, 6))
@@ -162,11 +281,6 @@ class MaxMinDiversification:
         
         # Plot 2: Distance matrix heatmap
         ax2 = plt.subplot(1, 2, 2)
-        distance_matrix = np.zeros((len(maxmin_samples), len(maxmin_samples)))
-        for i in range(len(maxmin_samples)):
-            for j in range(len(maxmin_samples)):
-                distance_matrix[i, j] = self._distance(maxmin_samples[i], maxmin_samples[j])
-        
         im = ax2.imshow(distance_matrix, cmap='YlOrRd', aspect='auto')
         ax2.set_xlabel('Sample Index', fontsize=11)
         ax2.set_ylabel('Sample Index', fontsize=11)
@@ -174,7 +288,7 @@ class MaxMinDiversification:
         plt.colorbar(im, ax=ax2, label='Normalized Distance')
         
         # Add diversity score
-        diversity_score = self.get_diversity_score()
+        diversity_score = distance_matrix[np.triu_indices(n_maxmin, k=1)].mean()
         fig.text(0.5, 0.02, f'Diversity Score: {diversity_score:.4f}', 
                 ha='center', fontsize=11, fontweight='bold')
         
@@ -189,92 +303,149 @@ class MaxMinDiversification:
 class ChemicalRecipeMaxMin:
     """
     Specialized Max-Min for chemical recipes with categorical and continuous parameters.
+
+    Recipes are stored as two matrices: a float matrix of continuous parameters
+    and an integer matrix of categorical codes (index into each choice list).
+    Dict recipes are only built at the edges (generate_diverse_recipes return
+    value, recipes, export_recipes_to_dict_list). `recipes` is a read-only
+    tuple; seed recipes are given as initial_recipes, assigned to `recipes`
+    as a whole or added with add_recipes().
     """
     
-    def __init__(self, continuous_bounds, categorical_choices=None, num_samples=10):
+    categorical_weight = 0.5
+
+    def __init__(self, continuous_bounds, categorical_choices=None, num_samples=10, seed=None,
+                 initial_recipes=None):
         """
         Args:
             continuous_bounds: list of (min, max) for continuous params (e.g., temperature, concentration)
             categorical_choices: dict of {param_name: [choice1, choice2, ...]} for discrete choices
             num_samples: number of diverse recipes to generate
+            seed: int, SeedSequence or np.random.Generator for reproducible sampling
+            initial_recipes: optional list of dict recipes kept as the first selections
         """
         self.continuous_bounds = continuous_bounds
         self.categorical_choices = categorical_choices or {}
         self.num_samples = num_samples
-        self.recipes = []
-    
+        self.rng = make_rng(seed)
+        self.categorical_keys = list(self.categorical_choices)
+        self._codes = {key: {choice: i for i, choice in enumerate(choices)}
+                       for key, choices in self.categorical_choices.items()}
+        self._scale = bounds_scale(continuous_bounds)
+        self.continuous = np.empty((0, len(continuous_bounds)))
+        self.categorical = np.empty((0, len(self.categorical_keys)), dtype=np.int64)
+        if initial_recipes:
+            self.recipes = initial_recipes
+
+    def encode(self, recipe):
+        """Dict recipe -> (continuous row, categorical code row)."""
+        cont = np.asarray(recipe['continuous'], dtype=float)
+        cat = np.array([self._codes[key][recipe['categorical'][key]] for key in self.categorical_keys],
+                       dtype=np.int64)
+        return cont, cat
+
+    def decode(self, cont, cat):
+        """(continuous row, categorical code row) -> dict recipe."""
+        return {
+            'continuous': np.array(cont, dtype=float),
+            'categorical': {key: self.categorical_choices[key][code]
+                            for key, code in zip(self.categorical_keys, cat)}
+        }
+
+    @property
+    def recipes(self):
+        """Recipes as a tuple of dicts with 'continuous' and 'categorical' keys."""
+        return tuple(self.decode(c, k) for c, k in zip(self.continuous, self.categorical))
+
+    @recipes.setter
+    def recipes(self, recipes):
+        encoded = [self.encode(r) for r in recipes]
+        n = len(encoded)
+        self.continuous = np.array([c for c, _ in encoded], dtype=float).reshape(n, len(self.continuous_bounds))
+        self.categorical = np.array([k for _, k in encoded], dtype=np.int64).reshape(n, len(self.categorical_keys))
+
+    def add_recipes(self, recipes):
+        """Append dict recipes to the current selection."""
+        self.recipes = self.recipes + tuple(recipes)
+
+    def mixed_distances(self, cont, cat, ref_cont, ref_cat):
+        """
+        Gower-style distance matrix between two recipe sets, shape (len(cont), len(ref_cont)).
+        Bounds-normalized Euclidean distance on continuous parameters plus
+        categorical_weight per mismatching categorical parameter.
+        """
+        d = cdist(cont * self._scale, ref_cont * self._scale)
+        if cat.shape[1]:
+            d += self.categorical_weight * (cat[:, None, :] != ref_cat[None, :, :]).sum(axis=2)
+        return d
+
     def _distance(self, recipe1, recipe2):
         """Distance between two recipes (continuous + categorical)."""
-        # Continuous parameters distance
-        cont_dist = 0
-        for i, (val1, val2) in enumerate(zip(recipe1['continuous'], recipe2['continuous'])):
-            lo, hi = self.continuous_bounds[i]
-            range_val = hi - lo
-            if range_val > 0:
-                cont_dist += ((val1 - val2) / range_val) ** 2
-        cont_dist = math.sqrt(cont_dist)
-        
-        # Categorical parameters distance (0 if same, 1 if different)
-        cat_dist = 0
-        for key in recipe1['categorical']:
-            if recipe1['categorical'][key] != recipe2['categorical'][key]:
-                cat_dist += 1
-        
-        # Combined distance (weighted)
-        total_dist = cont_dist + 0.5 * cat_dist
-        return total_dist
-    
+        c1, k1 = self.encode(recipe1)
+        c2, k2 = self.encode(recipe2)
+        return float(self.mixed_distances(c1[None, :], k1[None, :], c2[None, :], k2[None, :])[0, 0])
+
+    def _random_encoded(self, n):
+        """Draw n random recipes in encoded form with one batched draw per parameter group."""
+        lower = np.array([lo for lo, _ in self.continuous_bounds], dtype=float)
+        upper = np.array([hi for _, hi in self.continuous_bounds], dtype=float)
+        cont = self.rng.uniform(lower, upper, size=(n, len(self.continuous_bounds)))
+        sizes = np.array([len(self.categorical_choices[key]) for key in self.categorical_keys], dtype=np.int64)
+        cat = self.rng.integers(0, sizes, size=(n, len(sizes))) if len(sizes) else \
+            np.empty((n, 0), dtype=np.int64)
+        return cont, cat
+
     def _min_distance_to_recipes(self, candidate):
         """Find minimum distance from candidate to existing recipes."""
-        if len(self.recipes) == 0:
+        if len(self.continuous) == 0:
             return float('inf')
-        return min(self._distance(candidate, r) for r in self.recipes)
+        cont, cat = self.encode(candidate)
+        return float(self.mixed_distances(cont[None, :], cat[None, :], self.continuous, self.categorical).min())
     
     def generate_diverse_recipes(self, candidates_per_iteration=50):
         """
         Generate diverse chemical recipes.
+        Each iteration draws an encoded candidate batch and scores it against
+        all selected recipes with one mixed-distance matrix.
         
         Returns:
             list of dicts with 'continuous' and 'categorical' keys
         """
+        n_have = len(self.continuous)
+        total = max(self.num_samples, n_have, 1)
+        cont = np.empty((total, self.continuous.shape[1]))
+        cat = np.empty((total, self.categorical.shape[1]), dtype=np.int64)
+        cont[:n_have] = self.continuous
+        cat[:n_have] = self.categorical
+
         # Start with a random recipe
-        if len(self.recipes) == 0:
-            initial = {
-                'continuous': np.array([np.random.uniform(lo, hi) 
-                                       for lo, hi in self.continuous_bounds]),
-                'categorical': {key: np.random.choice(choices) 
-                               for key, choices in self.categorical_choices.items()}
-            }
-            self.recipes.append(initial)
+        if n_have == 0:
+            c0, k0 = self._random_encoded(1)
+            cont[0], cat[0] = c0[0], k0[0]
+            n_have = 1
         
         # Iteratively add diverse recipes
-        while len(self.recipes) < self.num_samples:
-            candidates = []
-            for _ in range(candidates_per_iteration):
-                candidate = {
-                    'continuous': np.array([np.random.uniform(lo, hi) 
-                                           for lo, hi in self.continuous_bounds]),
-                    'categorical': {key: np.random.choice(choices) 
-                                   for key, choices in self.categorical_choices.items()}
-                }
-                min_dist = self._min_distance_to_recipes(candidate)
-                candidates.append((min_dist, candidate))
-            
-            best_candidate = max(candidates, key=lambda x: x[0])
-            self.recipes.append(best_candidate[1])
-        
-        return self.recipes
+        while n_have < total:
+            cand_cont, cand_cat = self._random_encoded(candidates_per_iteration)
+            min_dist = self.mixed_distances(cand_cont, cand_cat, cont[:n_have], cat[:n_have]).min(axis=1)
+            best = int(np.argmax(min_dist))
+            cont[n_have], cat[n_have] = cand_cont[best], cand_cat[best]
+            n_have += 1
+
+        self.continuous, self.categorical = cont, cat
+        return list(self.recipes)
     
     def export_recipes_to_dict_list(self):
         """Export recipes as list of combined parameter dicts."""
         result = []
-        for recipe in self.recipes:
+        for cont, cat in zip(self.continuous, self.categorical):
             combined = {}
             # Add continuous parameters with names
-            for i, val in enumerate(recipe['continuous']):
+            for i, val in enumerate(cont):
                 combined[f'param_{i}'] = val
             # Add categorical parameters
-            combined.update(recipe['categorical'])
+            for key, code in zip(self.categorical_keys, cat):
+                combined[key] = self.categorical_choices[key][code]
             result.append(combined)
         return result
     
@@ -283,12 +454,12 @@ class ChemicalRecipeMaxMin:
         import os
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        if len(self.recipes) < 2:
+        if len(self.continuous) < 2:
             print("Need at least 2 recipes for MDS visualization")
             return None
         
         # Extract continuous parameters
-        continuous_data = np.array([r['continuous'] for r in self.recipes])
+        continuous_data = self.continuous
         
         # Normalize
         scaler = StandardScaler()
@@ -4,9 +4,15 @@ import math
 from interface import UserInterface
 from optimizers.genetic_algorithm import GeneticAlgorithm
 from optimizers.differential_evolution import DifferentialEvolution
+from optimizers.termination import StallGenerations
 from objectives import list_objectives, get_objective
 from plotting import plot_history, plot_scherrer_fit
-from problems.sample_problem import evaluate_solution, get_problem_bounds, plot_fit_comparison
+from problems.sample_problem import (
+    DEFAULT_PROBLEM_SEED,
+    ScherrerFitProblem,
+    get_problem_bounds,
+    plot_fit_comparison,
+)
 
 def _prepare_kwargs(cls, params):
     """Return kwargs matching cls.__init__ parameter names."""
@@ -29,6 +35,26 @@ def _prepare_kwargs(cls, params):
                     break
     return out
 
+def stall_termination(population_size, steady_state=False):
+    """
+    Stop once the best MSE has not moved for 30 population turnovers instead
+    of always running the full generation budget. A steady-state generation
+    replaces only two individuals, so its window is scaled to match.
+    """
+    window = 30 * max(1, population_size // 2) if steady_state else 30
+    return [StallGenerations(window, tol=1e-9)]
+
+def build_ga(params):
+    """GeneticAlgorithm and termination for menu option 1, with the CLI defaults."""
+    ga_params = {
+        'population_size': params.get('population_size', 50),
+        'mutation_rate': params.get('mutation_rate', 0.02),
+        'crossover_rate': params.get('crossover_rate', 0.7),
+        'max_generations': params.get('max_generations', 150)
+    }
+    ga = GeneticAlgorithm(**_prepare_kwargs(GeneticAlgorithm, ga_params))
+    return ga, stall_termination(ga.population_size, steady_state=ga.mode == 'steady_state')
+
 def main():
     ui = UserInterface() #this will chance when we have a better interface problably using javascript
     
@@ -36,8 +62,10 @@ def main():
     print("\nThis example will fit synthetic XRD data using the Scherrer equation.")
     print("The GA will optimize parameters K, λ, and B to minimize prediction error.\n")
     
-    # Use sample problem (Scherrer fitting)
-    fitness_fn = evaluate_solution
+    # Use sample problem (Scherrer fitting); the problem object is a batched
+    # objective and carries its own dataset, seeded so every run fits the same data
+    problem = ScherrerFitProblem.synthetic(seed=DEFAULT_PROBLEM_SEED)
+    fitness_fn = problem
     bounds = get_problem_bounds()
     minimize = True  # We're minimizing MSE
     
@@ -46,16 +74,8 @@ def main():
     
     try:
         if choice == '1':
-            params = ui.get_algorithm_params('1')
-            ga_params = {
-                'population_size': params.get('population_size', 50),
-                'mutation_rate': params.get('mutation_rate', 0.02),
-                'crossover_rate': params.get('crossover_rate', 0.7),
-                'max_generations': params.get('max_generations', 150)
-            }
-            ga_kwargs = _prepare_kwargs(GeneticAlgorithm, ga_params)
-            ga = GeneticAlgorithm(**ga_kwargs)
-            result = ga.run(fitness_fn, bounds, minimize=minimize)
+            ga, termination = build_ga(ui.get_algorithm_params('1'))
+            result = ga.run(fitness_fn, bounds, minimize=minimize, termination=termination)
             
         elif choice == '2':
             params = ui.get_algorithm_params('2')
@@ -67,7 +87,8 @@ def main():
             }
             de_kwargs = _prepare_kwargs(DifferentialEvolution, de_params)
             de = DifferentialEvolution(**de_kwargs)
-            result = de.run(fitness_fn, bounds, minimize=minimize)
+            termination = stall_termination(de.population_size)
+            result = de.run(fitness_fn, bounds, minimize=minimize, termination=termination)
             
         elif choice == '3':
             print("Exiting.")
@@ -85,13 +106,15 @@ def main():
         print(f"  λ (wavelength):   {best[1]:.4f} Å")
         print(f"  B (FWHM):         {best[2]:.6f} radians")
         print(f"\nMean Squared Error: {best_mse:.6f}")
+        print(f"Stopped after {len(result['history'])} generations ({result['stop_reason']}), "
+              f"{result['n_evaluations']} evaluations")
         
         # Plot optimization progress
         progress_path = plot_history(result['history'], maximize=False)
         print(f"\nProgress plot saved: {progress_path}")
         
         # Plot Scherrer fit comparison
-        fit_path = plot_fit_comparison(best)
+        fit_path = plot_fit_comparison(best, problem)
         print(f"Fit comparison plot saved: {fit_path}")
         
     except Exception as e:
@@ -0,0 +1,145 @@
+import time
+import numpy as np
+
+"structure-of-arrays export of fitted sklearn regression forests with vectorized traversal"
+
+
+class FlatForest:
+    """
+    All trees of a fitted forest stored in shared contiguous buffers.
+
+    Node i (global index across trees) tests X[:, feature[i]] <= threshold[i]
+    and moves to left[i] or right[i]; leaves point to themselves. Traversal
+    advances every unfinished (sample, tree) pair one level per step with a
+    handful of array gathers, so there is no per-tree Python loop. Prediction
+    is the mean of the leaf values, exactly as RandomForestRegressor.predict.
+
+    Build with FlatForest.from_sklearn(rf).
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, max_depth, n_features):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.n_features = n_features
+        self.is_leaf = left == np.arange(len(left))
+        # (n_nodes, 2) so the next node is a single gather: children[node, went_right]
+        self.children = np.ascontiguousarray(np.stack([left, right], axis=1))
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """Export a fitted RandomForestRegressor / ExtraTreesRegressor (or a single tree)."""
+        estimators = getattr(model, 'estimators_', [model])
+        trees = [est.tree_ for est in estimators]
+        if any(t.n_outputs != 1 for t in trees):
+            raise ValueError("FlatForest supports single-output regressors only")
+        sizes = np.array([t.node_count for t in trees])
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        n_nodes = int(sizes.sum())
+
+        feature = np.empty(n_nodes, dtype=np.intp)
+        threshold = np.empty(n_nodes, dtype=np.float64)
+        left = np.empty(n_nodes, dtype=np.intp)
+        right = np.empty(n_nodes, dtype=np.intp)
+        value = np.empty(n_nodes, dtype=np.float64)
+        for t, off, size in zip(trees, offsets, sizes):
+            sl = slice(off, off + size)
+            own = np.arange(off, off + size)
+            is_leaf = t.children_left == -1
+            feature[sl] = np.where(is_leaf, 0, t.feature)
+            threshold[sl] = np.where(is_leaf, 0.0, t.threshold)
+            left[sl] = np.where(is_leaf, own, t.children_left + off)
+            right[sl] = np.where(is_leaf, own, t.children_right + off)
+            value[sl] = t.value[:, 0, 0]
+        return cls(feature, threshold, left, right, value, offsets.astype(np.intp),
+                   max(t.max_depth for t in trees), estimators[0].n_features_in_)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def apply(self, X, max_block=1 << 20):
+        """
+        (n_samples, n_trees) global leaf index reached by every sample in every tree.
+        Rows are processed in blocks so a block holds at most max_block pairs.
+        """
+        X = self._as_float32(X)
+        n = len(X)
+        out = np.empty((n, self.n_trees), dtype=np.intp)
+        rows_per_block = max(1, max_block // self.n_trees)
+        for start in range(0, n, rows_per_block):
+            block = X[start:start + rows_per_block]
+            # one entry per (sample, tree) pair
+            nodes = np.tile(self.roots, len(block))
+            base = np.repeat(np.arange(len(block)) * self.n_features, self.n_trees)
+            self._walk(block.ravel(), base, nodes)
+            out[start:start + len(block)] = nodes.reshape(len(block), self.n_trees)
+        return out
+
+    def _walk(self, flat_X, base, nodes):
+        """Advance nodes in place until every pair sits on a leaf; pairs that arrive drop out."""
+        active = np.flatnonzero(~self.is_leaf[nodes])
+        while len(active):
+            cur = nodes[active]
+            go_right = flat_X[base[active] + self.feature[cur]] > self.threshold[cur]
+            nxt = self.children[cur, go_right.view(np.int8)]
+            nodes[active] = nxt
+            active = active[~self.is_leaf[nxt]]
+        return nodes
+
+    def _as_float32(self, X):
+        # sklearn compares float32 inputs against float64 thresholds; do the same
+        X = np.ascontiguousarray(np.atleast_2d(X), dtype=np.float32)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"X has {X.shape[1]} features, forest expects {self.n_features}")
+        return X
+
+    def predict_pairs(self, X, rows, trees):
+        """
+        Prediction of tree trees[k] for sample X[rows[k]], for selected pairs only
+        (e.g. the out-of-bag samples of every tree).
+        """
+        X = self._as_float32(X)
+        nodes = self.roots[trees].copy()
+        self._walk(X.ravel(), np.asarray(rows) * self.n_features, nodes)
+        return self.value[nodes]
+
+    def predict_per_tree(self, X):
+        """(n_samples, n_trees) prediction of every individual tree."""
+        return self.value[self.apply(X)]
+
+    def predict(self, X):
+        """Mean prediction over all trees, matching RandomForestRegressor.predict."""
+        return self.predict_per_tree(X).mean(axis=1)
+
+
+def benchmark_against_sklearn(model, X, repeats=5):
+    """
+    Time FlatForest.predict against model.predict on X (best of `repeats`)
+    and report the largest absolute difference between the two.
+    """
+    flat = FlatForest.from_sklearn(model)
+
+    def best_time(fn):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            out = fn(X)
+            times.append(time.perf_counter() - start)
+        return min(times), out
+
+    sk_time, sk_pred = best_time(model.predict)
+    flat_time, flat_pred = best_time(flat.predict)
+    return {
+        'n_samples': len(X),
+        'n_trees': flat.n_trees,
+        'n_nodes': len(flat.value),
+        'sklearn_s': sk_time,
+        'flat_s': flat_time,
+        'speedup': sk_time / flat_time if flat_time > 0 else float('inf'),
+        'max_abs_diff': float(np.max(np.abs(sk_pred - flat_pred))),
+    }
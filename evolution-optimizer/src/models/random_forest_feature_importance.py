@@ -1,5 +1,9 @@
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from sklearn.ensemble import RandomForestRegressor
+from .flat_forest import FlatForest
 
 def train_rf(X, y, n_estimators=400, random_state=42):
     rf = RandomForestRegressor(
@@ -13,21 +17,126 @@ def train_rf(X, y, n_estimators=400, random_state=42):
     baseline_oob_error = 1.0 - rf.oob_score_
     return rf, baseline_oob_error
 
-def permutation_importance_oob(rf, X, y, baseline_oob_error, n_repeats=1, random_state=42):
-    rng = np.random.default_rng(random_state)
-    importances = []
-    for col in range(X.shape[1]):
-        delta_errors = []
-        for _ in range(n_repeats):
-            X_permuted = X.copy()
-            rng.shuffle(X_permuted[:, col])
-            # Recompute OOB predictions
-            # Sklearn RF doesn't recompute OOB after fitting; we approximate via held-out trees:
-            # Simple workaround: use rf.predict and compute MSE vs y (not pure OOB, acceptable approximation).
-            y_pred = rf.predict(X_permuted)
-            mse = np.mean((y - y_pred)**2)
-            delta_errors.append(mse - baseline_oob_error)
-        importances.append(np.mean(delta_errors))
-    importances = np.array(importances)
+
+def update_rf(rf, X, y, n_new_trees=50, max_trees=None, random_state=None):
+    """
+    Grow a fitted forest with n_new_trees trees trained on the current (X, y)
+    instead of refitting every tree. With warm_start, sklearn fits only the
+    added estimators, so the cost of an update scales with n_new_trees rather
+    than with the size of the forest.
+
+    max_trees caps the forest: the oldest trees, fitted on the least data,
+    are dropped first so prediction cost stays bounded. Pass a fresh
+    random_state per update when trimming, otherwise sklearn re-derives the
+    new trees' seeds from the shortened forest and can repeat earlier ones.
+
+    Out-of-bag figures do not survive an update: sklearn regenerates every
+    old tree's bootstrap for the new number of rows, so their "OOB" sets
+    would include rows they were trained on. The update therefore skips OOB
+    scoring, drops oob_score_/oob_prediction_, returns None as the baseline
+    error and marks the forest so permutation_importance_oob refuses it.
+    """
+    rf.set_params(warm_start=True, oob_score=False, n_estimators=len(rf.estimators_) + n_new_trees)
+    if random_state is not None:
+        rf.set_params(random_state=random_state)
+    rf.fit(X, y)
+    if max_trees is not None and len(rf.estimators_) > max_trees:
+        rf.estimators_ = rf.estimators_[-max_trees:]
+        rf.n_estimators = max_trees
+    for attr in ('oob_score_', 'oob_prediction_'):
+        if hasattr(rf, attr):
+            delattr(rf, attr)
+    rf.oob_stale_ = True
+    return rf, None
+
+
+def oob_pairs(rf, n_samples):
+    """
+    (rows, trees) index arrays listing every out-of-bag (sample, tree) pair,
+    taken as the complement of each tree's in-bag rows in rf.estimators_samples_.
+    n_samples must be the number of rows the forest was fitted on.
+    """
+    if not getattr(rf, 'bootstrap', False):
+        raise ValueError("out-of-bag importance needs a forest fitted with bootstrap=True")
+    if getattr(rf, 'oob_stale_', False):
+        raise ValueError("out-of-bag sets are not valid after update_rf; refit the forest with train_rf")
+    rows, trees = [], []
+    for t, in_bag in enumerate(rf.estimators_samples_):
+        oob = np.ones(n_samples, dtype=bool)
+        oob[in_bag] = False
+        unsampled = np.flatnonzero(oob)
+        rows.append(unsampled)
+        trees.append(np.full(len(unsampled), t, dtype=np.intp))
+    return np.concatenate(rows), np.concatenate(trees)
+
+
+def _oob_mse(flat, X32, y, rows, trees, counts, covered):
+    """MSE of the OOB prediction (mean over the trees that did not see each sample)."""
+    per_pair = flat.predict_pairs(X32, rows, trees)
+    pred = np.bincount(rows, weights=per_pair, minlength=len(y))[covered] / counts[covered]
+    return np.mean((y[covered] - pred) ** 2)
+
+
+def permutation_importance_oob(rf, X, y, baseline_oob_error=None, n_repeats=1, random_state=42, n_jobs=None):
+    """
+    Permutation importance measured on true out-of-bag predictions.
+
+    Every tree is scored only on the samples left out of its bootstrap; the
+    importance of a feature is the increase of that OOB mean squared error
+    when the feature column is shuffled, averaged over n_repeats.
+
+    (feature, repeat) pairs run on a thread pool of n_jobs workers; each worker
+    shuffles one column of its own float32 copy of X in place and restores it
+    afterwards. Every pair gets its own SeedSequence child, so results do not
+    depend on n_jobs.
+
+    baseline_oob_error is deprecated and ignored (passing it emits a
+    DeprecationWarning); the baseline is the unpermuted OOB MSE computed here,
+    in the same units as the permuted one.
+
+    Returns:
+        (importances, ranking) with ranking sorted from most to least important.
+    """
+    if baseline_oob_error is not None:
+        warnings.warn("baseline_oob_error is ignored and will be removed; the OOB baseline is computed internally",
+                      DeprecationWarning, stacklevel=2)
+    X = np.asarray(X)
+    y = np.asarray(y, dtype=float)
+    n_samples, n_features = X.shape
+    flat = FlatForest.from_sklearn(rf)
+    rows, trees = oob_pairs(rf, n_samples)
+    counts = np.bincount(rows, minlength=n_samples).astype(float)
+    covered = counts > 0
+
+    base_X = np.ascontiguousarray(X, dtype=np.float32)
+    baseline = _oob_mse(flat, base_X, y, rows, trees, counts, covered)
+
+    tasks = [(col, rep) for col in range(n_features) for rep in range(n_repeats)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(tasks))
+    n_workers = max(1, min(n_jobs or os.cpu_count() or 1, len(tasks)))
+
+    def work(task_ids):
+        buf = base_X.copy()  # one reusable buffer per worker
+        out = []
+        for i in task_ids:
+            col = tasks[i][0]
+            saved = buf[:, col].copy()
+            buf[:, col] = saved[np.random.default_rng(seeds[i]).permutation(n_samples)]
+            out.append((i, _oob_mse(flat, buf, y, rows, trees, counts, covered) - baseline))
+            buf[:, col] = saved
+        return out
+
+    deltas = np.empty(len(tasks))
+    groups = np.array_split(np.arange(len(tasks)), n_workers)
+    if n_workers == 1:
+        results = [work(groups[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(work, groups))
+    for part in results:
+        for i, delta in part:
+            deltas[i] = delta
+
+    importances = deltas.reshape(n_features, n_repeats).mean(axis=1)
     ranking = np.argsort(importances)[::-1]
-    return importances, ranking
\ No newline at end of file
+    return importances, ranking
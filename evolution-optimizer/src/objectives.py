@@ -1,5 +1,7 @@
 import math
+import numpy as np
 from diversification import MaxMinDiversification
+from optimizers.evaluation import batched_objective
 
 "funtions that are defined as objectives for optimization"
 
@@ -41,6 +43,40 @@ def rosenbrock(x):
     """Rosenbrock function (minimize)."""
     return sum(100.0 * (x[i+1] - x[i]**2)**2 + (x[i] - 1)**2 for i in range(len(x)-1))
 
+# Vectorized versions: X is a (N, dims) population, result is a length-N vector.
+# They return the same values as the scalar functions above.
+
+@batched_objective
+def scherrer_from_matrix(X):
+    """Scherrer equation for a whole population, inf where B <= 0 or cos(theta) ~ 0."""
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    K, lambda_, B, theta = X[:, 0], X[:, 1], X[:, 2], X[:, 3]
+    cos_t = np.cos(theta)
+    invalid = (B <= 0) | (np.abs(cos_t) < 1e-12)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        D = (K * lambda_) / (B * cos_t)
+    return np.where(invalid, np.inf, D)
+
+@batched_objective
+def sphere_batch(X):
+    """Sphere function for a whole population."""
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    return np.einsum('ij,ij->i', X, X)
+
+@batched_objective
+def rastrigin_batch(X):
+    """Rastrigin function for a whole population."""
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    A = 10
+    return A * X.shape[1] + np.sum(X * X - A * np.cos(2 * np.pi * X), axis=1)
+
+@batched_objective
+def rosenbrock_batch(X):
+    """Rosenbrock function for a whole population."""
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    head, tail = X[:, :-1], X[:, 1:]
+    return np.sum(100.0 * (tail - head ** 2) ** 2 + (head - 1) ** 2, axis=1)
+
 # Registry of available objectives
 OBJECTIVES = {
     
@@ -49,6 +85,7 @@ OBJECTIVES = {
     '1': {
         'name': 'Scherrer equation (crystallite size)',
         'func': scherrer_from_vector,
+        'batch_func': scherrer_from_matrix,
         'bounds': [
             (0.5, 1.0),       # K (shape factor)
             (0.5, 2.0),       # lambda_ (Å)
@@ -64,6 +101,7 @@ OBJECTIVES = {
     '2': {
         'name': 'Sphere function (3D)',
         'func': sphere,
+        'batch_func': sphere_batch,
         'bounds': [(-5.0, 5.0)] * 3,
         'dims': 3,
         'minimize': True,
@@ -73,6 +111,7 @@ OBJECTIVES = {
     '3': {
         'name': 'Rastrigin (3D)',
         'func': rastrigin,
+        'batch_func': rastrigin_batch,
         'bounds': [(-5.12, 5.12)] * 3,
         'dims': 3,
         'minimize': True,
@@ -82,6 +121,7 @@ OBJECTIVES = {
     '4': {
         'name': 'Rosenbrock (3D)',
         'func': rosenbrock,
+        'batch_func': rosenbrock_batch,
         'bounds': [(-2.0, 2.0)] * 3,
         'dims': 3,
         'minimize': True,
@@ -96,7 +136,7 @@ def list_objectives():
 def get_objective(key):
     return OBJECTIVES.get(key)
 
-def generate_diverse_initial_population(objective_key, num_samples=20):
+def generate_diverse_initial_population(objective_key, num_samples=20, seed=None):
     
     """Generate diverse initial population using MaxMin for given objective."""
     
@@ -104,7 +144,7 @@ def generate_diverse_initial_population(objective_key, num_samples=20):
     if obj is None or not obj.get('use_maxmin', False):
         return None
     
-    diversifier = MaxMinDiversification(obj['bounds'], num_samples=num_samples)
+    diversifier = MaxMinDiversification(obj['bounds'], num_samples=num_samples, seed=seed)
     diverse_samples = diversifier.generate_diverse_samples(candidates_per_iteration=100)
     
     # Create MDS visualization
@@ -0,0 +1,82 @@
+import numpy as np
+from scipy.special import ndtr
+
+"acquisition functions scored from the spread of a tree ensemble's per-tree predictions"
+
+
+def per_tree_predictions(model, X):
+    """
+    (n_samples, n_trees) prediction of every tree of an ensemble.
+    Models with predict_per_tree (FlatForest) answer in one vectorized pass;
+    fitted sklearn forests fall back to one call per estimator.
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    if hasattr(model, 'predict_per_tree'):
+        return model.predict_per_tree(X)
+    trees = getattr(model, 'estimators_', None)
+    if trees is None:
+        raise TypeError(f"{type(model).__name__} has no per-tree predictions; pass a forest or a FlatForest")
+    X32 = np.ascontiguousarray(X, dtype=np.float32)
+    return np.column_stack([t.predict(X32, check_input=False) for t in trees])
+
+
+def upper_confidence_bound(mean, std, kappa=2.0):
+    return mean + kappa * std
+
+
+def expected_improvement(mean, std, best, xi=0.01):
+    """Expected improvement over `best` for a gaussian with the given mean/std (maximization)."""
+    improvement = mean - best - xi
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = improvement / std
+        ei = improvement * ndtr(z) + std * np.exp(-0.5 * z ** 2) / np.sqrt(2 * np.pi)
+    return np.where(std > 0, ei, np.maximum(improvement, 0.0))
+
+
+class Acquisition:
+    """
+    Turn a forest into an acquisition surface for HybridGA.
+
+    The mean and standard deviation across trees are computed from one
+    per-tree prediction matrix, then combined as UCB (mean + kappa * std) or
+    expected improvement over best_observed. The wrapper has `predict`, so it
+    can be passed to HybridGA.run or wrapped in a SurrogateEvaluator.
+
+    Args:
+        model: fitted forest or FlatForest
+        kind: 'ucb', 'ei' or 'mean'
+        kappa: UCB exploration weight
+        xi: EI improvement margin
+        best_observed: incumbent value, required for 'ei'
+    """
+    batched = True
+    KINDS = ('ucb', 'ei', 'mean')
+
+    def __init__(self, model, kind='ucb', kappa=2.0, xi=0.01, best_observed=None):
+        if kind not in self.KINDS:
+            raise ValueError(f"unknown acquisition '{kind}', expected one of {self.KINDS}")
+        if kind == 'ei' and best_observed is None:
+            raise ValueError("expected improvement needs best_observed")
+        self.model = model
+        self.kind = kind
+        self.kappa = kappa
+        self.xi = xi
+        self.best_observed = best_observed
+
+    def mean_std(self, X):
+        per_tree = per_tree_predictions(self.model, X)
+        return per_tree.mean(axis=1), per_tree.std(axis=1)
+
+    def predict(self, X):
+        mean, std = self.mean_std(X)
+        if self.kind == 'ucb':
+            return upper_confidence_bound(mean, std, self.kappa)
+        if self.kind == 'ei':
+            return expected_improvement(mean, std, self.best_observed, self.xi)
+        return mean
+
+    def __call__(self, X):
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            return self.predict(X[None, :])[0]
+        return self.predict(X)
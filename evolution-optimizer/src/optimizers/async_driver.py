@@ -0,0 +1,201 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import numpy as np
+from . import evaluation
+from .evaluation import evaluate_population, _init_worker
+from .operators import mutation_mask, one_point_crossover, tournament_select, uniform_reset_mutation
+from .rng import make_rng
+
+"asynchronous steady-state DE/GA driver keeping a fixed number of evaluations in flight"
+
+
+def _timed_call(fitness_fn, x):
+    """Evaluate one individual and report how long the worker spent on it."""
+    if fitness_fn is None:
+        fitness_fn = evaluation._WORKER_OBJECTIVE  # process pool: set once by the initializer
+    start = time.perf_counter()
+    value = evaluate_population(fitness_fn, x[None, :])[0]
+    return value, time.perf_counter() - start
+
+
+class FakeLatencyObjective:
+    """
+    Wrap an objective with a random sleep per call to mimic simulations or
+    experiments of variable duration. Latencies are exponential (or uniform
+    in [0, 2 * mean_latency]) and derived from the evaluated vector and seed,
+    so they are reproducible across threads and processes. Picklable as long
+    as fitness_fn is.
+    """
+
+    def __init__(self, fitness_fn, mean_latency=0.01, distribution='exponential', seed=0):
+        if distribution not in ('exponential', 'uniform'):
+            raise ValueError(f"unknown distribution '{distribution}'")
+        self.fitness_fn = fitness_fn
+        self.mean_latency = mean_latency
+        self.distribution = distribution
+        self.seed = seed
+
+    def latency(self, x):
+        key = np.frombuffer(np.asarray(x, dtype=np.float64).tobytes(), dtype=np.uint32)
+        rng = np.random.default_rng([self.seed, *key.tolist()])
+        if self.distribution == 'exponential':
+            return rng.exponential(self.mean_latency)
+        return rng.uniform(0.0, 2.0 * self.mean_latency)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        time.sleep(self.latency(x))
+        return evaluate_population(self.fitness_fn, x[None, :])[0]
+
+
+class AsyncEvolution:
+    """
+    Steady-state evolution without generational barriers.
+
+    n_workers evaluations are kept in flight at all times. Whenever one
+    returns, its result is inserted into the population immediately and a
+    new candidate is generated from the current population and dispatched.
+
+    strategy='de': rand/1/bin trials for targets taken round-robin; a trial
+    replaces its target if it is better at the time it returns.
+    strategy='ga': tournament parents, one-point crossover and uniform-reset
+    mutation; the child replaces the current worst if it is better.
+
+    Results depend on completion order, so they are only reproducible with
+    n_workers=1.
+
+    Args:
+        strategy: 'de' or 'ga'
+        population_size: individuals kept in the population
+        n_workers: evaluations in flight (W)
+        generations: budget as population_size * generations evaluations after
+            the initial population, unless max_evaluations is given
+        executor: 'thread' or 'process'
+    """
+
+    STRATEGIES = ('de', 'ga')
+
+    def __init__(self, strategy='de', population_size=30, n_workers=4, generations=100,
+                 max_evaluations=None, mutation_factor=0.8, crossover_rate=0.9,
+                 mutation_rate=0.1, executor='thread', seed=None):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"unknown strategy '{strategy}', expected one of {self.STRATEGIES}")
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"unknown executor '{executor}', expected 'thread' or 'process'")
+        if strategy == 'de' and population_size < 4:
+            raise ValueError("rand/1 mutation needs a population of at least 4")
+        self.strategy = strategy
+        self.population_size = population_size
+        self.n_workers = n_workers
+        self.max_evaluations = max_evaluations or population_size * (generations + 1)
+        self.mutation_factor = mutation_factor
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.executor = executor
+        self.rng = make_rng(seed)
+
+    def _de_trial(self, pop, target, lower, upper):
+        n, dim = pop.shape
+        others = self.rng.choice(n - 1, 3, replace=False)
+        r1, r2, r3 = others + (others >= target)
+        mutant = np.clip(pop[r1] + self.mutation_factor * (pop[r2] - pop[r3]), lower, upper)
+        cross = self.rng.random(dim) < self.crossover_rate
+        cross[self.rng.integers(dim)] = True
+        return np.where(cross, mutant, pop[target])
+
+    def _ga_child(self, pop, fitness, minimize, lower, upper):
+        a, b = tournament_select(self.rng, fitness, 2, maximize=not minimize)
+        child = one_point_crossover(self.rng, pop[a:a + 1], pop[b:b + 1], self.crossover_rate)[:1]
+        mask = mutation_mask(self.rng, child.shape, self.mutation_rate)
+        return uniform_reset_mutation(self.rng, child, mask, lower, upper)[0]
+
+    def run(self, fitness_fn, bounds, minimize=True):
+        """
+        Returns:
+            dict with 'best_solution', 'best_value', 'history' (best value
+            after every population_size evaluations), 'n_evaluations' and the
+            wall-clock report 'wall_s', 'busy_s', 'idle_s', 'utilization'.
+        """
+        dim = len(bounds)
+        lower = np.array([lo for lo, _ in bounds], dtype=float)
+        upper = np.array([hi for _, hi in bounds], dtype=float)
+        n = self.population_size
+        pop = self.rng.uniform(lower, upper, size=(n, dim))
+        fitness = np.full(n, np.inf if minimize else -np.inf)
+        better = np.less if minimize else np.greater
+
+        if self.executor == 'process':
+            pool = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_worker,
+                                       initargs=(fitness_fn,))
+            task_fn = None
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.n_workers)
+            task_fn = fitness_fn
+
+        submitted, completed, next_target = 0, 0, 0
+        busy, history = 0.0, []
+        in_flight = {}
+
+        def next_candidate():
+            nonlocal next_target
+            # the initial population is evaluated first, then offspring
+            if submitted < n:
+                return submitted, pop[submitted].copy()
+            if self.strategy == 'de':
+                target = next_target
+                next_target = (next_target + 1) % n
+                return target, self._de_trial(pop, target, lower, upper)
+            return None, self._ga_child(pop, fitness, minimize, lower, upper)
+
+        def dispatch():
+            nonlocal submitted
+            slot, x = next_candidate()
+            in_flight[pool.submit(_timed_call, task_fn, x)] = (slot, x)
+            submitted += 1
+
+        start = time.perf_counter()
+        try:
+            # offspring need a fully evaluated population, so the first wave
+            # is capped at the initial individuals
+            while submitted < min(self.n_workers, n, self.max_evaluations):
+                dispatch()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    slot, x = in_flight.pop(future)
+                    value, elapsed = future.result()
+                    busy += elapsed
+                    completed += 1
+                    if completed <= n:
+                        pop[slot], fitness[slot] = x, value
+                    elif slot is not None:
+                        if better(value, fitness[slot]):
+                            pop[slot], fitness[slot] = x, value
+                    else:
+                        worst = np.argmax(fitness) if minimize else np.argmin(fitness)
+                        if better(value, fitness[worst]):
+                            pop[worst], fitness[worst] = x, value
+                    if completed % n == 0:
+                        history.append(fitness.min() if minimize else fitness.max())
+                # refill; offspring wait until the initial population is complete
+                while (submitted < self.max_evaluations and len(in_flight) < self.n_workers
+                       and (submitted < n or completed >= n)):
+                    dispatch()
+        finally:
+            pool.shutdown()
+        wall = time.perf_counter() - start
+
+        best = int(np.argmin(fitness) if minimize else np.argmax(fitness))
+        capacity = wall * self.n_workers
+        return {
+            'best_solution': pop[best],
+            'best_value': fitness[best],
+            'history': history,
+            'population': pop,
+            'fitness': fitness,
+            'n_evaluations': completed,
+            'wall_s': wall,
+            'busy_s': busy,
+            'idle_s': max(capacity - busy, 0.0),
+            'utilization': busy / capacity if capacity > 0 else 0.0,
+        }
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+import numpy as np
+from .evaluation import evaluate_population
+
+"bounded LRU fitness cache keyed on quantized genomes"
+
+
+def is_fitness_cache(obj):
+    return bool(getattr(obj, 'is_fitness_cache', False))
+
+
+class FitnessCache:
+    """
+    Wrap an objective with a memo of already evaluated genomes.
+    Genomes are rounded to a grid of size `tolerance` before lookup, so
+    vectors closer than that share one entry. At most `maxsize` entries are
+    kept, the least recently used being evicted first.
+
+    The wrapper is itself a batched objective: pass it to an optimizer in
+    place of the original function and the result dict gains 'cache_stats'.
+    """
+    batched = True
+    is_fitness_cache = True
+
+    def __init__(self, fitness_fn, tolerance=1e-9, maxsize=100000):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.fitness_fn = fitness_fn
+        self.tolerance = tolerance
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+    def _keys(self, pop):
+        q = np.round(pop / self.tolerance) if self.tolerance > 0 else pop.copy()
+        q += 0.0  # fold -0.0 into 0.0 so both hash the same
+        return [row.tobytes() for row in q]
+
+    def evaluate(self, pop, evaluator=None):
+        """
+        Return the fitness of every row of pop, evaluating only cache misses.
+        Misses are deduplicated and sent to `evaluator` (or evaluated serially)
+        as one batch.
+        """
+        pop = np.atleast_2d(np.asarray(pop, dtype=float))
+        keys = self._keys(pop)
+        values = np.empty(len(pop))
+        pending = {}
+        for i, key in enumerate(keys):
+            if key in self._store:
+                self._store.move_to_end(key)
+                values[i] = self._store[key]
+                self.hits += 1
+            else:
+                pending.setdefault(key, []).append(i)
+        if pending:
+            first_rows = [rows[0] for rows in pending.values()]
+            if evaluator is None:
+                fresh = evaluate_population(self.fitness_fn, pop[first_rows])
+            else:
+                fresh = evaluator(self.fitness_fn, pop[first_rows])
+            for (key, rows), val in zip(pending.items(), fresh):
+                values[rows] = val
+                self._store[key] = val
+                self.misses += 1
+                # duplicates inside one batch count as hits
+                self.hits += len(rows) - 1
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
+        return values
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            return self.evaluate(x[None, :])[0]
+        return self.evaluate(x)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._store),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self):
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
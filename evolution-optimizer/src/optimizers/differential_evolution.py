@@ -1,9 +1,21 @@
 import numpy as np
+from .evaluation import evaluate_population, SerialEvaluator
+from .cache import is_fitness_cache
+from .rng import make_rng
+from .termination import Termination
+from .instrumentation import Instrumentation
+
 class DifferentialEvolution:
     def __init__(self, population_size=30, mutation_factor=0.8, crossover_rate=0.9,
-                 generations=100, max_generations=None, **kwargs):
+                 generations=100, max_generations=None, vectorized=False, seed=None, **kwargs):
         """
         Accept both 'generations' and 'max_generations' for compatibility.
+        vectorized=True switches run() to synchronous rand/1/bin: the whole
+        trial population is built with array operations and evaluated at once.
+        The default keeps the asynchronous per-individual update, which sends
+        one trial at a time to the evaluator; pool evaluators only pay off
+        with vectorized=True.
+        seed is an int, SeedSequence or np.random.Generator used for every draw.
         """
         self.population_size = population_size
         self.mutation_factor = mutation_factor
@@ -11,16 +23,17 @@ class DifferentialEvolution:
         # prefer explicit generations, fall back to max_generations if provided
         self.generations = int(generations if generations is not None else (max_generations or 100))
         self.max_generations = max_generations
+        self.vectorized = vectorized
+        self.rng = make_rng(seed)
         self.population = []
 
     def initialize_population(self, bounds):
-        import numpy as np
-        self.population = np.random.rand(self.population_size, len(bounds))
+        self.population = self.rng.random((self.population_size, len(bounds)))
         for i in range(len(bounds)):
             self.population[:, i] = self.population[:, i] * (bounds[i][1] - bounds[i][0]) + bounds[i][0]
 
     def evaluate_fitness(self, fitness_function):
-        return [fitness_function(individual) for individual in self.population]
+        return list(evaluate_population(fitness_function, self.population))
 
     def mutate(self, target_idx):
         indices = list(range(self.population_size))
@@ -30,43 +43,143 @@ class DifferentialEvolution:
         return mutant
 
     def crossover(self, target, mutant):
-        crossover_mask = np.random.rand(len(target)) < self.crossover_rate
+        crossover_mask = self.rng.random(len(target)) < self.crossover_rate
         return np.where(crossover_mask, mutant, target)
 
-    def run(self, fitness_fn, bounds, minimize=True):
-        import numpy as np
+    def donor_indices(self, n):
+        """
+        Draw three distinct donor indices per target, all different from the target.
+        Offsets in [1, n-1] are drawn without replacement by skipping the
+        ones already taken, then wrapped around the target index.
+        """
+        if n < 4:
+            raise ValueError("rand/1 mutation needs a population of at least 4")
+        o1 = self.rng.integers(1, n, size=n)
+        o2 = self.rng.integers(1, n - 1, size=n)
+        o2 += o2 >= o1
+        o3 = self.rng.integers(1, n - 2, size=n)
+        o3 += o3 >= np.minimum(o1, o2)
+        o3 += o3 >= np.maximum(o1, o2)
+        target = np.arange(n)
+        return (target + o1) % n, (target + o2) % n, (target + o3) % n
+
+    def mutants(self, pop, donors, lower, upper):
+        """rand/1 mutant vectors for the donor index triple from donor_indices()."""
+        r1, r2, r3 = donors
+        return np.clip(pop[r1] + self.mutation_factor * (pop[r2] - pop[r3]), lower, upper)
+
+    def binomial_crossover(self, pop, mutants):
+        n, dim = pop.shape
+        cross = self.rng.random((n, dim)) < self.crossover_rate
+        # guarantee at least one gene from the mutant
+        cross[np.arange(n), self.rng.integers(0, dim, size=n)] = True
+        return np.where(cross, mutants, pop)
+
+    def generate_trials(self, pop, lower, upper):
+        """Build a full rand/1/bin trial population from pop in one pass."""
+        mutants = self.mutants(pop, self.donor_indices(len(pop)), lower, upper)
+        return self.binomial_crossover(pop, mutants)
+
+    def run(self, fitness_fn, bounds, minimize=True, evaluator=None,
+            initial_population=None, initial_fitness=None, termination=None, instrumentation=None):
+        """
+        initial_population (and optionally its already known initial_fitness)
+        resumes from a given population instead of a random one, e.g. between
+        migrations of the island model. The result includes the final
+        'population' and 'fitness'.
+        termination is one criterion or a list (see optimizers.termination)
+        checked after every generation; the result records 'stop_reason'
+        ('generations' when the full budget ran) and 'n_evaluations'.
+        Phase timings and counters are returned as 'instrumentation' (see
+        optimizers.instrumentation); pass an Instrumentation to add callbacks.
+        """
+        instr = instrumentation or Instrumentation(keep_records=False)
+        instr.start()
         dim = len(bounds)
-        pop = np.array([[np.random.uniform(lo, hi) for lo, hi in bounds]
-                        for _ in range(self.population_size)])
+        lower = np.array([lo for lo, _ in bounds], dtype=float)
+        upper = np.array([hi for _, hi in bounds], dtype=float)
+        if initial_population is not None:
+            pop = np.array(initial_population, dtype=float)
+        else:
+            pop = self.rng.uniform(lower, upper, size=(self.population_size, dim))
+        n = len(pop)
         history = []
+        # serial, thread-pool or process-pool backend (see optimizers.evaluation)
+        evaluator = evaluator or SerialEvaluator()
+        term = Termination(termination)
+        term.start()
+        n_evals = 0
         def eval_pop(p):
-            return np.array([fitness_fn(ind) for ind in p])
-        fitness = eval_pop(pop)
+            nonlocal n_evals
+            n_evals += len(p)
+            # a FitnessCache only sends its misses to the evaluator
+            if is_fitness_cache(fitness_fn):
+                misses = fitness_fn.misses
+                values = fitness_fn.evaluate(p, evaluator)
+                instr.count_evaluations(len(p), fitness_fn.misses - misses)
+                return values
+            instr.count_evaluations(len(p))
+            # whole population in one call when the objective is batched
+            return evaluator(fitness_fn, p)
+        instr.lap('bookkeeping')
+        if initial_population is not None and initial_fitness is not None:
+            fitness = np.array(initial_fitness, dtype=float)
+        else:
+            fitness = eval_pop(pop)
+        instr.lap('evaluation')
         for g in range(self.generations):
-            for i in range(self.population_size):
-                idxs = [idx for idx in range(self.population_size) if idx != i]
-                a, b, c = pop[np.random.choice(idxs, 3, replace=False)]
-                mutant = np.clip(a + self.mutation_factor * (b - c),
-                                 [lo for lo,_ in bounds],
-                                 [hi for _,hi in bounds])
-                trial = pop[i].copy()
-                for j in range(dim):
-                    if np.random.rand() < self.crossover_rate:
-                        trial[j] = mutant[j]
-                trial_fit = fitness_fn(trial)
-                cond = trial_fit < fitness[i] if minimize else trial_fit > fitness[i]
-                if cond:
-                    pop[i] = trial
-                    fitness[i] = trial_fit
+            if self.vectorized:
+                donors = self.donor_indices(n)
+                instr.lap('selection')
+                mutants = self.mutants(pop, donors, lower, upper)
+                instr.lap('mutation')
+                trials = self.binomial_crossover(pop, mutants)
+                instr.lap('crossover')
+                trial_fit = eval_pop(trials)
+                instr.lap('evaluation')
+                improved = trial_fit < fitness if minimize else trial_fit > fitness
+                pop[improved] = trials[improved]
+                fitness[improved] = trial_fit[improved]
+            else:
+                # donors and crossover masks for the whole generation in one draw;
+                # vectors are still read from the live population
+                r1, r2, r3 = self.donor_indices(n)
+                instr.lap('selection')
+                cross = self.rng.random((n, dim)) < self.crossover_rate
+                instr.lap('crossover')
+                for i in range(n):
+                    a, b, c = pop[r1[i]], pop[r2[i]], pop[r3[i]]
+                    mutant = np.clip(a + self.mutation_factor * (b - c), lower, upper)
+                    trial = np.where(cross[i], mutant, pop[i])
+                    instr.lap('mutation')
+                    trial_fit = eval_pop(trial[None, :])[0]
+                    instr.lap('evaluation')
+                    cond = trial_fit < fitness[i] if minimize else trial_fit > fitness[i]
+                    if cond:
+                        pop[i] = trial
+                        fitness[i] = trial_fit
             best_val = fitness.min() if minimize else fitness.max()
             history.append(best_val)
+            stop = term.check(generation=g + 1, best_value=best_val, population=pop, fitness=fitness,
+                              n_evaluations=n_evals, minimize=minimize)
+            instr.end_generation(g + 1, best_val, n_evals)
+            instr.lap('bookkeeping')
+            if stop:
+                break
         best_idx = fitness.argmin() if minimize else fitness.argmax()
-        return {
+        result = {
             'best_solution': pop[best_idx],
             'best_value': fitness[best_idx],
-            'history': history
+            'history': history,
+            'population': pop,
+            'fitness': fitness,
+            'stop_reason': term.reason or 'generations',
+            'n_evaluations': n_evals,
+            'instrumentation': instr.summary(),
         }
+        if is_fitness_cache(fitness_fn):
+            result['cache_stats'] = fitness_fn.stats()
+        return result
 
     def random_sample(self, indices, count):
-        import random
-        return random.sample(indices, count)
\ No newline at end of file
+        return list(self.rng.choice(indices, count, replace=False))
\ No newline at end of file
@@ -0,0 +1,149 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import numpy as np
+
+"helpers for evaluating a whole population with one objective call"
+
+
+def batched_objective(func):
+    """
+    Mark an objective as batched.
+    A batched objective takes a 2-D array (pop, dim) and returns a 1-D
+    array with one fitness value per row.
+    """
+    func.batched = True
+    return func
+
+
+def is_batched(func):
+    """True if the objective declared it accepts a whole population at once."""
+    return bool(getattr(func, 'batched', False))
+
+
+def evaluate_population(fitness_fn, pop):
+    """
+    Evaluate every row of pop and return a 1-D float array.
+    Batched objectives get the full matrix in one call, scalar objectives
+    fall back to one call per individual.
+    """
+    pop = np.atleast_2d(np.asarray(pop, dtype=float))
+    if is_batched(fitness_fn):
+        values = np.asarray(fitness_fn(pop), dtype=float).reshape(-1)
+        if values.shape[0] != pop.shape[0]:
+            raise ValueError(
+                f"batched objective returned {values.shape[0]} values for {pop.shape[0]} individuals"
+            )
+        return values
+    return np.array([fitness_fn(ind) for ind in pop], dtype=float)
+
+
+# Evaluators: pluggable backends that evaluate a population for an optimizer.
+# All of them return values in population order, so results for a fixed seed
+# do not depend on the backend or on the number of workers.
+
+_WORKER_OBJECTIVE = None
+
+
+def _init_worker(fitness_fn):
+    """Process-pool initializer: receive the objective once per worker."""
+    global _WORKER_OBJECTIVE
+    _WORKER_OBJECTIVE = fitness_fn
+
+
+def _evaluate_chunk(chunk):
+    return evaluate_population(_WORKER_OBJECTIVE, chunk)
+
+
+class SerialEvaluator:
+    """Evaluate in the calling thread (the default)."""
+
+    def __call__(self, fitness_fn, pop):
+        return evaluate_population(fitness_fn, pop)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _PoolEvaluator(SerialEvaluator):
+
+    def __init__(self, n_workers=None, chunk_size=None):
+        """
+        Args:
+            n_workers: pool size (None lets concurrent.futures decide)
+            chunk_size: rows per task; default splits the population into
+                about four tasks per worker
+        """
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def _chunks(self, pop):
+        workers = self.n_workers or os.cpu_count() or 1
+        size = self.chunk_size or max(1, -(-len(pop) // (4 * workers)))
+        return [pop[i:i + size] for i in range(0, len(pop), size)]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    """Evaluate chunks on a persistent thread pool (objectives that release the GIL)."""
+
+    def __call__(self, fitness_fn, pop):
+        pop = np.atleast_2d(np.asarray(pop, dtype=float))
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.n_workers)
+        parts = self._pool.map(lambda chunk: evaluate_population(fitness_fn, chunk), self._chunks(pop))
+        return np.concatenate(list(parts))
+
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    """
+    Evaluate chunks on a persistent process pool.
+    The objective (with any data it holds) is pickled once per worker through
+    the pool initializer; tasks only carry the population chunk. The pool is
+    rebuilt if a different objective is passed.
+    """
+
+    def __init__(self, n_workers=None, chunk_size=None):
+        super().__init__(n_workers, chunk_size)
+        self._objective = None
+
+    def __call__(self, fitness_fn, pop):
+        pop = np.atleast_2d(np.asarray(pop, dtype=float))
+        if self._pool is None or self._objective != fitness_fn:
+            self.close()
+            self._pool = ProcessPoolExecutor(max_workers=self.n_workers,
+                                             initializer=_init_worker,
+                                             initargs=(fitness_fn,))
+            self._objective = fitness_fn
+        parts = self._pool.map(_evaluate_chunk, self._chunks(pop))
+        return np.concatenate(list(parts))
+
+    def close(self):
+        super().close()
+        self._objective = None
+
+
+EVALUATORS = {
+    'serial': SerialEvaluator,
+    'thread': ThreadPoolEvaluator,
+    'process': ProcessPoolEvaluator,
+}
+
+
+def get_evaluator(kind='serial', **kwargs):
+    """Build an evaluator by name ('serial', 'thread' or 'process')."""
+    if kind not in EVALUATORS:
+        raise ValueError(f"unknown evaluator '{kind}', expected one of {sorted(EVALUATORS)}")
+    if kind == 'serial':
+        return SerialEvaluator()
+    return EVALUATORS[kind](**kwargs)
@@ -1,24 +1,45 @@
 import numpy as np
+from .evaluation import evaluate_population, SerialEvaluator
+from .cache import is_fitness_cache
+from .operators import tournament_select, one_point_crossover, mutation_mask, uniform_reset_mutation
+from .rng import make_rng
+from .termination import Termination
+from .instrumentation import Instrumentation
+
 class GeneticAlgorithm:
    
-    def __init__(self, population_size, mutation_rate, crossover_rate, generations):
+    def __init__(self, population_size, mutation_rate, crossover_rate, generations,
+                 mode='steady_state', elitism=2, seed=None):
+        """
+        mode='steady_state' (default) replaces two random individuals per
+        generation and only evaluates those two children.
+        mode='generational' rebuilds the whole population each generation by
+        tournament selection, keeping the `elitism` best individuals unchanged.
+        seed is an int, SeedSequence or np.random.Generator; every draw of
+        this optimizer comes from that one stream.
+        """
+        if mode not in ('steady_state', 'generational'):
+            raise ValueError(f"unknown mode '{mode}', expected 'steady_state' or 'generational'")
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.generations = generations
+        self.mode = mode
+        self.elitism = elitism
+        self.rng = make_rng(seed)
         self.population = []
 
     def initialize_population(self, bounds):
         
-        self.population = np.random.uniform(bounds[0], bounds[1], (self.population_size, len(bounds[0])))
+        self.population = self.rng.uniform(bounds[0], bounds[1], (self.population_size, len(bounds[0])))
 
     def evaluate_fitness(self, fitness_function):
-        return [fitness_function(individual) for individual in self.population]
+        return list(evaluate_population(fitness_function, self.population))
 
     def select_parents(self, fitness):
         
         probabilities = fitness / np.sum(fitness)
-        parents_indices = np.random.choice(range(self.population_size), size=2, p=probabilities)
+        parents_indices = self.rng.choice(self.population_size, size=2, p=probabilities)
         return self.population[parents_indices]
 
     def crossover(self, parent1, parent2):
@@ -33,56 +54,161 @@ class GeneticAlgorithm:
                 return parent1, parent2
 
         # choose split point in [1, n-1] safely by using high=n
-        point = np.random.randint(1, n)
+        point = self.rng.integers(1, n)
         child1 = np.concatenate([parent1[:point], parent2[point:]])
         child2 = np.concatenate([parent2[:point], parent1[point:]])
         return child1, child2
 
     def mutate(self, individual):
-        for i in range(len(individual)):
-            if np.random.rand() < self.mutation_rate:
-                individual[i] += np.random.normal()
+        mask = self.rng.random(len(individual)) < self.mutation_rate
+        steps = self.rng.standard_normal(len(individual))
+        for i in np.flatnonzero(mask):
+            individual[i] += steps[i]
         return individual
 
-    def run(self, fitness_fn, bounds, minimize=True):
-        
+    def run(self, fitness_fn, bounds, minimize=True, evaluator=None,
+            initial_population=None, initial_fitness=None, termination=None, instrumentation=None):
+        """
+        initial_population (and optionally its already known initial_fitness)
+        resumes from a given population instead of a random one, e.g. between
+        migrations of the island model. The result includes the final
+        'population' and 'fitness'.
+        termination is one criterion or a list (see optimizers.termination)
+        checked after every generation; the result records 'stop_reason'
+        ('generations' when the full budget ran) and 'n_evaluations'.
+        Phase timings and counters (see optimizers.instrumentation) are always
+        collected and returned as 'instrumentation'; pass an Instrumentation
+        to add per-generation callbacks or export the records.
+        """
+        instr = instrumentation or Instrumentation(keep_records=False)
+        instr.start()
         dim = len(bounds)
-        pop = np.array([np.array([np.random.uniform(lo, hi) for lo, hi in bounds])
-                        for _ in range(self.population_size)])
+        rng = self.rng
+        lower = np.array([lo for lo, _ in bounds], dtype=float)
+        upper = np.array([hi for _, hi in bounds], dtype=float)
+        if initial_population is not None:
+            pop = np.array(initial_population, dtype=float)
+        else:
+            pop = rng.uniform(lower, upper, size=(self.population_size, dim))
         history = []
+        # serial, thread-pool or process-pool backend (see optimizers.evaluation)
+        evaluator = evaluator or SerialEvaluator()
+        term = Termination(termination)
+        term.start()
+        n_evals = 0
         def eval_pop(p):
-            vals = [fitness_fn(ind) for ind in p]
-            return np.array(vals)
-        for g in range(self.generations):
+            nonlocal n_evals
+            n_evals += len(p)
+            # a FitnessCache only sends its misses to the evaluator
+            if is_fitness_cache(fitness_fn):
+                misses = fitness_fn.misses
+                values = fitness_fn.evaluate(p, evaluator)
+                instr.count_evaluations(len(p), fitness_fn.misses - misses)
+                return values
+            instr.count_evaluations(len(p))
+            # whole population in one call when the objective is batched
+            return evaluator(fitness_fn, p)
+        def arg_best(f):
+            return np.argmin(f) if minimize else np.argmax(f)
+        def better(a, b):
+            return a < b if minimize else a > b
+        def should_stop(p, f, best):
+            # end of a generation: check the criteria and record it; callers pass
+            # the best value they already track so no rescan happens here
+            stop = term.check(generation=len(history), best_value=best, population=p,
+                              fitness=f, n_evaluations=n_evals, minimize=minimize)
+            instr.end_generation(len(history), best, n_evals)
+            return stop
+
+        # persistent fitness array, only new individuals are ever evaluated
+        instr.lap('bookkeeping')
+        if initial_population is not None and initial_fitness is not None:
+            fitness = np.array(initial_fitness, dtype=float)
+        else:
             fitness = eval_pop(pop)
-            if minimize:
-                best_idx = np.argmin(fitness)
-                best_val = fitness[best_idx]
-            else:
-                best_idx = np.argmax(fitness)
-                best_val = fitness[best_idx]
-            history.append(best_val)
-            parents = pop[np.random.choice(len(pop), 2, replace=False)]
-            child1, child2 = self.crossover(parents[0], parents[1])
-            def mutate(child):
-                for i in range(dim):
-                    if np.random.rand() < self.mutation_rate:
-                        lo, hi = bounds[i]
-                        child[i] = np.random.uniform(lo, hi)
-                return child
-            child1 = mutate(child1)
-            child2 = mutate(child2)
-            pop[np.random.choice(len(pop))] = child1
-            pop[np.random.choice(len(pop))] = child2
-        fitness = eval_pop(pop)
-        if minimize:
-            best_idx = np.argmin(fitness)
-            best_val = fitness[best_idx]
+        instr.lap('evaluation')
+        if self.mode == 'generational':
+            pop, fitness = self._run_generational(pop, fitness, eval_pop, lower, upper,
+                                                  minimize, history, should_stop, instr)
+            best_idx = arg_best(fitness)
         else:
-            best_idx = np.argmax(fitness)
-            best_val = fitness[best_idx]
-        return {
+            # the two children of each generation are written into this buffer
+            offspring = np.empty((2, dim))
+            best_idx = arg_best(fitness)
+            for g in range(self.generations):
+                history.append(fitness[best_idx])
+                parents = rng.choice(len(pop), 2, replace=False)
+                instr.lap('selection')
+                one_point_crossover(rng, pop[parents[:1]], pop[parents[1:]], out=offspring)
+                instr.lap('crossover')
+                uniform_reset_mutation(rng, offspring, mutation_mask(rng, offspring.shape, self.mutation_rate),
+                                       lower, upper)
+                instr.lap('mutation')
+                child_fit = eval_pop(offspring)
+                instr.lap('evaluation')
+                slots = rng.integers(0, len(pop), size=2)
+                for slot, child, fit in zip(slots, offspring, child_fit):
+                    pop[slot] = child
+                    fitness[slot] = fit
+                    # running best: rescan only when the current best was overwritten
+                    if better(fit, fitness[best_idx]):
+                        best_idx = slot
+                    elif slot == best_idx:
+                        best_idx = arg_best(fitness)
+                stop = should_stop(pop, fitness, fitness[best_idx])
+                instr.lap('bookkeeping')
+                if stop:
+                    break
+        result = {
             'best_solution': pop[best_idx],
-            'best_value': best_val,
-            'history': history
-        }
\ No newline at end of file
+            'best_value': fitness[best_idx],
+            'history': history,
+            'population': pop,
+            'fitness': fitness,
+            'stop_reason': term.reason or 'generations',
+            'n_evaluations': n_evals,
+            'instrumentation': instr.summary(),
+        }
+        if is_fitness_cache(fitness_fn):
+            result['cache_stats'] = fitness_fn.stats()
+        return result
+
+    def _run_generational(self, pop, fitness, eval_pop, lower, upper, minimize, history,
+                          should_stop=None, instr=None):
+        """Full generational replacement with elitism, children written into a second buffer."""
+        rng = self.rng
+        n = len(pop)
+        elitism = min(self.elitism, n)
+        n_children = n - elitism
+        n_pairs = (n_children + 1) // 2
+        new_pop = np.empty_like(pop)
+        new_fit = np.empty_like(fitness)
+        instr = instr or Instrumentation(keep_records=False)
+        for g in range(self.generations):
+            order = np.argsort(fitness) if minimize else np.argsort(fitness)[::-1]
+            history.append(fitness[order[0]])
+            new_pop[:elitism] = pop[order[:elitism]]
+            new_fit[:elitism] = fitness[order[:elitism]]
+            instr.lap('bookkeeping')
+            if n_children > 0:
+                a = tournament_select(rng, fitness, n_pairs, maximize=not minimize)
+                b = tournament_select(rng, fitness, n_pairs, maximize=not minimize)
+                instr.lap('selection')
+                children = one_point_crossover(rng, pop[a], pop[b], self.crossover_rate)
+                offspring = new_pop[elitism:]
+                offspring[:] = children[:n_children]
+                instr.lap('crossover')
+                uniform_reset_mutation(rng, offspring, mutation_mask(rng, offspring.shape, self.mutation_rate),
+                                       lower, upper)
+                instr.lap('mutation')
+                new_fit[elitism:] = eval_pop(offspring)
+                instr.lap('evaluation')
+            pop, new_pop = new_pop, pop
+            fitness, new_fit = new_fit, fitness
+            # generational replacement needs a full scan for the new best anyway
+            stop = should_stop is not None and should_stop(
+                pop, fitness, fitness.min() if minimize else fitness.max())
+            instr.lap('bookkeeping')
+            if stop:
+                break
+        return pop, fitness
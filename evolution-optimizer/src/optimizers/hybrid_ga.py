@@ -1,9 +1,24 @@
 import numpy as np
+from .operators import (
+    tournament_select,
+    one_point_crossover,
+    mutation_mask,
+    gaussian_mutation,
+    uniform_reset_mutation,
+)
+from .rng import make_rng
+from .acquisition import Acquisition
+from .termination import Termination
+from .instrumentation import Instrumentation
 
 class HybridGA:
     """
     Genetic Algorithm using a surrogate model (e.g. Random Forest) as fitness.
     Allows variable-specific mutation probabilities derived from feature importance.
+
+    With acquisition='ucb' or 'ei' the GA maximizes an acquisition function
+    built from the spread of the forest's per-tree predictions instead of the
+    mean prediction (see optimizers.acquisition).
     """
     def __init__(
         self,
@@ -12,7 +27,11 @@ class HybridGA:
         base_mutation_rate=0.05,
         crossover_rate=0.7,
         elitism=2,
-        variable_mutation_weights=None
+        variable_mutation_weights=None,
+        seed=None,
+        acquisition=None,
+        kappa=2.0,
+        xi=0.01
     ):
         self.population_size = population_size
         self.generations = generations
@@ -20,33 +39,22 @@ class HybridGA:
         self.crossover_rate = crossover_rate
         self.elitism = elitism
         self.variable_mutation_weights = variable_mutation_weights
+        self.acquisition = acquisition
+        self.kappa = kappa
+        self.xi = xi
+        # int, SeedSequence or np.random.Generator; all draws come from this stream
+        self.rng = make_rng(seed)
 
     def _init_population(self, bounds):
-        pop = []
-        for _ in range(self.population_size):
-            individual = np.array([np.random.uniform(lo, hi) for lo, hi in bounds])
-            pop.append(individual)
-        return np.array(pop)
+        lower = np.array([lo for lo, _ in bounds], dtype=float)
+        upper = np.array([hi for _, hi in bounds], dtype=float)
+        return self.rng.uniform(lower, upper, size=(self.population_size, len(bounds)))
 
     def _evaluate(self, pop, model):
         return model.predict(pop)
 
-    def _tournament(self, pop, fitness, k=3):
-        idxs = np.random.choice(len(pop), k, replace=False)
-        best = idxs[np.argmax(fitness[idxs])]
-        return pop[best]
-
-    def _crossover(self, p1, p2):
-        if np.random.rand() > self.crossover_rate:
-            return p1.copy(), p2.copy()
-        point = np.random.randint(1, len(p1))
-        c1 = np.concatenate([p1[:point], p2[point:]])
-        c2 = np.concatenate([p2[:point], p1[point:]])
-        return c1, c2
-
-    def _mutate(self, individual, bounds):
-        dim = len(individual)
-        # Normalize variable weights
+    def _mutation_probabilities(self, dim):
+        """Per-gene mutation probability from the normalized variable weights."""
         if self.variable_mutation_weights is not None:
             w = np.array(self.variable_mutation_weights, dtype=float)
             if w.sum() > 0:
@@ -55,52 +63,116 @@ class HybridGA:
                 w = np.ones(dim) / dim
         else:
             w = np.ones(dim) / dim
+        # Importance-driven probability scaling
+        return self.base_mutation_rate * (1.0 + 2.5 * w)
+
+    def _mutate(self, individual, bounds):
+        lower = np.array([lo for lo, _ in bounds], dtype=float)
+        upper = np.array([hi for _, hi in bounds], dtype=float)
+        probs = self._mutation_probabilities(len(individual))
+        return self._mutate_batch(individual[None, :], probs, lower, upper)[0]
+
+    def _mutate_batch(self, offspring, probs, lower, upper):
+        """Mutate every row of offspring in place (70% local gaussian step, 30% global reset)."""
+        mask = mutation_mask(self.rng, offspring.shape, probs)
+        local = self.rng.random(offspring.shape) < 0.7
+        gaussian_mutation(self.rng, offspring, mask & local, 0.15 * (upper - lower), lower, upper)
+        uniform_reset_mutation(self.rng, offspring, mask & ~local, lower, upper)
+        return offspring
 
-        for i in range(dim):
-            # Importance-driven probability scaling
-            prob = self.base_mutation_rate * (1.0 + 2.5 * w[i])
-            if np.random.rand() < prob:
-                lo, hi = bounds[i]
-                # Local or global jump mix
-                if np.random.rand() < 0.7:
-                    span = hi - lo
-                    step = np.random.normal(0, 0.15 * span)
-                    individual[i] = np.clip(individual[i] + step, lo, hi)
-                else:
-                    individual[i] = np.random.uniform(lo, hi)
-        return individual
+    def run(self, model, bounds, best_observed=None, termination=None, instrumentation=None):
+        """
+        Maximize model.predict over bounds.
+        model may be a fitted regressor or a SurrogateEvaluator wrapping one;
+        the result reports time spent predicting vs in the GA operators.
+        In acquisition mode model must be a forest (or FlatForest) and
+        best_observed is the incumbent used by expected improvement; to
+        combine with SurrogateEvaluator, wrap an Acquisition in it and leave
+        acquisition unset here.
+        termination criteria (see optimizers.termination) are checked after
+        each generation is scored; the result records 'stop_reason' and
+        'n_evaluations' (rows sent to the model).
+        Phase timings are returned as 'instrumentation' (see
+        optimizers.instrumentation); 'timing' is derived from them, with the
+        evaluation phase reported as predict_s.
+        """
+        instr = instrumentation or Instrumentation(keep_records=False)
+        instr.start()
+        if self.acquisition is not None:
+            model = Acquisition(model, self.acquisition, self.kappa, self.xi, best_observed)
+        dim = len(bounds)
+        lower = np.array([lo for lo, _ in bounds], dtype=float)
+        upper = np.array([hi for _, hi in bounds], dtype=float)
+        # computed once per run instead of once per mutated child
+        probs = self._mutation_probabilities(dim)
+        n_children = self.population_size - self.elitism
+        n_pairs = (n_children + 1) // 2
 
-    def run(self, model, bounds):
+        term = Termination(termination)
+        term.start()
+        n_evals = 0
+        def score(p):
+            nonlocal n_evals
+            n_evals += len(p)
+            # a SurrogateEvaluator only sends its cache misses to the model
+            rows = getattr(model, 'model_rows', None)
+            values = self._evaluate(p, model)
+            instr.count_evaluations(len(p), None if rows is None else model.model_rows - rows)
+            return values
         pop = self._init_population(bounds)
+        new_pop = np.empty_like(pop)
         history = []
+        fitness = None
+        instr.lap('bookkeeping')
         for g in range(self.generations):
-            fitness = self._evaluate(pop, model)
+            fitness = score(pop)
+            instr.lap('evaluation')
             best_idx = np.argmax(fitness)
             history.append(fitness[best_idx])
-            # Sort by fitness
-            order = np.argsort(fitness)[::-1]
-            pop = pop[order]
-            fitness = fitness[order]
+            stop = term.check(generation=len(history), best_value=fitness[best_idx], population=pop,
+                              fitness=fitness, n_evaluations=n_evals, minimize=False)
+            instr.end_generation(len(history), fitness[best_idx], n_evals)
+            if stop:
+                break
 
-            new_pop = [pop[i].copy() for i in range(self.elitism)]  # elitism
+            # elitism: best individuals are copied unchanged
+            elite = np.argsort(fitness)[::-1][:self.elitism]
+            new_pop[:self.elitism] = pop[elite]
+            instr.lap('bookkeeping')
 
-            while len(new_pop) < self.population_size:
-                p1 = self._tournament(pop, fitness)
-                p2 = self._tournament(pop, fitness)
-                c1, c2 = self._crossover(p1, p2)
-                c1 = self._mutate(c1, bounds)
-                if len(new_pop) < self.population_size:
-                    new_pop.append(c1)
-                if len(new_pop) < self.population_size:
-                    c2 = self._mutate(c2, bounds)
-                    new_pop.append(c2)
+            if n_children > 0:
+                a = tournament_select(self.rng, fitness, n_pairs)
+                b = tournament_select(self.rng, fitness, n_pairs)
+                instr.lap('selection')
+                children = one_point_crossover(self.rng, pop[a], pop[b], self.crossover_rate)
+                offspring = new_pop[self.elitism:]
+                offspring[:] = children[:n_children]
+                instr.lap('crossover')
+                self._mutate_batch(offspring, probs, lower, upper)
+                instr.lap('mutation')
 
-            pop = np.array(new_pop)
+            pop, new_pop = new_pop, pop
+            fitness = None
 
-        fitness = self._evaluate(pop, model)
+        instr.lap('bookkeeping')
+        if fitness is None:
+            fitness = score(pop)
+            instr.lap('evaluation')
         best_idx = np.argmax(fitness)
-        return {
+        summary = instr.summary()
+        predict_time = summary['phases_s']['evaluation']
+        total = summary['total_s']
+        result = {
             "best_solution": pop[best_idx],
             "best_fitness": fitness[best_idx],
-            "history": history
-        }
\ No newline at end of file
+            "history": history,
+            "population": pop,
+            "fitness": fitness,
+            "stop_reason": term.reason or "generations",
+            "n_evaluations": n_evals,
+            "timing": {"predict_s": predict_time, "operators_s": total - predict_time, "total_s": total},
+            "instrumentation": summary,
+        }
+        if hasattr(model, "stats"):
+            result["surrogate_stats"] = model.stats()
+        return result
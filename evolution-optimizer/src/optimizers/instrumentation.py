@@ -0,0 +1,129 @@
+import csv
+import json
+import time
+
+"counters, per-phase timers and per-generation records for optimizer runs"
+
+PHASES = ('selection', 'crossover', 'mutation', 'evaluation', 'bookkeeping')
+
+
+class _PhaseTimer:
+    __slots__ = ('instr', 'name', 'start')
+
+    def __init__(self, instr, name):
+        self.instr = instr
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.instr.add_time(self.name, time.perf_counter() - self.start)
+
+
+class Instrumentation:
+    """
+    Lightweight run instrumentation shared by GeneticAlgorithm,
+    DifferentialEvolution and HybridGA.
+
+    Optimizers time their phases with lap(): each call charges the time
+    since the previous lap to the named phase, so a generation costs one
+    perf_counter() call per phase. Counters are plain integers, and after
+    every generation a record (generation, best value, evaluations, elapsed
+    time and cumulative phase times) is stored and passed to each callback.
+
+    Every optimizer creates one per run unless one is passed in (the
+    implicit one keeps no records); the summary() dict is returned in the
+    result as 'instrumentation'. 'evaluations' counts rows that reached the
+    objective, cache hits are counted separately as 'cache_hits'.
+
+    Args:
+        callbacks: callables receiving each per-generation record dict
+        keep_records: store the per-generation records (needed for CSV export)
+    """
+
+    def __init__(self, callbacks=None, keep_records=True):
+        self.callbacks = list(callbacks or [])
+        self.keep_records = keep_records
+        self.counters = {}
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.records = []
+        self._start = time.perf_counter()
+        self._last = self._start
+
+    def start(self):
+        """(Re)start the wall clock and the lap timer."""
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self.times[phase] = self.times.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def add_time(self, phase, seconds):
+        self.times[phase] = self.times.get(phase, 0.0) + seconds
+
+    def phase(self, name):
+        """Context manager timing a block, for code that does not use laps."""
+        return _PhaseTimer(self, name)
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def count_evaluations(self, requested, computed=None):
+        """
+        Count `requested` rows sent for evaluation, of which only `computed`
+        reached the objective; the rest (cache hits) go to 'cache_hits' so
+        they do not inflate evaluations_per_s.
+        """
+        computed = requested if computed is None else computed
+        self.count('evaluations', computed)
+        if requested > computed:
+            self.count('cache_hits', requested - computed)
+
+    def end_generation(self, generation, best_value, n_evaluations):
+        self.count('generations')
+        if not (self.keep_records or self.callbacks):
+            return
+        record = {
+            'generation': generation,
+            'best_value': float(best_value),
+            'n_evaluations': int(n_evaluations),
+            'elapsed_s': time.perf_counter() - self._start,
+        }
+        for phase, seconds in self.times.items():
+            record[f'{phase}_s'] = seconds
+        if self.keep_records:
+            self.records.append(record)
+        for callback in self.callbacks:
+            callback(record)
+
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def summary(self):
+        total = self.elapsed()
+        evaluations = self.counters.get('evaluations', 0)
+        return {
+            'total_s': total,
+            'phases_s': dict(self.times),
+            'counters': dict(self.counters),
+            'evaluations_per_s': evaluations / total if total > 0 else 0.0,
+            'evaluation_share': self.times.get('evaluation', 0.0) / total if total > 0 else 0.0,
+        }
+
+    def to_json(self, path):
+        """Write the summary and the per-generation records as JSON."""
+        with open(path, 'w') as f:
+            json.dump({'summary': self.summary(), 'generations': self.records}, f, indent=2)
+        return path
+
+    def to_csv(self, path):
+        """Write the per-generation records as CSV, one row per generation."""
+        fields = list(self.records[0]) if self.records else ['generation', 'best_value', 'n_evaluations', 'elapsed_s']
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.records)
+        return path
@@ -0,0 +1,233 @@
+import multiprocessing as mp
+import queue
+import traceback
+from multiprocessing import shared_memory
+import numpy as np
+from .rng import spawn_rngs
+
+"island-model runner: subpopulations in worker processes exchanging elites through shared memory"
+
+TOPOLOGIES = ('ring', 'full')
+
+
+def migration_sources(island, n_islands, topology):
+    """Islands whose elites `island` receives."""
+    if topology == 'ring':
+        return [(island - 1) % n_islands] if n_islands > 1 else []
+    if topology == 'full':
+        return [j for j in range(n_islands) if j != island]
+    raise ValueError(f"unknown topology '{topology}', expected one of {TOPOLOGIES}")
+
+
+def _best_order(fitness, minimize):
+    return np.argsort(fitness) if minimize else np.argsort(fitness)[::-1]
+
+
+def write_migrants(buffer, island, pop, fitness, minimize):
+    """Copy the island's best rows into its slot of the (n_islands, m, dim + 1) buffer."""
+    m = buffer.shape[1]
+    elite = _best_order(fitness, minimize)[:m]
+    buffer[island, :, :-1] = pop[elite]
+    buffer[island, :, -1] = fitness[elite]
+
+
+def receive_migrants(buffer, island, sources, pop, fitness, minimize):
+    """Replace the island's worst rows with the best migrants from its sources, in place."""
+    if not sources:
+        return
+    m = buffer.shape[1]
+    incoming = buffer[sources].reshape(-1, buffer.shape[2])
+    incoming = incoming[_best_order(incoming[:, -1], minimize)[:m]]
+    worst = _best_order(fitness, minimize)[::-1][:len(incoming)]
+    pop[worst] = incoming[:, :-1]
+    fitness[worst] = incoming[:, -1]
+
+
+def _epoch_lengths(generations, interval):
+    return [min(interval, generations - start) for start in range(0, generations, interval)]
+
+
+def _run_epoch(optimizer, fitness_fn, bounds, minimize, generations, pop, fitness):
+    optimizer.generations = generations
+    result = optimizer.run(fitness_fn, bounds, minimize=minimize,
+                           initial_population=pop, initial_fitness=fitness)
+    return result['population'], result['fitness'], list(result['history'])
+
+
+def _island_worker(island, cls, kwargs, seed, fitness_fn, bounds, minimize, epochs,
+                   sources, shm_name, buffer_shape, barrier, results):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        buffer = np.ndarray(buffer_shape, dtype=np.float64, buffer=shm.buf)
+        optimizer = cls(seed=seed, **kwargs)
+        pop, fitness, history = None, None, []
+        for k, length in enumerate(epochs):
+            pop, fitness, h = _run_epoch(optimizer, fitness_fn, bounds, minimize, length, pop, fitness)
+            history.extend(h)
+            if k == len(epochs) - 1:
+                break
+            write_migrants(buffer, island, pop, fitness, minimize)
+            barrier.wait()  # every island has published its elites
+            receive_migrants(buffer, island, sources, pop, fitness, minimize)
+            barrier.wait()  # every island has read before slots are overwritten
+        results.put((island, None, {'population': pop, 'fitness': fitness, 'history': history}))
+    except Exception:
+        barrier.abort()
+        results.put((island, traceback.format_exc(), None))
+    finally:
+        shm.close()
+
+
+class IslandModel:
+    """
+    Run N copies of an optimizer on separate subpopulations and periodically
+    exchange elites.
+
+    Every `migration_interval` generations each island publishes its
+    `n_migrants` best individuals to a shared-memory buffer; after a barrier,
+    each island replaces its worst individuals with the best migrants of its
+    sources ('ring': the previous island, 'full': all others).
+
+    Islands run in worker processes by default (processes=False runs them in
+    turn in this process with the same results for a given seed). The
+    objective and the optimizer class must be picklable.
+
+    Args:
+        optimizer_cls: GeneticAlgorithm, DifferentialEvolution or any class
+            whose run() accepts initial_population/initial_fitness and returns
+            'population' and 'fitness'
+        optimizer_kwargs: constructor arguments except seed and generations
+        n_islands: number of subpopulations
+        generations: total generations per island
+        migration_interval: generations between migrations
+        n_migrants: individuals sent by each island per migration
+        topology: 'ring' or 'full'
+        seed: int, SeedSequence or Generator; each island gets a spawned child
+        processes: run islands in worker processes
+    """
+
+    def __init__(self, optimizer_cls, optimizer_kwargs=None, n_islands=4, generations=100,
+                 migration_interval=10, n_migrants=2, topology='ring', seed=None, processes=True):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"unknown topology '{topology}', expected one of {TOPOLOGIES}")
+        if migration_interval < 1:
+            raise ValueError("migration_interval must be at least 1")
+        self.optimizer_cls = optimizer_cls
+        self.optimizer_kwargs = dict(optimizer_kwargs or {})
+        self.optimizer_kwargs.pop('generations', None)
+        self.n_islands = n_islands
+        self.generations = generations
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.topology = topology
+        self.seed = seed
+        self.processes = processes
+
+    def _kwargs(self):
+        # generations is reset per epoch; a placeholder keeps positional-only constructors happy
+        return {'generations': self.migration_interval, **self.optimizer_kwargs}
+
+    def run(self, fitness_fn, bounds, minimize=True):
+        """
+        Returns:
+            dict with the usual 'best_solution', 'best_value' and 'history'
+            (global best per generation), plus 'island_history', per-island
+            'islands' results and the number of 'migrations'.
+        """
+        epochs = _epoch_lengths(self.generations, self.migration_interval)
+        # one independent Generator per island, handed to the optimizer as its seed
+        seeds = spawn_rngs(self.seed, self.n_islands)
+        dim = len(bounds)
+        shape = (self.n_islands, self.n_migrants, dim + 1)
+        if self.processes and self.n_islands > 1:
+            islands = self._run_processes(fitness_fn, bounds, minimize, epochs, seeds, shape)
+            workers = self.n_islands
+        else:
+            islands = self._run_in_process(fitness_fn, bounds, minimize, epochs, seeds, shape)
+            workers = 1
+        result = self._collect(islands, minimize)
+        result['migrations'] = len(epochs) - 1
+        result['workers'] = workers
+        return result
+
+    def _run_in_process(self, fitness_fn, bounds, minimize, epochs, seeds, shape):
+        buffer = np.zeros(shape)
+        optimizers = [self.optimizer_cls(seed=s, **self._kwargs()) for s in seeds]
+        states = [{'population': None, 'fitness': None, 'history': []} for _ in optimizers]
+        for k, length in enumerate(epochs):
+            for opt, st in zip(optimizers, states):
+                st['population'], st['fitness'], h = _run_epoch(
+                    opt, fitness_fn, bounds, minimize, length, st['population'], st['fitness'])
+                st['history'].extend(h)
+            if k == len(epochs) - 1:
+                break
+            for i, st in enumerate(states):
+                write_migrants(buffer, i, st['population'], st['fitness'], minimize)
+            for i, st in enumerate(states):
+                receive_migrants(buffer, i, migration_sources(i, self.n_islands, self.topology),
+                                 st['population'], st['fitness'], minimize)
+        return states
+
+    def _run_processes(self, fitness_fn, bounds, minimize, epochs, seeds, shape):
+        ctx = mp.get_context()
+        shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        try:
+            barrier = ctx.Barrier(self.n_islands)
+            results = ctx.Queue()
+            workers = [
+                ctx.Process(target=_island_worker, args=(
+                    i, self.optimizer_cls, self._kwargs(), seeds[i], fitness_fn, bounds, minimize, epochs,
+                    migration_sources(i, self.n_islands, self.topology), shm.name, shape, barrier, results))
+                for i in range(self.n_islands)
+            ]
+            for w in workers:
+                w.start()
+            states, errors = [None] * self.n_islands, []
+            pending = self.n_islands
+            while pending:
+                try:
+                    island, error, state = results.get(timeout=1.0)
+                except queue.Empty:
+                    # a worker killed without reporting would otherwise hang the barrier
+                    dead = [i for i, w in enumerate(workers) if w.exitcode not in (None, 0)]
+                    if dead:
+                        for w in workers:
+                            w.terminate()
+                        raise RuntimeError(f"island worker(s) {dead} exited unexpectedly")
+                    continue
+                pending -= 1
+                if error is not None:
+                    errors.append(f"island {island}:\n{error}")
+                states[island] = state
+            for w in workers:
+                w.join()
+        finally:
+            shm.close()
+            shm.unlink()
+        if errors:
+            raise RuntimeError("island worker failed\n" + "\n".join(errors))
+        return states
+
+    def _collect(self, islands, minimize):
+        island_history = [np.asarray(st['history'], dtype=float) for st in islands]
+        stacked = np.vstack(island_history)
+        history = list(stacked.min(axis=0) if minimize else stacked.max(axis=0))
+        per_island = []
+        for st in islands:
+            best = int(np.argmin(st['fitness']) if minimize else np.argmax(st['fitness']))
+            per_island.append({
+                'best_solution': st['population'][best],
+                'best_value': st['fitness'][best],
+                'history': list(st['history']),
+                'population': st['population'],
+                'fitness': st['fitness'],
+            })
+        values = [r['best_value'] for r in per_island]
+        winner = int(np.argmin(values) if minimize else np.argmax(values))
+        return {
+            'best_solution': per_island[winner]['best_solution'],
+            'best_value': per_island[winner]['best_value'],
+            'history': history,
+            'island_history': [list(h) for h in island_history],
+            'islands': per_island,
+        }
@@ -0,0 +1,81 @@
+import numpy as np
+
+"batched selection, crossover and mutation operators acting on whole offspring matrices"
+
+# every operator takes the numpy Generator to draw from as its first argument
+
+
+def tournament_select(rng, fitness, n, k=3, maximize=True):
+    """
+    Run n tournaments of size k at once and return the winning indices.
+    Contestants are drawn with replacement, which keeps the draw a single
+    (n, k) integer matrix regardless of population size.
+    """
+    fitness = np.asarray(fitness)
+    contestants = rng.integers(0, len(fitness), size=(n, k))
+    scores = fitness[contestants]
+    winner = np.argmax(scores, axis=1) if maximize else np.argmin(scores, axis=1)
+    return contestants[np.arange(n), winner]
+
+
+def _crossover_from_mask(p1, p2, mask, out):
+    n = p1.shape[0]
+    if out is None:
+        out = np.empty((2 * n, p1.shape[1]), dtype=p1.dtype)
+    c1, c2 = out[:n], out[n:]
+    np.copyto(c1, p2)
+    np.copyto(c1, p1, where=mask)
+    np.copyto(c2, p1)
+    np.copyto(c2, p2, where=mask)
+    return out
+
+
+def one_point_crossover(rng, p1, p2, rate=1.0, out=None):
+    """
+    One-point crossover of n parent pairs (rows of p1 and p2).
+    Returns a (2n, dim) matrix: the first n rows are the children starting
+    with p1 genes, the last n rows their mirrors. Pairs that do not cross
+    (probability 1 - rate) are copied unchanged.
+    """
+    p1, p2 = np.asarray(p1, dtype=float), np.asarray(p2, dtype=float)
+    n, dim = p1.shape
+    if dim < 2:
+        mask = np.ones((n, dim), dtype=bool)
+    else:
+        points = rng.integers(1, dim, size=n)
+        points[rng.random(n) >= rate] = dim
+        mask = np.arange(dim) < points[:, None]
+    return _crossover_from_mask(p1, p2, mask, out)
+
+
+def uniform_crossover(rng, p1, p2, rate=1.0, swap_prob=0.5, out=None):
+    """Uniform crossover of n parent pairs, same layout as one_point_crossover."""
+    p1, p2 = np.asarray(p1, dtype=float), np.asarray(p2, dtype=float)
+    n, dim = p1.shape
+    mask = rng.random((n, dim)) >= swap_prob
+    mask[rng.random(n) >= rate] = True
+    return _crossover_from_mask(p1, p2, mask, out)
+
+
+def mutation_mask(rng, shape, prob):
+    """Boolean mask of genes to mutate; prob is a scalar or a per-gene vector."""
+    return rng.random(shape) < prob
+
+
+def gaussian_mutation(rng, X, mask, sigma, lower, upper):
+    """
+    Add N(0, sigma) noise to the masked genes of X in place and clip those
+    genes to bounds; unmasked genes are left untouched even when out of bounds.
+    """
+    step = np.broadcast_to(rng.standard_normal(X.shape) * sigma, X.shape)
+    lower = np.broadcast_to(np.asarray(lower, dtype=float), X.shape)
+    upper = np.broadcast_to(np.asarray(upper, dtype=float), X.shape)
+    X[mask] = np.clip(X[mask] + step[mask], lower[mask], upper[mask])
+    return X
+
+
+def uniform_reset_mutation(rng, X, mask, lower, upper):
+    """Redraw the masked genes of X uniformly inside their bounds, in place."""
+    fresh = rng.uniform(lower, upper, size=X.shape)
+    np.copyto(X, fresh, where=mask)
+    return X
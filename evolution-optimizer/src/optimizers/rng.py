@@ -0,0 +1,30 @@
+import numpy as np
+
+"random number streams shared by optimizers, diversifiers and data generators"
+
+
+def make_rng(seed=None):
+    """
+    Return a numpy Generator.
+    seed may be None (fresh entropy), an int, a SeedSequence or an existing
+    Generator, which is returned unchanged so callers can share one stream.
+    """
+    return np.random.default_rng(seed)
+
+
+def spawn_seeds(seed, n):
+    """
+    Split seed into n independent SeedSequences (for workers or restarts).
+    A Generator seed is advanced once to derive the parent sequence, so
+    spawning from the same Generator twice gives different children.
+    """
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(seed.integers(0, 2**63, size=4))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(n)
+
+
+def spawn_rngs(seed, n):
+    """n independent Generators derived from seed via SeedSequence.spawn."""
+    return [np.random.default_rng(s) for s in spawn_seeds(seed, n)]
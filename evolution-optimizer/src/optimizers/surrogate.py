@@ -0,0 +1,125 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from .cache import FitnessCache
+
+"surrogate-model evaluation with a persistent thread pool and an elite cache"
+
+
+def _predict_trees(trees, X):
+    """Sum of the predictions of a slice of fitted trees (runs in a pool thread)."""
+    total = trees[0].predict(X, check_input=False)
+    for tree in trees[1:]:
+        total = total + tree.predict(X, check_input=False)
+    return total
+
+
+def _single_output(values, n_rows):
+    """Flatten a prediction to one value per row, rejecting multi-output models."""
+    values = np.asarray(values, dtype=float).reshape(n_rows, -1)
+    if values.shape[1] != 1:
+        raise ValueError(f"surrogate model must predict a single output, got {values.shape[1]} columns")
+    return values[:, 0]
+
+
+class SurrogateEvaluator:
+    """
+    Wrap a fitted regression model so repeated small predict calls stay cheap.
+
+    For tree ensembles exposing `estimators_` (RandomForestRegressor,
+    ExtraTreesRegressor) the trees are split once into n_threads groups and
+    every predict call runs the groups on one persistent ThreadPoolExecutor
+    instead of spinning up joblib workers per call. Any other model is called
+    directly. Predictions are memoized like FitnessCache, so elites that
+    survive a generation unchanged are not predicted again.
+
+    The wrapper has a `predict` method and can be passed to HybridGA.run in
+    place of the model; the result dict then gains 'surrogate_stats'.
+
+    Args:
+        model: fitted single-output regressor (multi-output models raise ValueError)
+        n_threads: pool size (default: os.cpu_count())
+        cache_size: number of memoized genomes (0 disables the cache)
+        tolerance: genome rounding used for cache keys
+    """
+
+    def __init__(self, model, n_threads=None, cache_size=10000, tolerance=1e-9):
+        if getattr(model, 'n_outputs_', 1) != 1:
+            raise ValueError(f"surrogate model must predict a single output, got {model.n_outputs_}")
+        self.model = model
+        self.n_threads = max(1, n_threads or os.cpu_count() or 1)
+        trees = list(getattr(model, 'estimators_', []))
+        if trees and not all(hasattr(t, 'tree_') for t in trees):
+            trees = []  # not a plain tree ensemble (e.g. gradient boosting stages)
+        self._n_trees = len(trees)
+        n_groups = min(self.n_threads, len(trees))
+        self._tree_groups = [g.tolist() for g in np.array_split(np.array(trees, dtype=object), n_groups)] \
+            if n_groups else []
+        self._pool = ThreadPoolExecutor(max_workers=self.n_threads) if len(self._tree_groups) > 1 else None
+        self._cache = FitnessCache(self._predict_uncached, tolerance, cache_size) if cache_size > 0 else None
+        self.predict_calls = 0
+        self.predicted_rows = 0
+        self.model_rows = 0
+        self.predict_time = 0.0
+
+    def _predict_uncached(self, X):
+        self.model_rows += len(X)
+        if not self._tree_groups:
+            return _single_output(self.model.predict(X), len(X))
+        X32 = np.ascontiguousarray(X, dtype=np.float32)
+        if self._pool is None:
+            total = _predict_trees(self._tree_groups[0], X32)
+        else:
+            parts = self._pool.map(_predict_trees, self._tree_groups, [X32] * len(self._tree_groups))
+            total = sum(parts)
+        return _single_output(total, len(X)) / self._n_trees
+
+    # mark the bound method as batched for FitnessCache / evaluate_population
+    _predict_uncached.batched = True
+
+    def predict(self, X):
+        """Predict every row of X, reusing memoized predictions."""
+        start = time.perf_counter()
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        if self._cache is not None:
+            values = self._cache.evaluate(X)
+        else:
+            values = self._predict_uncached(X)
+        self.predict_calls += 1
+        self.predicted_rows += len(X)
+        self.predict_time += time.perf_counter() - start
+        return values
+
+    def predict_many(self, populations):
+        """
+        Predict several populations (e.g. one per island) with one model call.
+        Returns a list of 1-D arrays in the order of `populations`.
+        """
+        populations = [np.atleast_2d(np.asarray(p, dtype=float)) for p in populations]
+        sizes = np.cumsum([len(p) for p in populations])[:-1]
+        return np.split(self.predict(np.vstack(populations)), sizes)
+
+    def stats(self):
+        out = {
+            'predict_calls': self.predict_calls,
+            'predicted_rows': self.predicted_rows,
+            'model_rows': self.model_rows,
+            'predict_s': self.predict_time,
+            'threads': self.n_threads if self._pool is not None else 1,
+        }
+        if self._cache is not None:
+            out['cache'] = self._cache.stats()
+        return out
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._tree_groups = [sum(self._tree_groups, [])]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,128 @@
+import time
+import numpy as np
+
+"pluggable stopping rules checked by the optimizers once per generation"
+
+# Every criterion is called with a state dict holding 'generation' (completed
+# generations), 'best_value', 'population', 'fitness', 'n_evaluations' and
+# 'minimize', and returns True when the run should stop. `reason` ends up in
+# the result dict as 'stop_reason'.
+
+
+class StallGenerations:
+    """Stop after n generations without the best value improving by more than tol."""
+    reason = 'stall'
+
+    def __init__(self, n, tol=0.0):
+        self.n = n
+        self.tol = tol
+        self.reset()
+
+    def reset(self):
+        self.best = None
+        self.stalled = 0
+
+    def __call__(self, state):
+        value = state['best_value']
+        gain = np.inf if self.best is None else (self.best - value if state['minimize'] else value - self.best)
+        if gain > self.tol:
+            self.best = value
+            self.stalled = 0
+        else:
+            self.stalled += 1
+        return self.stalled >= self.n
+
+
+class TargetValue:
+    """Stop once the best value reaches target."""
+    reason = 'target'
+
+    def __init__(self, target):
+        self.target = target
+
+    def reset(self):
+        pass
+
+    def __call__(self, state):
+        if state['minimize']:
+            return state['best_value'] <= self.target
+        return state['best_value'] >= self.target
+
+
+class PopulationSpread:
+    """
+    Stop when the population has collapsed: on='fitness' compares the
+    fitness range, on='position' the largest per-gene standard deviation,
+    against tol.
+    """
+    reason = 'spread'
+
+    def __init__(self, tol, on='fitness'):
+        if on not in ('fitness', 'position'):
+            raise ValueError(f"unknown spread measure '{on}', expected 'fitness' or 'position'")
+        self.tol = tol
+        self.on = on
+
+    def reset(self):
+        pass
+
+    def __call__(self, state):
+        if self.on == 'fitness':
+            return np.ptp(state['fitness']) <= self.tol
+        return np.max(np.std(state['population'], axis=0)) <= self.tol
+
+
+class MaxEvaluations:
+    """Stop once n objective evaluations (rows sent to the objective) have been used."""
+    reason = 'max_evaluations'
+
+    def __init__(self, n):
+        self.n = n
+
+    def reset(self):
+        pass
+
+    def __call__(self, state):
+        return state['n_evaluations'] >= self.n
+
+
+class WallClock:
+    """Stop once `seconds` of wall time have passed since the run started."""
+    reason = 'wall_clock'
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.reset()
+
+    def reset(self):
+        self.start = time.perf_counter()
+
+    def __call__(self, state):
+        return time.perf_counter() - self.start >= self.seconds
+
+
+class Termination:
+    """
+    A set of criteria checked together; the first one that fires decides
+    the stop reason. Accepts None, one criterion or a list.
+    """
+
+    def __init__(self, criteria=None):
+        if criteria is None:
+            criteria = []
+        elif not isinstance(criteria, (list, tuple)):
+            criteria = [criteria]
+        self.criteria = list(criteria)
+        self.reason = None
+
+    def start(self):
+        self.reason = None
+        for criterion in self.criteria:
+            criterion.reset()
+
+    def check(self, **state):
+        for criterion in self.criteria:
+            if criterion(state):
+                self.reason = criterion.reason
+                return True
+        return False
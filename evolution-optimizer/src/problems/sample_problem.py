@@ -1,5 +1,6 @@
 import numpy as np
 import math
+from .xrd_data import load_xy, to_theta_radians
 
 def scherrer_equation(K, lambda_val, B, theta):
     """Scherrer equation: D = (K * lambda) / (B * cos(theta))"""
@@ -8,9 +9,25 @@ def scherrer_equation(K, lambda_val, B, theta):
         return np.nan
     return (K * lambda_val) / (B * cos_t)
 
-def generate_synthetic_scherrer_data(num_points=20, noise_level=0.05):
+def scherrer_equation_batch(K, lambda_val, B, cos_theta):
+    """
+    Broadcasting Scherrer equation on precomputed cos(theta).
+    K, lambda_val, B of shape (pop,) and cos_theta of shape (n_theta,) give a
+    (pop, n_theta) array; entries with B <= 0 or cos(theta) ~ 0 are NaN.
+    """
+    K = np.asarray(K, dtype=float)[:, None]
+    lambda_val = np.asarray(lambda_val, dtype=float)[:, None]
+    B = np.asarray(B, dtype=float)[:, None]
+    cos_theta = np.asarray(cos_theta, dtype=float)[None, :]
+    invalid = (B <= 0) | (np.abs(cos_theta) < 1e-12)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        D = (K * lambda_val) / (B * cos_theta)
+    return np.where(invalid, np.nan, D)
+
+def generate_synthetic_scherrer_data(num_points=20, noise_level=0.05, seed=None):
     """
     Generate synthetic XRD-like data for Scherrer equation fitting.
+    seed: int, SeedSequence or np.random.Generator for the measurement noise
     Returns:
         theta_data: array of Bragg angles (radians)
         D_measured: array of "measured" crystallite sizes with noise
@@ -30,7 +47,8 @@ def generate_synthetic_scherrer_data(num_points=20, noise_level=0.05):
                        for t in theta_data])
     
     # Add measurement noise
-    noise = np.random.normal(0, noise_level * np.mean(D_true), num_points)
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(0, noise_level * np.mean(D_true), num_points)
     D_measured = D_true + noise
     
     true_params = {
@@ -41,6 +59,158 @@ def generate_synthetic_scherrer_data(num_points=20, noise_level=0.05):
     
     return theta_data, D_measured, true_params
 
+class ScherrerFitProblem:
+    """
+    Scherrer fitting dataset plus objective.
+    Holds theta (radians), measured D and the precomputed cos(theta) as
+    contiguous float64 buffers. Calling the problem with one [K, lambda, B]
+    vector returns its MSE; calling it with a (pop, 3) array returns the vector
+    of MSEs (it is a batched objective, see optimizers.evaluation).
+    Pickling only ships theta, D and true_params; cos(theta) is rebuilt on load.
+
+    With chunk_size set the arrays are used as given (typically memory-mapped,
+    see from_file) and residuals are streamed over theta in chunks, so memory
+    stays at O(pop * chunk_size) whatever the dataset size. Problems loaded
+    from a file pickle as their file reference only.
+    """
+    batched = True
+
+    def __init__(self, theta_data, D_measured, true_params=None, chunk_size=None,
+                 angle_unit='rad', source=None):
+        """
+        Args:
+            theta_data, D_measured: 1-D arrays of equal length
+            true_params: dict of K/lambda/B used to generate synthetic data
+            chunk_size: stream residuals over this many points at a time
+            angle_unit: unit of theta_data, see xrd_data.to_theta_radians
+            source: loader arguments when the data came from from_file
+        """
+        if len(theta_data) != len(D_measured):
+            raise ValueError("theta_data and D_measured must have the same shape")
+        self.true_params = true_params
+        self.chunk_size = chunk_size
+        self.source = source
+        if chunk_size is None:
+            self.theta_data = np.ascontiguousarray(to_theta_radians(np.asarray(theta_data, dtype=np.float64),
+                                                                    angle_unit))
+            self.D_measured = np.ascontiguousarray(D_measured, dtype=np.float64)
+            self.angle_unit = 'rad'
+            self.cos_theta = np.cos(self.theta_data)
+        else:
+            self.theta_data = theta_data
+            self.D_measured = D_measured
+            self.angle_unit = angle_unit
+            self.cos_theta = None
+
+    @classmethod
+    def synthetic(cls, num_points=20, noise_level=0.05, seed=None):
+        """Problem built on generate_synthetic_scherrer_data()."""
+        return cls(*generate_synthetic_scherrer_data(num_points, noise_level, seed=seed))
+
+    @classmethod
+    def from_file(cls, path, angle_unit='rad', chunk_size=65536, **loader_kwargs):
+        """
+        Memory-mapped problem from a theta/D file (.npy, raw binary or CSV).
+        loader_kwargs are passed to xrd_data.load_xy.
+        """
+        theta, D, _ = load_xy(path, **loader_kwargs)
+        source = dict(loader_kwargs, path=path)
+        return cls(theta, D, chunk_size=chunk_size, angle_unit=angle_unit, source=source)
+
+    def __getstate__(self):
+        state = {'true_params': self.true_params, 'chunk_size': self.chunk_size,
+                 'angle_unit': self.angle_unit, 'source': self.source}
+        if self.source is None:
+            state['theta_data'] = np.asarray(self.theta_data)
+            state['D_measured'] = np.asarray(self.D_measured)
+        return state
+
+    def __setstate__(self, state):
+        if state['source'] is not None:
+            loader_kwargs = dict(state['source'])
+            theta, D, _ = load_xy(loader_kwargs.pop('path'), **loader_kwargs)
+        else:
+            theta, D = state['theta_data'], state['D_measured']
+        self.__init__(theta, D, state['true_params'], state['chunk_size'],
+                      state['angle_unit'], state['source'])
+
+    def __len__(self):
+        return len(self.theta_data)
+
+    def theta_radians(self, index=slice(None)):
+        """Theta in radians for the selected points (reads only those from disk)."""
+        return to_theta_radians(np.asarray(self.theta_data[index], dtype=np.float64), self.angle_unit)
+
+    def _chunks(self):
+        """Yield (cos(theta), D) blocks; a single block when not streaming."""
+        if self.chunk_size is None:
+            yield self.cos_theta, self.D_measured
+            return
+        n = len(self)
+        for start in range(0, n, self.chunk_size):
+            stop = min(start + self.chunk_size, n)
+            yield (np.cos(self.theta_radians(slice(start, stop))),
+                   np.asarray(self.D_measured[start:stop], dtype=np.float64))
+
+    def evaluate_batch(self, population):
+        """
+        population is a (pop, 3) array of [K, lambda, B] rows.
+        All candidates are compared against all theta points in one
+        (pop, n_theta) broadcast per chunk. Returns the vector of MSEs, NaN where B <= 0.
+        """
+        population = np.atleast_2d(np.asarray(population, dtype=float))
+        K, lambda_val, B = population[:, 0], population[:, 1], population[:, 2]
+        
+        sse = np.zeros(len(population))
+        for cos_theta, D_measured in self._chunks():
+            # Predict D for each theta using candidate parameters
+            D_predicted = scherrer_equation_batch(K, lambda_val, B, cos_theta)
+            sse += np.sum((D_predicted - D_measured) ** 2, axis=1)
+        
+        # Calculate mean squared error
+        return sse / len(self)
+
+    def __call__(self, solution):
+        solution = np.asarray(solution, dtype=float)
+        if solution.ndim == 1:
+            return self.evaluate_batch(solution[None, :])[0]
+        return self.evaluate_batch(solution)
+
+    def predict(self, solution, theta=None):
+        """D curve for one [K, lambda, B] solution on theta (default: the data angles)."""
+        if theta is not None:
+            cos_theta = np.cos(np.asarray(theta, dtype=float))
+        elif self.cos_theta is not None:
+            cos_theta = self.cos_theta
+        else:
+            # streaming problems keep no dense cos(theta); the curve itself is dense anyway
+            cos_theta = np.cos(self.theta_radians())
+        K, lambda_val, B = solution
+        return scherrer_equation_batch([K], [lambda_val], [B], cos_theta)[0]
+
+
+# The default dataset is seeded so that every process building it lazily
+# (e.g. ProcessPoolEvaluator workers) scores a genome the same way.
+DEFAULT_PROBLEM_SEED = 0
+
+_default_problem = None
+
+def get_default_problem():
+    """Shared synthetic problem used by evaluate_solution/evaluate_solutions."""
+    global _default_problem
+    if _default_problem is None:
+        _default_problem = ScherrerFitProblem.synthetic(seed=DEFAULT_PROBLEM_SEED)
+    return _default_problem
+
+def set_default_problem(problem):
+    """
+    Swap the problem behind evaluate_solution (e.g. for measured XRD data).
+    This only affects the current process; with a process pool pass the
+    problem itself as the objective, it pickles with its data.
+    """
+    global _default_problem
+    _default_problem = problem
+
 def evaluate_solution(solution):
     """
     Fitness function for genetic algorithm.
@@ -48,23 +218,14 @@ def evaluate_solution(solution):
     Returns: Mean squared error between predicted and measured D values.
     Lower is better (minimization problem).
     """
-    K, lambda_val, B = solution
-    
-    # Generate or load synthetic data (cached globally to avoid regeneration)
-    if not hasattr(evaluate_solution, 'cached_data'):
-        theta_data, D_measured, true_params = generate_synthetic_scherrer_data()
-        evaluate_solution.cached_data = (theta_data, D_measured, true_params)
-    
-    theta_data, D_measured, true_params = evaluate_solution.cached_data
-    
-    # Predict D for each theta using candidate parameters
-    D_predicted = np.array([scherrer_equation(K, lambda_val, B, t) 
-                           for t in theta_data])
-    
-    # Calculate mean squared error
-    mse = np.mean((D_predicted - D_measured) ** 2)
-    
-    return mse
+    return get_default_problem()(solution)
+
+def evaluate_solutions(population):
+    """Batched evaluate_solution on a (pop, 3) population."""
+    return get_default_problem().evaluate_batch(population)
+
+# evaluate_solutions accepts a whole population (see optimizers.evaluation)
+evaluate_solutions.batched = True
 
 def get_problem_bounds():
     """Return reasonable bounds for [K, lambda, B]"""
@@ -74,33 +235,36 @@ def get_problem_bounds():
         (0.005, 0.05)    # B (radians)
     ]
 
-def plot_fit_comparison(best_solution):
+def plot_fit_comparison(best_solution, problem=None):
     """
     Plot the fitted Scherrer curve vs measured data.
     best_solution = [K, lambda, B] from genetic algorithm
+    problem = ScherrerFitProblem that was fitted (default: the shared synthetic one)
     """
     import matplotlib.pyplot as plt
     
-    theta_data, D_measured, true_params = evaluate_solution.cached_data
+    problem = problem or get_default_problem()
+    # large measured scans are thinned to at most ~5000 plotted points
+    step = max(1, len(problem) // 5000)
+    theta_data = problem.theta_radians(slice(None, None, step))
+    D_measured = np.asarray(problem.D_measured[::step])
+    true_params = problem.true_params
     K_fit, lambda_fit, B_fit = best_solution
     
     # Generate fine theta grid for smooth curves
-    theta_fine = np.linspace(theta_data[0], theta_data[-1], 200)
-    
-    # True curve
-    D_true_fine = [scherrer_equation(true_params['K'], true_params['lambda'], 
-                                     true_params['B'], t) for t in theta_fine]
-    
-    # Fitted curve
-    D_fit_fine = [scherrer_equation(K_fit, lambda_fit, B_fit, t) 
-                  for t in theta_fine]
+    theta_fine = np.linspace(theta_data.min(), theta_data.max(), 200)
     
     plt.figure(figsize=(8, 5))
     plt.scatter(np.degrees(theta_data), D_measured, 
                 label='Measured data (with noise)', alpha=0.6, s=50)
-    plt.plot(np.degrees(theta_fine), D_true_fine, 
-             label=f'True: K={true_params["K"]:.2f}, λ={true_params["lambda"]:.2f}, B={true_params["B"]:.4f}',
-             linestyle='--', linewidth=2)
+    if true_params is not None:
+        # True curve (synthetic data only)
+        D_true_fine = problem.predict([true_params['K'], true_params['lambda'], true_params['B']], theta_fine)
+        plt.plot(np.degrees(theta_fine), D_true_fine, 
+                 label=f'True: K={true_params["K"]:.2f}, λ={true_params["lambda"]:.2f}, B={true_params["B"]:.4f}',
+                 linestyle='--', linewidth=2)
+    # Fitted curve
+    D_fit_fine = problem.predict(best_solution, theta_fine)
     plt.plot(np.degrees(theta_fine), D_fit_fine, 
              label=f'GA Fit: K={K_fit:.2f}, λ={lambda_fit:.2f}, B={B_fit:.4f}',
              linewidth=2)
@@ -0,0 +1,130 @@
+import hashlib
+import os
+import tempfile
+from itertools import islice
+import numpy as np
+
+"loaders for large measured XRD datasets backed by memory-mapped arrays"
+
+BINARY_EXTENSIONS = ('.bin', '.dat', '.raw', '.f64')
+LAYOUTS = ('rows', 'columns')
+
+
+def default_cache_dir():
+    """Per-user cache for parsed text files ($XDG_CACHE_HOME or ~/.cache), else the temp dir."""
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    path = os.path.join(root, 'evolution-optimizer', 'xrd')
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        path = os.path.join(tempfile.gettempdir(), 'evolution-optimizer-xrd')
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _npy_layout(shape, columns, n_columns):
+    """Orientation of a 2-D .npy array when none is given; raises when it cannot be told."""
+    rows_ok = shape[1] > max(columns)
+    cols_ok = shape[0] > max(columns)
+    if rows_ok != cols_ok:
+        return 'rows' if rows_ok else 'columns'
+    if rows_ok and shape[0] != shape[1]:
+        if shape[1] == n_columns:
+            return 'rows'
+        if shape[0] == n_columns:
+            return 'columns'
+    raise ValueError(f"cannot tell the layout of an array of shape {shape}; "
+                     f"pass layout='rows' (one point per row) or layout='columns'")
+
+
+def _data_lines(handle, comments='#'):
+    for line in handle:
+        stripped = line.strip()
+        if stripped and not stripped.startswith(comments):
+            yield stripped
+
+
+def _csv_to_npy(path, cache_path, columns, delimiter, skip_header, dtype, chunk_rows):
+    """Stream a text file into a (len(columns), n) .npy file, chunk_rows lines at a time."""
+    with open(path, 'r') as f:
+        lines = islice(_data_lines(f), skip_header, None)
+        n_rows = sum(1 for _ in lines)
+    out = np.lib.format.open_memmap(cache_path, mode='w+', dtype=dtype, shape=(len(columns), n_rows))
+    row = 0
+    with open(path, 'r') as f:
+        lines = islice(_data_lines(f), skip_header, None)
+        while True:
+            chunk = list(islice(lines, chunk_rows))
+            if not chunk:
+                break
+            block = np.loadtxt(chunk, delimiter=delimiter, usecols=columns, dtype=dtype, ndmin=2)
+            out[:, row:row + len(block)] = block.T
+            row += len(block)
+    out.flush()
+    del out
+
+
+def load_xy(path, columns=(0, 1), delimiter=',', skip_header=0, dtype=np.float64,
+            n_columns=2, cache_dir=None, chunk_rows=100000, layout=None):
+    """
+    Load two columns (theta/D, or raw 2θ/intensity) as memory-mapped arrays.
+
+    Supported inputs:
+      .npy        - shape (n, k) (layout='rows') or (k, n) (layout='columns');
+                    opened with mmap_mode='r'. Without layout the orientation is
+                    only inferred when one axis has exactly n_columns entries or
+                    only one orientation fits `columns`; otherwise ValueError.
+      .bin/.dat/.raw/.f64 - raw interleaved rows of n_columns values of dtype
+      anything else is read as delimited text; it is streamed once into a
+      .npy cache in cache_dir (default: default_cache_dir(), never the data
+      folder) which is reused while it is newer than the source. The cache
+      name carries a hash of the source path and the parse options (columns,
+      delimiter, skip_header, dtype), so parsing the same file differently
+      never returns a stale cache.
+
+    Returns:
+        (x, y, npy_or_binary_path) where x and y are read-only memmap views.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        arr = np.load(path, mmap_mode='r')
+        if arr.ndim != 2:
+            raise ValueError(f"{path}: expected a 2-D array, got shape {arr.shape}")
+        if layout is None:
+            layout = _npy_layout(arr.shape, columns, n_columns)
+        elif layout not in LAYOUTS:
+            raise ValueError(f"unknown layout '{layout}', expected one of {LAYOUTS}")
+        # (k, n) files keep each column contiguous; (n, k) files are read as strided views
+        if layout == 'columns':
+            return arr[columns[0]], arr[columns[1]], path
+        return arr[:, columns[0]], arr[:, columns[1]], path
+    if ext in BINARY_EXTENSIONS:
+        arr = np.memmap(path, dtype=dtype, mode='r').reshape(-1, n_columns)
+        return arr[:, columns[0]], arr[:, columns[1]], path
+
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+    base = os.path.splitext(os.path.basename(path))[0]
+    options = repr((os.path.abspath(path), tuple(columns), delimiter, skip_header, np.dtype(dtype).str))
+    digest = hashlib.sha1(options.encode()).hexdigest()[:10]
+    cache_path = os.path.join(cache_dir, f"{base}.cols{columns[0]}-{columns[1]}.{digest}.npy")
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(path):
+        _csv_to_npy(path, cache_path, tuple(columns), delimiter, skip_header, dtype, chunk_rows)
+    arr = np.load(cache_path, mmap_mode='r')
+    return arr[0], arr[1], cache_path
+
+
+def to_theta_radians(angles, unit='rad'):
+    """
+    Convert Bragg-angle data to theta in radians.
+    unit: 'rad' (theta), 'deg' (theta in degrees) or '2theta_deg' (diffractometer 2θ).
+    """
+    if unit == 'rad':
+        return angles
+    if unit == 'deg':
+        return np.radians(angles)
+    if unit == '2theta_deg':
+        return np.radians(angles) / 2.0
+    raise ValueError(f"unknown angle unit '{unit}'")
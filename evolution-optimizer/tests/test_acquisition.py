@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from src.models.flat_forest import FlatForest
+from src.optimizers.acquisition import (
+    Acquisition,
+    expected_improvement,
+    per_tree_predictions,
+    upper_confidence_bound,
+)
+from src.optimizers.hybrid_ga import HybridGA
+
+
+class TestAcquisition(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.X = rng.uniform(0, 1, (150, 3))
+        cls.y = np.sin(3 * cls.X[:, 0]) + cls.X[:, 1]
+        cls.rf = RandomForestRegressor(n_estimators=20, random_state=0).fit(cls.X, cls.y)
+        cls.P = rng.uniform(0, 1, (30, 3))
+
+    def test_flat_and_sklearn_per_tree_agree(self):
+        flat = per_tree_predictions(FlatForest.from_sklearn(self.rf), self.P)
+        loop = per_tree_predictions(self.rf, self.P)
+        np.testing.assert_allclose(flat, loop)
+        np.testing.assert_allclose(flat.mean(axis=1), self.rf.predict(self.P))
+
+    def test_ucb_and_ei(self):
+        mean, std = np.array([1.0, 1.0, 0.5]), np.array([0.0, 0.5, 0.0])
+        np.testing.assert_allclose(upper_confidence_bound(mean, std, 2.0), [1.0, 2.0, 0.5])
+        ei = expected_improvement(mean, std, best=0.8, xi=0.0)
+        self.assertAlmostEqual(ei[0], 0.2)
+        self.assertGreater(ei[1], 0.2)
+        self.assertEqual(ei[2], 0.0)
+
+    def test_acquisition_wrapper(self):
+        acq = Acquisition(self.rf, 'ucb', kappa=1.0)
+        mean, std = acq.mean_std(self.P)
+        np.testing.assert_allclose(acq.predict(self.P), mean + std)
+        self.assertAlmostEqual(acq(self.P[0]), acq.predict(self.P[:1])[0])
+        with self.assertRaises(ValueError):
+            Acquisition(self.rf, 'ei')
+        with self.assertRaises(ValueError):
+            Acquisition(self.rf, 'pi')
+
+    def test_hybrid_ga_acquisition_mode(self):
+        bounds = [(0.0, 1.0)] * 3
+        ga = HybridGA(population_size=16, generations=5, seed=0, acquisition='ei')
+        result = ga.run(self.rf, bounds, best_observed=float(self.y.max()))
+        self.assertEqual(result['population'].shape, (16, 3))
+        self.assertTrue(np.all(result['fitness'] >= 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from active_learning import propose_batch, run_active_learning  # noqa: E402
+from data_synthesis import (  # noqa: E402
+    generate_synthetic_dataset,
+    get_variable_bounds,
+    make_yield_oracle,
+    synthesis_yield,
+)
+from models.random_forest_feature_importance import (  # noqa: E402
+    permutation_importance_oob,
+    train_rf,
+    update_rf,
+)
+
+
+class TestActiveLearning(unittest.TestCase):
+
+    def test_dataset_uses_true_yield(self):
+        X, y, scaler = generate_synthetic_dataset(n_samples=50, noise=0.0, random_state=1)
+        np.testing.assert_allclose(y, synthesis_yield(scaler.inverse_transform(X)))
+        oracle = make_yield_oracle(scaler, noise=0.0)
+        np.testing.assert_allclose(oracle(X[:5]), y[:5])
+
+    def test_update_rf_adds_and_caps_trees(self):
+        X, y, _ = generate_synthetic_dataset(n_samples=80, random_state=2)
+        rf, _ = train_rf(X[:60], y[:60], n_estimators=10, random_state=0)
+        old = list(rf.estimators_)
+        rf, _ = update_rf(rf, X, y, n_new_trees=5)
+        self.assertEqual(len(rf.estimators_), 15)
+        self.assertTrue(all(a is b for a, b in zip(old, rf.estimators_[:10])))
+        rf, _ = update_rf(rf, X, y, n_new_trees=5, max_trees=12, random_state=3)
+        self.assertEqual(len(rf.estimators_), 12)
+        self.assertEqual(rf.predict(X[:3]).shape, (3,))
+
+    def test_update_rf_invalidates_oob(self):
+        X, y, _ = generate_synthetic_dataset(n_samples=80, random_state=2)
+        rf, baseline = train_rf(X[:60], y[:60], n_estimators=10, random_state=0)
+        self.assertIsNotNone(baseline)
+        rf, baseline = update_rf(rf, X, y, n_new_trees=5)
+        self.assertIsNone(baseline)
+        self.assertFalse(hasattr(rf, 'oob_score_'))
+        with self.assertRaises(ValueError):
+            permutation_importance_oob(rf, X, y)
+
+    def test_propose_batch_skips_duplicates_and_known(self):
+        pop = np.array([[0.0, 0.0], [0.0, 0.0], [1.0, 1.0], [0.5, 0.5]])
+        fit = np.array([3.0, 3.0, 2.0, 1.0])
+        batch = propose_batch(pop, fit, 2, known=np.array([[1.0, 1.0]]))
+        np.testing.assert_array_equal(batch, [[0.0, 0.0], [0.5, 0.5]])
+
+    def test_loop_grows_data_and_tracks_cost(self):
+        X, y, scaler = generate_synthetic_dataset(n_samples=40, random_state=3)
+        oracle = make_yield_oracle(scaler, random_state=0)
+        result = run_active_learning(oracle, X, y, get_variable_bounds(), rounds=2, batch_size=4,
+                                     initial_trees=20, new_trees_per_round=5,
+                                     ga_params={'population_size': 16, 'generations': 5}, seed=0)
+        rounds = result['rounds']
+        self.assertEqual([r['n_samples'] for r in rounds], [40, 44, 48])
+        self.assertEqual([r['n_trees'] for r in rounds], [20, 25, 30])
+        self.assertEqual(rounds[-1]['cumulative_tree_sample_fits'], 20 * 40 + 5 * 44 + 5 * 48)
+        self.assertEqual(result['best_value'], result['y'].max())
+        self.assertGreaterEqual(rounds[-1]['best_observed'], rounds[0]['best_observed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+from src.optimizers.async_driver import AsyncEvolution, FakeLatencyObjective
+
+
+def sphere(x):
+    return float(np.sum(np.asarray(x) ** 2))
+
+
+BOUNDS = [(-5.0, 5.0)] * 3
+
+
+class TestFakeLatencyObjective(unittest.TestCase):
+
+    def test_value_and_reproducible_latency(self):
+        fn = FakeLatencyObjective(sphere, mean_latency=0.001, seed=3)
+        x = np.array([1.0, 2.0, 0.5])
+        self.assertEqual(fn(x), sphere(x))
+        self.assertEqual(fn.latency(x), fn.latency(x.copy()))
+        self.assertNotEqual(fn.latency(x), fn.latency(x + 1))
+
+
+class TestAsyncEvolution(unittest.TestCase):
+
+    def test_budget_and_report(self):
+        fn = FakeLatencyObjective(sphere, mean_latency=0.002, seed=0)
+        for strategy in ('de', 'ga'):
+            result = AsyncEvolution(strategy, population_size=8, n_workers=4, max_evaluations=60,
+                                    seed=0).run(fn, BOUNDS)
+            self.assertEqual(result['n_evaluations'], 60)
+            self.assertEqual(len(result['history']), 60 // 8)
+            self.assertTrue(0.0 < result['utilization'] <= 1.0)
+            self.assertAlmostEqual(result['busy_s'] + result['idle_s'], result['wall_s'] * 4, places=6)
+            self.assertEqual(result['best_value'], sphere(result['best_solution']))
+
+    def test_single_worker_is_reproducible_and_improves(self):
+        runs = [AsyncEvolution('de', population_size=10, n_workers=1, generations=30, seed=5).run(sphere, BOUNDS)
+                for _ in range(2)]
+        self.assertEqual(runs[0]['best_value'], runs[1]['best_value'])
+        self.assertLess(runs[0]['history'][-1], runs[0]['history'][0])
+        self.assertTrue(np.all(np.diff(runs[0]['history']) <= 0))
+
+    def test_process_executor(self):
+        result = AsyncEvolution('ga', population_size=6, n_workers=2, max_evaluations=20,
+                                executor='process', seed=0).run(sphere, BOUNDS)
+        self.assertEqual(result['n_evaluations'], 20)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AsyncEvolution('pso')
+        with self.assertRaises(ValueError):
+            AsyncEvolution('de', population_size=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import copy
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from benchmark import (  # noqa: E402
+    aggregate,
+    compare,
+    load_results,
+    run_case,
+    run_suite,
+    save_results,
+    scaled_objective,
+)
+
+
+def fake_case(seed, best, curve_best=None):
+    curve_best = best if curve_best is None else curve_best
+    return {'optimizer': 'de', 'objective': '1', 'dims': 4, 'population_size': 10, 'generations': 2,
+            'seed': seed, 'best_value': best, 'evaluations_per_s': 1000.0, 'generation_latency_s': 0.001,
+            'peak_memory_bytes': 100, 'curve': [[10, curve_best], [20, best]]}
+
+
+def reject_constant(name):
+    raise ValueError(f"non-standard JSON constant {name}")
+
+
+class TestBenchmark(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.results = run_suite(objectives=['1', '2'], dims=(3, 20), population_sizes=(10,), seeds=(0, 1),
+                                generations=5)
+
+    def test_scaled_objective(self):
+        fitness_fn, bounds, minimize = scaled_objective('3', 7)
+        self.assertEqual(len(bounds), 7)
+        self.assertTrue(minimize)
+        self.assertIsNone(scaled_objective('1', 10))
+        self.assertEqual(len(scaled_objective('1', 4)[1]), 4)
+
+    def test_run_case(self):
+        case = run_case('de', '2', 50, 10, generations=4, seed=0)
+        self.assertEqual(case['n_evaluations'], 10 * 5)
+        self.assertEqual(len(case['curve']), 4)
+        self.assertEqual(case['curve'][-1], [50, case['best_value']])
+        self.assertGreater(case['evaluations_per_s'], 0.0)
+        self.assertGreater(case['peak_memory_bytes'], 0)
+        self.assertIsNone(run_case('ga', '2', 3, 10, generations=2, track_memory=False)['peak_memory_bytes'])
+
+    def test_suite_layout(self):
+        # Scherrer only at its native dims: (1 + 2 dims) x 2 optimizers x 2 seeds
+        self.assertEqual(len(self.results['cases']), 12)
+        self.assertEqual(len(self.results['summary']), 6)
+        self.assertEqual({r['dims'] for r in self.results['summary'] if r['objective'] == '1'}, {4})
+        self.assertTrue(all(r['seeds'] == 2 for r in self.results['summary']))
+
+    def test_save_load_and_compare(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            loaded = load_results(save_results(self.results, os.path.join(tmp, 'sub', 'run.json')))
+        self.assertEqual(compare(loaded, loaded), [])
+
+        slower = copy.deepcopy(loaded)
+        row = next(r for r in slower['summary'] if r['objective'] == '2' and r['dims'] == 20)
+        row['evaluations_per_s'] *= 0.5
+        row['best_value_mean'] = row['best_value_mean'] * 2 + 1.0
+        flagged = {(r['metric'], r['dims']) for r in compare(loaded, slower)}
+        self.assertEqual(flagged, {('evaluations_per_s', 20), ('best_value_mean', 20)})
+
+        # different generation budgets are different configurations
+        other = copy.deepcopy(slower)
+        for r in other['summary']:
+            r['generations'] = 10
+        self.assertEqual(compare(loaded, other), [])
+
+    def test_non_finite_best_values(self):
+        rows = aggregate([fake_case(0, float('inf')), fake_case(1, 5.0, curve_best=4.0), fake_case(2, 7.0)])
+        self.assertEqual(rows[0]['non_finite'], 1)
+        self.assertEqual(rows[0]['best_value_mean'], 6.0)
+        self.assertEqual(rows[0]['curve'][1][1], 6.0)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = save_results({'summary': rows, 'cases': [fake_case(0, float('nan'))]},
+                                os.path.join(tmp, 'run.json'))
+            with open(path) as f:
+                data = json.load(f, parse_constant=reject_constant)
+        self.assertIsNone(data['cases'][0]['best_value'])
+
+        all_inf = aggregate([fake_case(0, float('inf')), fake_case(1, float('inf'))])
+        self.assertIsNone(all_inf[0]['best_value_mean'])
+        self.assertIsNone(all_inf[0]['curve'][0][1])
+        flagged = [r['metric'] for r in compare(rows, all_inf)]
+        self.assertEqual(flagged, ['non_finite'])
+        self.assertEqual(compare(all_inf, all_inf), [])
+
+        worse = aggregate([fake_case(0, float('inf')), fake_case(1, 1.0), fake_case(2, 2.0)])
+        self.assertEqual([r['metric'] for r in compare(rows, worse)], ['best_value_mean'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+from src.optimizers.cache import FitnessCache
+from src.optimizers.genetic_algorithm import GeneticAlgorithm
+from src.optimizers.differential_evolution import DifferentialEvolution
+
+
+class CountingSphere:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return float(np.sum(np.asarray(x) ** 2))
+
+
+class TestFitnessCache(unittest.TestCase):
+
+    def test_hits_and_tolerance(self):
+        fn = CountingSphere()
+        cache = FitnessCache(fn, tolerance=1e-6)
+        x = np.array([0.1, 0.2, 0.3])
+        self.assertAlmostEqual(cache(x), 0.14)
+        self.assertAlmostEqual(cache(x + 1e-9), 0.14)
+        self.assertEqual(fn.calls, 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_batch_deduplicates(self):
+        fn = CountingSphere()
+        cache = FitnessCache(fn)
+        pop = np.array([[1.0, 2.0], [1.0, 2.0], [0.0, -0.0], [-0.0, 0.0]])
+        np.testing.assert_allclose(cache(pop), [5.0, 5.0, 0.0, 0.0])
+        self.assertEqual(fn.calls, 2)
+
+    def test_lru_eviction(self):
+        fn = CountingSphere()
+        cache = FitnessCache(fn, maxsize=2)
+        a, b, c = np.eye(3)
+        cache(a)
+        cache(b)
+        cache(a)       # a becomes most recent
+        cache(c)       # evicts b
+        self.assertEqual(cache.stats()['size'], 2)
+        cache(a)
+        self.assertEqual(fn.calls, 3)
+        cache(b)
+        self.assertEqual(fn.calls, 4)
+
+    def test_optimizers_report_stats(self):
+        bounds = [(-2.0, 2.0)] * 3
+        for opt in (GeneticAlgorithm(population_size=10, mutation_rate=0.1, crossover_rate=0.7, generations=20),
+                    DifferentialEvolution(population_size=10, generations=5)):
+            fn = CountingSphere()
+            result = opt.run(FitnessCache(fn), bounds)
+            stats = result['cache_stats']
+            self.assertEqual(stats['misses'], fn.calls)
+
+    def test_ga_evaluates_only_children(self):
+        fn = CountingSphere()
+        ga = GeneticAlgorithm(population_size=50, mutation_rate=0.1, crossover_rate=0.7, generations=150)
+        ga.run(fn, [(-2.0, 2.0)] * 3)
+        self.assertEqual(fn.calls, 50 + 2 * 150)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+from src.optimizers.differential_evolution import DifferentialEvolution
+from src.optimizers.evaluation import batched_objective
+
+
+@batched_objective
+def batch_sphere(pop):
+    return np.sum(pop ** 2, axis=1)
+
+
+class TestVectorizedDifferentialEvolution(unittest.TestCase):
+
+    def test_donor_indices_distinct(self):
+        de = DifferentialEvolution(population_size=5)
+        for n in (4, 5, 17):
+            r1, r2, r3 = de.donor_indices(n)
+            target = np.arange(n)
+            for a, b in ((r1, r2), (r1, r3), (r2, r3), (r1, target), (r2, target), (r3, target)):
+                self.assertFalse(np.any(a == b))
+
+    def test_trials_take_at_least_one_mutant_gene(self):
+        de = DifferentialEvolution(population_size=20, crossover_rate=0.0)
+        pop = np.random.default_rng(0).uniform(-1, 1, (20, 4))
+        trials = de.generate_trials(pop, np.full(4, -1.0), np.full(4, 1.0))
+        changed = np.sum(trials != pop, axis=1)
+        self.assertTrue(np.all(changed == 1))
+
+    def test_vectorized_run_improves(self):
+        de = DifferentialEvolution(population_size=30, generations=60, vectorized=True)
+        result = de.run(batch_sphere, [(-5.0, 5.0)] * 4)
+        self.assertEqual(len(result['history']), 60)
+        self.assertTrue(np.all(np.diff(result['history']) <= 0))
+        self.assertLess(result['best_value'], 1e-2)
+
+
+if __name__ == '__main__':
+    unittest.main()
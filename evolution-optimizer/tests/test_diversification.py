@@ -0,0 +1,170 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from diversification import (  # noqa: E402
+    MaxMinDiversification,
+    ChemicalRecipeMaxMin,
+    normalized_pdist,
+    pairwise_distance_stats,
+    select_diverse_batch,
+)
+
+
+def min_pairwise(points):
+    P = np.asarray(points)
+    D = np.sqrt(((P[:, None] - P[None]) ** 2).sum(-1))
+    np.fill_diagonal(D, np.inf)
+    return D.min()
+
+
+class TestMaxMinDiversification(unittest.TestCase):
+
+    bounds = [(0.0, 1.0), (10.0, 20.0), (-1.0, 1.0)]
+
+    def test_samples_within_bounds(self):
+        div = MaxMinDiversification(self.bounds, num_samples=40, seed=0)
+        samples = np.array(div.generate_diverse_samples(candidates_per_iteration=50))
+        self.assertEqual(samples.shape, (40, 3))
+        for j, (lo, hi) in enumerate(self.bounds):
+            self.assertTrue(np.all((samples[:, j] >= lo) & (samples[:, j] <= hi)))
+
+    def test_more_spread_than_random(self):
+        div = MaxMinDiversification([(0.0, 1.0)] * 4, num_samples=60, seed=1)
+        samples = div.generate_diverse_samples(candidates_per_iteration=100)
+        random = np.random.default_rng(1).random((60, 4))
+        self.assertGreater(min_pairwise(samples), 2 * min_pairwise(random))
+
+    def test_initial_samples_kept(self):
+        div = MaxMinDiversification(self.bounds, num_samples=5, initial_samples=[[0.5, 15.0, 0.0]], seed=2)
+        samples = div.generate_diverse_samples(candidates_per_iteration=20)
+        np.testing.assert_array_equal(samples[0], [0.5, 15.0, 0.0])
+        self.assertEqual(len(samples), 5)
+
+    def test_min_distance_matches_scalar(self):
+        div = MaxMinDiversification(self.bounds, num_samples=6, seed=3)
+        div.generate_diverse_samples(candidates_per_iteration=10)
+        candidate = np.array([0.2, 12.0, 0.4])
+        expected = min(div._distance(candidate, s) for s in div.samples)
+        self.assertAlmostEqual(div._min_distance_to_samples(candidate), expected)
+
+
+class TestPairwiseDistanceKernel(unittest.TestCase):
+
+    bounds = [(0.0, 2.0), (0.0, 10.0), (3.0, 3.0)]
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.points = np.column_stack([rng.uniform(0, 2, 57), rng.uniform(0, 10, 57), np.full(57, 3.0)])
+
+    def test_condensed_matches_scalar_distance(self):
+        div = MaxMinDiversification(self.bounds, initial_samples=self.points)
+        d = normalized_pdist(self.points, self.bounds)
+        self.assertEqual(len(d), 57 * 56 // 2)
+        self.assertAlmostEqual(d[0], div._distance(self.points[0], self.points[1]))
+        self.assertAlmostEqual(div.get_diversity_score(), d.mean())
+
+    def test_blocked_matches_full(self):
+        full = pairwise_distance_stats(self.points, self.bounds)
+        for block in (1, 5, 56, 100):
+            blocked = pairwise_distance_stats(self.points, self.bounds, block_size=block)
+            self.assertEqual(blocked['pairs'], full['pairs'])
+            for key in ('min', 'mean', 'max'):
+                self.assertAlmostEqual(blocked[key], full[key])
+
+
+class TestSelectDiverseBatch(unittest.TestCase):
+
+    bounds = [(0.0, 1.0)] * 2
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # a tight high-scoring cluster plus spread-out weaker candidates
+        self.cluster = rng.normal(0.9, 0.005, (20, 2))
+        self.spread = rng.uniform(0, 0.6, (20, 2))
+        self.candidates = np.vstack([self.cluster, self.spread])
+        self.scores = np.concatenate([np.full(20, 1.0) + rng.uniform(0, 0.01, 20), rng.uniform(0, 0.5, 20)])
+
+    def test_pure_score_takes_top_q(self):
+        _, idx = select_diverse_batch(self.candidates, self.scores, 4, self.bounds, diversity_weight=0.0)
+        np.testing.assert_array_equal(np.sort(idx), np.sort(np.argsort(self.scores)[-4:]))
+
+    def test_diversity_spreads_batch(self):
+        top, _ = select_diverse_batch(self.candidates, self.scores, 4, self.bounds, diversity_weight=0.0)
+        mixed, idx = select_diverse_batch(self.candidates, self.scores, 4, self.bounds, diversity_weight=0.8)
+        self.assertEqual(len(set(idx)), 4)
+        self.assertIn(int(np.argmax(self.scores)), idx)
+        self.assertGreater(min_pairwise(mixed), 10 * min_pairwise(top))
+
+    def test_known_points_repel(self):
+        known = self.cluster[:1]
+        _, idx = select_diverse_batch(self.candidates, self.scores, 1, self.bounds,
+                                      known=known, diversity_weight=1.0)
+        self.assertGreaterEqual(idx[0], 20)
+
+
+class TestChemicalRecipeMaxMin(unittest.TestCase):
+
+    def setUp(self):
+        self.gen = ChemicalRecipeMaxMin(
+            continuous_bounds=[(100, 400), (0.5, 24)],
+            categorical_choices={'solvent': ['water', 'ethanol', 'DMF'], 'atmosphere': ['air', 'N2']},
+            num_samples=8,
+            seed=0,
+        )
+
+    def test_mixed_distance(self):
+        r1 = {'continuous': np.array([100.0, 0.5]), 'categorical': {'solvent': 'water', 'atmosphere': 'air'}}
+        r2 = {'continuous': np.array([400.0, 0.5]), 'categorical': {'solvent': 'DMF', 'atmosphere': 'air'}}
+        self.assertAlmostEqual(self.gen._distance(r1, r2), 1.0 + 0.5)
+        self.assertAlmostEqual(self.gen._distance(r1, r1), 0.0)
+
+    def test_generate_and_export(self):
+        recipes = self.gen.generate_diverse_recipes(candidates_per_iteration=20)
+        self.assertEqual(len(recipes), 8)
+        self.assertEqual(self.gen.continuous.shape, (8, 2))
+        self.assertEqual(self.gen.categorical.shape, (8, 2))
+        exported = self.gen.export_recipes_to_dict_list()
+        for recipe, row in zip(recipes, exported):
+            self.assertEqual(row['param_0'], recipe['continuous'][0])
+            self.assertEqual(row['solvent'], recipe['categorical']['solvent'])
+            self.assertIn(row['atmosphere'], ['air', 'N2'])
+            cont, cat = self.gen.encode(recipe)
+            self.assertEqual(self.gen.decode(cont, cat)['categorical'], recipe['categorical'])
+
+    def test_batch_min_distance_matches_scalar(self):
+        self.gen.generate_diverse_recipes(candidates_per_iteration=10)
+        cont, cat = self.gen._random_encoded(1)
+        candidate = self.gen.decode(cont[0], cat[0])
+        expected = min(self.gen._distance(candidate, r) for r in self.gen.recipes)
+        self.assertAlmostEqual(self.gen._min_distance_to_recipes(candidate), expected)
+
+    def test_seed_recipes(self):
+        seeds = [
+            {'continuous': np.array([100.0, 0.5]), 'categorical': {'solvent': 'water', 'atmosphere': 'air'}},
+            {'continuous': np.array([400.0, 24.0]), 'categorical': {'solvent': 'DMF', 'atmosphere': 'N2'}},
+        ]
+        gen = ChemicalRecipeMaxMin([(100, 400), (0.5, 24)], self.gen.categorical_choices, num_samples=5,
+                                   seed=0, initial_recipes=seeds)
+        recipes = gen.generate_diverse_recipes(candidates_per_iteration=10)
+        self.assertEqual(len(recipes), 5)
+        for seed, recipe in zip(seeds, recipes[:2]):
+            np.testing.assert_array_equal(recipe['continuous'], seed['continuous'])
+            self.assertEqual(recipe['categorical'], seed['categorical'])
+        self.gen.recipes = seeds[:1]
+        self.assertEqual(self.gen.continuous.shape, (1, 2))
+        self.assertEqual(len(self.gen.generate_diverse_recipes(candidates_per_iteration=10)), 8)
+        self.gen.recipes = []
+        self.assertEqual(self.gen.continuous.shape, (0, 2))
+        with self.assertRaises(AttributeError):
+            self.gen.recipes.append(seeds[0])
+        self.gen.add_recipes(seeds)
+        self.gen.add_recipes(seeds[:1])
+        self.assertEqual(len(self.gen.recipes), 3)
+        self.assertEqual(self.gen.recipes[2]['categorical'], seeds[0]['categorical'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import numpy as np
+from src.optimizers.evaluation import (
+    batched_objective,
+    is_batched,
+    evaluate_population,
+    get_evaluator,
+)
+from src.optimizers.genetic_algorithm import GeneticAlgorithm
+from src.optimizers.differential_evolution import DifferentialEvolution
+
+
+def scalar_sphere(x):
+    return float(np.sum(np.asarray(x) ** 2))
+
+
+@batched_objective
+def batch_sphere(pop):
+    return np.sum(pop ** 2, axis=1)
+
+
+class TestEvaluatePopulation(unittest.TestCase):
+
+    def setUp(self):
+        self.pop = np.random.default_rng(0).uniform(-1, 1, (7, 3))
+
+    def test_batched_flag(self):
+        self.assertTrue(is_batched(batch_sphere))
+        self.assertFalse(is_batched(scalar_sphere))
+
+    def test_batched_matches_scalar(self):
+        np.testing.assert_allclose(evaluate_population(batch_sphere, self.pop),
+                                   evaluate_population(scalar_sphere, self.pop))
+
+    def test_batched_called_once(self):
+        calls = []
+
+        @batched_objective
+        def counting(pop):
+            calls.append(len(pop))
+            return np.sum(pop, axis=1)
+
+        evaluate_population(counting, self.pop)
+        self.assertEqual(calls, [7])
+
+    def test_wrong_length_raises(self):
+        @batched_objective
+        def broken(pop):
+            return np.zeros(len(pop) - 1)
+
+        with self.assertRaises(ValueError):
+            evaluate_population(broken, self.pop)
+
+    def test_optimizers_accept_batched(self):
+        bounds = [(-2.0, 2.0)] * 3
+        ga = GeneticAlgorithm(population_size=10, mutation_rate=0.1, crossover_rate=0.7, generations=5)
+        de = DifferentialEvolution(population_size=10, generations=5)
+        for opt in (ga, de):
+            result = opt.run(batch_sphere, bounds)
+            self.assertEqual(len(result['history']), 5)
+            self.assertAlmostEqual(result['best_value'], scalar_sphere(result['best_solution']))
+
+
+class TestEvaluators(unittest.TestCase):
+
+    def test_backends_match_serial(self):
+        pop = np.random.default_rng(3).uniform(-1, 1, (23, 4))
+        expected = evaluate_population(scalar_sphere, pop)
+        for kind in ('thread', 'process'):
+            for workers, chunk in ((1, None), (3, 2), (2, 50)):
+                with get_evaluator(kind, n_workers=workers, chunk_size=chunk) as ev:
+                    np.testing.assert_array_equal(ev(scalar_sphere, pop), expected)
+                    np.testing.assert_array_equal(ev(batch_sphere, pop), expected)
+
+    def test_run_is_deterministic_across_backends(self):
+        bounds = [(-2.0, 2.0)] * 3
+        results = []
+        for kind, kwargs in (('serial', {}), ('thread', {'n_workers': 3}), ('process', {'n_workers': 2})):
+            de = DifferentialEvolution(population_size=12, generations=5, vectorized=True, seed=7)
+            with get_evaluator(kind, **kwargs) as ev:
+                results.append(de.run(scalar_sphere, bounds, evaluator=ev)['history'])
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            get_evaluator('gpu')
+
+
+if __name__ == '__main__':
+    unittest.main()
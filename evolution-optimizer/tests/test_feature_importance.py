@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from src.models.flat_forest import FlatForest
+from src.models.random_forest_feature_importance import (
+    _oob_mse,
+    oob_pairs,
+    permutation_importance_oob,
+    train_rf,
+)
+
+
+class TestPermutationImportanceOOB(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.X = rng.uniform(0, 1, (250, 5))
+        # feature 0 dominates, feature 2 matters a little, the rest is noise
+        cls.y = 3 * cls.X[:, 0] + 0.5 * cls.X[:, 2] + 0.05 * rng.normal(size=250)
+        cls.rf, cls.baseline = train_rf(cls.X, cls.y, n_estimators=60, random_state=0)
+
+    def test_oob_baseline_matches_sklearn(self):
+        rows, trees = oob_pairs(self.rf, len(self.X))
+        counts = np.bincount(rows, minlength=len(self.X)).astype(float)
+        mse = _oob_mse(FlatForest.from_sklearn(self.rf), self.X.astype(np.float32), self.y,
+                       rows, trees, counts, counts > 0)
+        self.assertAlmostEqual(mse, np.mean((self.y - self.rf.oob_prediction_) ** 2), places=10)
+
+    def test_ranking_and_independence_from_n_jobs(self):
+        imp1, rank1 = permutation_importance_oob(self.rf, self.X, self.y, n_repeats=3, n_jobs=1)
+        imp3, rank3 = permutation_importance_oob(self.rf, self.X, self.y, n_repeats=3, n_jobs=3)
+        np.testing.assert_allclose(imp1, imp3)
+        np.testing.assert_array_equal(rank1, rank3)
+        self.assertEqual(rank1[0], 0)
+        self.assertEqual(rank1[1], 2)
+
+    def test_baseline_argument_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            imp, _ = permutation_importance_oob(self.rf, self.X, self.y, self.baseline, n_jobs=1)
+        np.testing.assert_allclose(imp, permutation_importance_oob(self.rf, self.X, self.y, n_jobs=1)[0])
+
+    def test_input_left_untouched(self):
+        X = self.X.copy()
+        permutation_importance_oob(self.rf, X, self.y, n_repeats=2, n_jobs=2)
+        np.testing.assert_array_equal(X, self.X)
+
+    def test_requires_bootstrap(self):
+        rf = RandomForestRegressor(n_estimators=5, bootstrap=False, random_state=0).fit(self.X, self.y)
+        with self.assertRaises(ValueError):
+            permutation_importance_oob(rf, self.X, self.y)
+
+
+if __name__ == '__main__':
+    unittest.main()
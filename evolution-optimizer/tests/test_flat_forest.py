@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+from sklearn.tree import DecisionTreeRegressor
+from src.models.flat_forest import FlatForest, benchmark_against_sklearn
+
+
+class TestFlatForest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.X = rng.uniform(0, 1, (300, 5))
+        cls.y = np.sin(4 * cls.X[:, 0]) + cls.X[:, 1] * cls.X[:, 2] + 0.05 * rng.normal(size=300)
+        cls.P = rng.uniform(-0.1, 1.1, (500, 5))
+
+    def test_matches_random_forest(self):
+        rf = RandomForestRegressor(n_estimators=25, random_state=0).fit(self.X, self.y)
+        flat = FlatForest.from_sklearn(rf)
+        np.testing.assert_allclose(flat.predict(self.P), rf.predict(self.P), rtol=1e-12, atol=1e-12)
+        per_tree = flat.predict_per_tree(self.P)
+        self.assertEqual(per_tree.shape, (500, 25))
+        np.testing.assert_allclose(per_tree[:, 3], rf.estimators_[3].predict(self.P))
+
+    def test_matches_extra_trees_and_single_tree(self):
+        for model in (ExtraTreesRegressor(n_estimators=10, random_state=1),
+                      DecisionTreeRegressor(max_depth=6, random_state=1)):
+            model.fit(self.X, self.y)
+            np.testing.assert_allclose(FlatForest.from_sklearn(model).predict(self.P),
+                                       model.predict(self.P), rtol=1e-12, atol=1e-12)
+
+    def test_small_blocks_give_same_leaves(self):
+        rf = RandomForestRegressor(n_estimators=8, random_state=2).fit(self.X, self.y)
+        flat = FlatForest.from_sklearn(rf)
+        np.testing.assert_array_equal(flat.apply(self.P, max_block=37), flat.apply(self.P))
+
+    def test_threshold_ties_follow_sklearn(self):
+        rf = RandomForestRegressor(n_estimators=5, random_state=0).fit(self.X, self.y)
+        flat = FlatForest.from_sklearn(rf)
+        # inputs sitting exactly on split thresholds
+        tree = rf.estimators_[0].tree_
+        split = np.flatnonzero(tree.children_left != -1)[:20]
+        P = np.tile(self.X[:1], (len(split), 1))
+        P[np.arange(len(split)), tree.feature[split]] = tree.threshold[split]
+        np.testing.assert_allclose(flat.predict(P), rf.predict(P), rtol=1e-12)
+
+    def test_wrong_width_raises(self):
+        rf = RandomForestRegressor(n_estimators=3, random_state=0).fit(self.X, self.y)
+        with self.assertRaises(ValueError):
+            FlatForest.from_sklearn(rf).predict(self.P[:, :4])
+
+    def test_benchmark_report(self):
+        rf = RandomForestRegressor(n_estimators=10, random_state=0).fit(self.X, self.y)
+        report = benchmark_against_sklearn(rf, self.P[:50], repeats=2)
+        self.assertLess(report['max_abs_diff'], 1e-10)
+        self.assertEqual(report['n_trees'], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
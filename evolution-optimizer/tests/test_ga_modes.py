@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+from src.optimizers.genetic_algorithm import GeneticAlgorithm
+
+
+class CountingSphere:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return float(np.sum(np.asarray(x) ** 2))
+
+
+class TestGeneticAlgorithmModes(unittest.TestCase):
+
+    def setUp(self):
+        self.bounds = [(-3.0, 3.0)] * 4
+
+    def test_steady_state_best_matches_population(self):
+        fn = CountingSphere()
+        ga = GeneticAlgorithm(population_size=20, mutation_rate=0.2, crossover_rate=0.7, generations=100, seed=0)
+        result = ga.run(fn, self.bounds)
+        self.assertEqual(fn.calls, 20 + 2 * 100)
+        self.assertEqual(len(result['history']), 100)
+        self.assertAlmostEqual(result['best_value'], fn(result['best_solution']))
+
+    def test_generational_with_elitism(self):
+        fn = CountingSphere()
+        ga = GeneticAlgorithm(population_size=20, mutation_rate=0.1, crossover_rate=0.8, generations=40,
+                              mode='generational', elitism=2, seed=0)
+        result = ga.run(fn, self.bounds)
+        self.assertEqual(fn.calls, 20 + 18 * 40)
+        self.assertEqual(len(result['history']), 40)
+        self.assertTrue(np.all(np.diff(result['history']) <= 0))
+        self.assertLessEqual(result['best_value'], result['history'][-1])
+
+    def test_generational_maximize(self):
+        ga = GeneticAlgorithm(population_size=15, mutation_rate=0.1, crossover_rate=0.8, generations=30,
+                              mode='generational', elitism=1, seed=0)
+        result = ga.run(lambda x: -float(np.sum(x ** 2)), self.bounds, minimize=False)
+        self.assertTrue(np.all(np.diff(result['history']) >= 0))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            GeneticAlgorithm(10, 0.1, 0.7, 5, mode='island')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from src.optimizers.cache import FitnessCache
+from src.optimizers.differential_evolution import DifferentialEvolution
+from src.optimizers.evaluation import batched_objective
+from src.optimizers.genetic_algorithm import GeneticAlgorithm
+from src.optimizers.hybrid_ga import HybridGA
+from src.optimizers.instrumentation import PHASES, Instrumentation
+from src.optimizers.surrogate import SurrogateEvaluator
+
+
+@batched_objective
+def sphere(pop):
+    return np.sum(pop ** 2, axis=1)
+
+
+BOUNDS = [(-5.0, 5.0)] * 3
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_laps_counters_and_records(self):
+        seen = []
+        instr = Instrumentation(callbacks=[seen.append])
+        instr.start()
+        instr.lap('selection')
+        instr.add_time('evaluation', 0.5)
+        with instr.phase('mutation'):
+            pass
+        instr.count('evaluations', 10)
+        instr.end_generation(1, 3.0, 10)
+        self.assertEqual(instr.counters, {'evaluations': 10, 'generations': 1})
+        self.assertGreaterEqual(instr.times['evaluation'], 0.5)
+        self.assertEqual(len(instr.records), 1)
+        self.assertIs(seen[0], instr.records[0])
+        self.assertEqual(seen[0]['best_value'], 3.0)
+        for phase in PHASES:
+            self.assertIn(f'{phase}_s', seen[0])
+
+    def test_no_records(self):
+        instr = Instrumentation(keep_records=False)
+        instr.end_generation(1, 0.0, 0)
+        self.assertEqual(instr.records, [])
+        self.assertEqual(instr.counters['generations'], 1)
+
+    def test_export(self):
+        instr = Instrumentation()
+        for g in range(3):
+            instr.end_generation(g + 1, 1.0 / (g + 1), 10 * (g + 1))
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(instr.to_json(os.path.join(tmp, 'run.json'))) as f:
+                data = json.load(f)
+            self.assertEqual(len(data['generations']), 3)
+            self.assertIn('phases_s', data['summary'])
+            with open(instr.to_csv(os.path.join(tmp, 'run.csv'))) as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([int(r['n_evaluations']) for r in rows], [10, 20, 30])
+
+
+class TestOptimizerIntegration(unittest.TestCase):
+
+    def check(self, result, instr, generations):
+        summary = result['instrumentation']
+        self.assertEqual(summary['counters']['evaluations'], result['n_evaluations'])
+        self.assertEqual(summary['counters']['generations'], generations)
+        self.assertEqual(len(instr.records), generations)
+        self.assertEqual(instr.records[-1]['n_evaluations'], result['n_evaluations'])
+        self.assertTrue(all(t >= 0.0 for t in summary['phases_s'].values()))
+        self.assertLessEqual(sum(summary['phases_s'].values()), summary['total_s'] + 1e-6)
+        self.assertGreater(summary['phases_s']['evaluation'], 0.0)
+
+    def test_ga_modes(self):
+        for mode in ('generational', 'steady_state'):
+            instr = Instrumentation()
+            ga = GeneticAlgorithm(20, 0.1, 0.9, 15, mode=mode, seed=0)
+            result = ga.run(sphere, BOUNDS, instrumentation=instr)
+            self.check(result, instr, 15)
+
+    def test_de(self):
+        for vectorized in (True, False):
+            instr = Instrumentation()
+            de = DifferentialEvolution(population_size=10, generations=8, vectorized=vectorized, seed=0)
+            result = de.run(sphere, BOUNDS, instrumentation=instr)
+            self.check(result, instr, 8)
+            self.assertEqual([r['best_value'] for r in instr.records], list(result['history']))
+
+    def test_instrumentation_does_not_change_results(self):
+        a = GeneticAlgorithm(20, 0.1, 0.9, 10, seed=3).run(sphere, BOUNDS)
+        b = GeneticAlgorithm(20, 0.1, 0.9, 10, seed=3).run(
+            sphere, BOUNDS, instrumentation=Instrumentation(keep_records=False))
+        np.testing.assert_array_equal(a['history'], b['history'])
+        self.assertIn('instrumentation', a)
+
+    def test_cache_hits_not_counted_as_evaluations(self):
+        cache = FitnessCache(sphere)
+        # elitism copies and repeated children hit the cache
+        result = GeneticAlgorithm(10, 0.0, 0.0, 5, mode='generational', seed=0).run(cache, BOUNDS)
+        counters = result['instrumentation']['counters']
+        self.assertEqual(counters['evaluations'], cache.misses)
+        self.assertGreater(counters['cache_hits'], 0)
+        self.assertEqual(counters['evaluations'] + counters['cache_hits'], result['n_evaluations'])
+
+    def test_hybrid_counts_model_rows(self):
+        rng = np.random.default_rng(0)
+        X = rng.uniform(-1, 1, size=(60, 3))
+        rf = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, -np.sum(X ** 2, axis=1))
+        with SurrogateEvaluator(rf, n_threads=1) as model:
+            result = HybridGA(population_size=12, generations=4, seed=0).run(model, [(-1.0, 1.0)] * 3)
+            counters = result['instrumentation']['counters']
+            self.assertEqual(counters['evaluations'], model.model_rows)
+            self.assertEqual(counters['evaluations'] + counters.get('cache_hits', 0), result['n_evaluations'])
+
+    def test_hybrid_timing_from_instrumentation(self):
+        rng = np.random.default_rng(0)
+        X = rng.uniform(-1, 1, size=(60, 3))
+        rf = RandomForestRegressor(n_estimators=10, random_state=0).fit(X, -np.sum(X ** 2, axis=1))
+        instr = Instrumentation()
+        result = HybridGA(population_size=16, generations=5, seed=0).run(
+            rf, [(-1.0, 1.0)] * 3, instrumentation=instr)
+        self.assertEqual(result['timing']['predict_s'], result['instrumentation']['phases_s']['evaluation'])
+        self.assertEqual(result['instrumentation']['counters']['evaluations'], result['n_evaluations'])
+        self.assertEqual(len(instr.records), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
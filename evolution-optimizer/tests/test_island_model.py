@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+from src.optimizers.differential_evolution import DifferentialEvolution
+from src.optimizers.evaluation import batched_objective
+from src.optimizers.genetic_algorithm import GeneticAlgorithm
+from src.optimizers.island_model import (
+    IslandModel,
+    migration_sources,
+    receive_migrants,
+    write_migrants,
+)
+
+
+@batched_objective
+def rastrigin(pop):
+    return 10 * pop.shape[1] + np.sum(pop ** 2 - 10 * np.cos(2 * np.pi * pop), axis=1)
+
+
+def broken(x):
+    raise RuntimeError("objective failed")
+
+
+BOUNDS = [(-5.12, 5.12)] * 4
+DE_KWARGS = {'population_size': 12, 'vectorized': True}
+
+
+class TestMigration(unittest.TestCase):
+
+    def test_sources(self):
+        self.assertEqual(migration_sources(0, 4, 'ring'), [3])
+        self.assertEqual(migration_sources(2, 4, 'full'), [0, 1, 3])
+        with self.assertRaises(ValueError):
+            migration_sources(0, 4, 'star')
+
+    def test_migrants_replace_worst(self):
+        buffer = np.zeros((2, 2, 3))
+        pop_a = np.arange(8, dtype=float).reshape(4, 2)
+        fit_a = np.array([4.0, 1.0, 3.0, 2.0])
+        write_migrants(buffer, 0, pop_a, fit_a, minimize=True)
+        np.testing.assert_array_equal(buffer[0, :, -1], [1.0, 2.0])
+        pop_b = np.full((4, 2), 9.0)
+        fit_b = np.array([5.0, 0.5, 7.0, 6.0])
+        receive_migrants(buffer, 1, [0], pop_b, fit_b, minimize=True)
+        np.testing.assert_array_equal(np.sort(fit_b), [0.5, 1.0, 2.0, 5.0])
+        np.testing.assert_array_equal(pop_b[2], pop_a[1])
+
+
+class TestIslandModel(unittest.TestCase):
+
+    def test_processes_match_in_process(self):
+        runs = [IslandModel(DifferentialEvolution, DE_KWARGS, n_islands=3, generations=25,
+                            migration_interval=5, seed=4, processes=p).run(rastrigin, BOUNDS)
+                for p in (False, True)]
+        serial, parallel = runs
+        self.assertEqual(parallel['workers'], 3)
+        self.assertAlmostEqual(serial['best_value'], parallel['best_value'])
+        np.testing.assert_allclose(serial['history'], parallel['history'])
+        self.assertEqual(serial['migrations'], 4)
+
+    def test_history_shapes(self):
+        result = IslandModel(GeneticAlgorithm, {'population_size': 10, 'mutation_rate': 0.1,
+                                                'crossover_rate': 0.8, 'mode': 'generational'},
+                             n_islands=2, generations=12, migration_interval=5, topology='full',
+                             seed=0, processes=False).run(rastrigin, BOUNDS)
+        self.assertEqual(len(result['history']), 12)
+        self.assertEqual([len(h) for h in result['island_history']], [12, 12])
+        np.testing.assert_allclose(result['history'], np.min(result['island_history'], axis=0))
+        self.assertEqual(result['best_value'], min(r['best_value'] for r in result['islands']))
+        # elitist generational GA + migration never loses the global best
+        self.assertTrue(np.all(np.diff(result['history']) <= 1e-12))
+
+    def test_worker_error_is_raised(self):
+        model = IslandModel(DifferentialEvolution, DE_KWARGS, n_islands=2, generations=4,
+                            migration_interval=2, seed=0)
+        with self.assertRaises(RuntimeError):
+            model.run(broken, BOUNDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
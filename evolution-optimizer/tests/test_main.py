@@ -0,0 +1,27 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from main import build_ga, stall_termination  # noqa: E402
+from problems.sample_problem import DEFAULT_PROBLEM_SEED, ScherrerFitProblem, get_problem_bounds  # noqa: E402
+
+
+class TestMainConfiguration(unittest.TestCase):
+
+    def test_default_ga_runs_full_budget(self):
+        ga, termination = build_ga({})
+        self.assertEqual(ga.mode, 'steady_state')
+        problem = ScherrerFitProblem.synthetic(seed=DEFAULT_PROBLEM_SEED)
+        result = ga.run(problem, get_problem_bounds(), minimize=True, termination=termination)
+        self.assertEqual(result['stop_reason'], 'generations')
+        self.assertEqual(len(result['history']), 150)
+
+    def test_stall_window(self):
+        self.assertEqual(stall_termination(50)[0].n, 30)
+        self.assertEqual(stall_termination(50, steady_state=True)[0].n, 750)
+        self.assertEqual(stall_termination(1, steady_state=True)[0].n, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+# objectives.py uses top-level imports relative to src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from objectives import OBJECTIVES  # noqa: E402
+
+
+class TestVectorizedObjectives(unittest.TestCase):
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(1)
+        for key, obj in OBJECTIVES.items():
+            lo = np.array([b[0] for b in obj['bounds']])
+            hi = np.array([b[1] for b in obj['bounds']])
+            X = rng.uniform(lo, hi, (25, obj['dims']))
+            expected = np.array([obj['func'](x) for x in X])
+            np.testing.assert_allclose(obj['batch_func'](X), expected, rtol=1e-12, err_msg=key)
+
+    def test_scherrer_invalid_is_inf(self):
+        batch = OBJECTIVES['1']['batch_func']
+        X = np.array([[0.9, 1.54, 0.0, 0.3],
+                      [0.9, 1.54, 0.01, np.pi / 2],
+                      [0.9, 1.54, 0.01, 0.3]])
+        out = batch(X)
+        self.assertTrue(np.isinf(out[0]))
+        self.assertTrue(np.isinf(out[1]))
+        self.assertTrue(np.isfinite(out[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
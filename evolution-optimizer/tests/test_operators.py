@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+from src.optimizers.operators import (
+    tournament_select,
+    one_point_crossover,
+    uniform_crossover,
+    mutation_mask,
+    gaussian_mutation,
+    uniform_reset_mutation,
+)
+from src.optimizers.hybrid_ga import HybridGA
+
+
+class SumModel:
+    def predict(self, X):
+        return -np.sum((X - 0.5) ** 2, axis=1)
+
+
+class TestOperators(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.p1 = np.zeros((6, 5))
+        self.p2 = np.ones((6, 5))
+
+    def test_tournament_prefers_better(self):
+        fitness = np.arange(50, dtype=float)
+        winners = tournament_select(self.rng, fitness, 200, k=3)
+        self.assertGreater(fitness[winners].mean(), fitness.mean())
+        losers = tournament_select(self.rng, fitness, 200, k=3, maximize=False)
+        self.assertLess(fitness[losers].mean(), fitness.mean())
+
+    def test_crossover_preserves_genes(self):
+        for op in (one_point_crossover, uniform_crossover):
+            children = op(self.rng, self.p1, self.p2)
+            self.assertEqual(children.shape, (12, 5))
+            # every locus keeps one gene from each parent across the mirrored pair
+            np.testing.assert_array_equal(children[:6] + children[6:], np.ones((6, 5)))
+
+    def test_one_point_is_prefix(self):
+        children = one_point_crossover(self.rng, self.p1, self.p2)[:6]
+        self.assertTrue(np.all(np.diff(children, axis=1) >= 0))
+
+    def test_no_crossover_copies_parents(self):
+        children = one_point_crossover(self.rng, self.p1, self.p2, rate=0.0)
+        np.testing.assert_array_equal(children[:6], self.p1)
+        np.testing.assert_array_equal(children[6:], self.p2)
+
+    def test_mutations_respect_bounds_and_mask(self):
+        lower, upper = np.zeros(5), np.ones(5)
+        X = np.full((100, 5), 0.5)
+        mask = mutation_mask(self.rng, X.shape, np.array([0.0, 1.0, 1.0, 0.0, 0.0]))
+        gaussian_mutation(self.rng, X, mask, 2.0, lower, upper)
+        self.assertTrue(np.all((X >= 0) & (X <= 1)))
+        np.testing.assert_array_equal(X[:, [0, 3, 4]], 0.5)
+        Y = np.full((100, 5), 7.0)
+        uniform_reset_mutation(self.rng, Y, mask, lower, upper)
+        self.assertTrue(np.all((Y[:, 1:3] >= 0) & (Y[:, 1:3] <= 1)))
+        np.testing.assert_array_equal(Y[:, 0], 7.0)
+
+    def test_gaussian_mutation_only_clips_masked_genes(self):
+        X = np.array([[5.0, 0.5, -3.0]])
+        mask = np.array([[False, True, False]])
+        gaussian_mutation(self.rng, X, mask, 10.0, np.zeros(3), np.ones(3))
+        self.assertEqual(X[0, 0], 5.0)
+        self.assertEqual(X[0, 2], -3.0)
+        self.assertTrue(0.0 <= X[0, 1] <= 1.0)
+
+    def test_hybrid_ga_run(self):
+        ga = HybridGA(population_size=21, generations=30, elitism=2,
+                      variable_mutation_weights=[1, 0, 0, 0], seed=0)
+        result = ga.run(SumModel(), [(0.0, 1.0)] * 4)
+        self.assertEqual(len(result['history']), 30)
+        # elitism keeps the best-so-far
+        self.assertTrue(np.all(np.diff(result['history']) >= 0))
+        self.assertGreater(result['best_fitness'], -0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from src.problems.peak_extraction import (
+    MultiPeakScherrerProblem,
+    correct_instrumental_broadening,
+    extract_peaks,
+    extract_peaks_many,
+    get_multipeak_bounds,
+    synthetic_pattern,
+)
+from src.optimizers.evaluation import is_batched
+
+
+class TestPeakExtraction(unittest.TestCase):
+
+    def test_finds_all_peaks_and_widths(self):
+        positions = (28.4, 47.3, 56.1, 69.1, 76.4)
+        two_theta, intensity = synthetic_pattern(positions, size=250.0, instrumental_fwhm=0.05, seed=0)
+        peaks = extract_peaks(two_theta, intensity, instrumental_fwhm=0.05)
+        np.testing.assert_allclose(peaks['two_theta'], positions, atol=0.02)
+        theta = np.radians(positions) / 2.0
+        expected_B = 0.9 * 1.5406 / (250.0 * np.cos(theta))
+        np.testing.assert_allclose(peaks['B'], expected_B, rtol=0.05)
+        np.testing.assert_allclose(peaks['theta'], theta, atol=2e-4)
+
+    def test_broadening_correction(self):
+        np.testing.assert_allclose(correct_instrumental_broadening([0.5], 0.3, 'gaussian'), [0.4])
+        np.testing.assert_allclose(correct_instrumental_broadening([0.5], 0.3, 'lorentzian'), [0.2])
+        self.assertTrue(np.isnan(correct_instrumental_broadening([0.1], 0.3)[0]))
+        with self.assertRaises(ValueError):
+            correct_instrumental_broadening([0.5], 0.3, 'voigt')
+
+    def test_flat_pattern_has_no_peaks(self):
+        peaks = extract_peaks(np.linspace(20, 80, 500), np.zeros(500))
+        self.assertEqual(len(peaks['theta']), 0)
+
+    def test_many_patterns_serial_matches_parallel(self):
+        patterns = [synthetic_pattern(size=s, seed=i) for i, s in enumerate((120.0, 250.0, 400.0))]
+        serial, report = extract_peaks_many(patterns, n_workers=1)
+        parallel, _ = extract_peaks_many(patterns, n_workers=2)
+        for a, b in zip(serial, parallel):
+            np.testing.assert_array_equal(a['B'], b['B'])
+        self.assertEqual(report['patterns'], 3)
+        self.assertEqual(report['peaks'], sum(len(r['B']) for r in serial))
+        self.assertGreater(report['patterns_per_s'], 0)
+
+
+class TestMultiPeakScherrerProblem(unittest.TestCase):
+
+    def setUp(self):
+        two_theta, intensity = synthetic_pattern(size=250.0, seed=3)
+        self.problem = MultiPeakScherrerProblem.from_pattern(two_theta, intensity, instrumental_fwhm=0.05)
+
+    def test_batch_matches_scalar(self):
+        self.assertTrue(is_batched(self.problem))
+        lower, upper = np.array(get_multipeak_bounds()).T
+        pop = np.random.default_rng(0).uniform(lower, upper, (20, 3))
+        batch = self.problem(pop)
+        self.assertEqual(batch.shape, (20,))
+        for row, value in zip(pop, batch):
+            self.assertAlmostEqual(self.problem(row), value)
+
+    def test_true_size_is_near_optimal(self):
+        good = self.problem([0.9, 1.5406, 250.0])
+        self.assertLess(good, 1e-3)
+        self.assertLess(good, self.problem([0.9, 1.5406, 150.0]))
+        self.assertTrue(np.isnan(self.problem([0.9, 1.5406, -1.0])))
+
+    def test_shape_mismatch_raises(self):
+        with self.assertRaises(ValueError):
+            MultiPeakScherrerProblem([0.1, 0.2], [0.01])
+
+
+if __name__ == '__main__':
+    unittest.main()
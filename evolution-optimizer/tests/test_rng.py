@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+import numpy as np
+from src.optimizers.rng import make_rng, spawn_rngs
+from src.optimizers.genetic_algorithm import GeneticAlgorithm
+from src.optimizers.differential_evolution import DifferentialEvolution
+from src.optimizers.hybrid_ga import HybridGA
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from diversification import MaxMinDiversification, ChemicalRecipeMaxMin  # noqa: E402
+
+
+def sphere(x):
+    return float(np.sum(x ** 2))
+
+
+class SphereModel:
+    def predict(self, X):
+        return -np.sum(X ** 2, axis=1)
+
+
+class TestReproducibleStreams(unittest.TestCase):
+
+    bounds = [(-2.0, 2.0)] * 3
+
+    def test_make_rng_passes_generator_through(self):
+        rng = np.random.default_rng(1)
+        self.assertIs(make_rng(rng), rng)
+
+    def test_spawn_is_independent_and_reproducible(self):
+        a = [g.random(3) for g in spawn_rngs(5, 3)]
+        b = [g.random(3) for g in spawn_rngs(5, 3)]
+        for x, y in zip(a, b):
+            np.testing.assert_array_equal(x, y)
+        self.assertFalse(np.allclose(a[0], a[1]))
+
+    def test_optimizers_reproducible(self):
+        factories = [
+            lambda s: GeneticAlgorithm(20, 0.1, 0.7, 15, seed=s),
+            lambda s: GeneticAlgorithm(20, 0.1, 0.7, 15, mode='generational', seed=s),
+            lambda s: DifferentialEvolution(population_size=12, generations=5, seed=s),
+            lambda s: DifferentialEvolution(population_size=12, generations=5, vectorized=True, seed=s),
+        ]
+        for make in factories:
+            r1 = make(11).run(sphere, self.bounds)
+            r2 = make(11).run(sphere, self.bounds)
+            self.assertEqual(r1['history'], r2['history'])
+            np.testing.assert_array_equal(r1['best_solution'], r2['best_solution'])
+        h1 = HybridGA(population_size=10, generations=5, seed=3).run(SphereModel(), self.bounds)
+        h2 = HybridGA(population_size=10, generations=5, seed=3).run(SphereModel(), self.bounds)
+        self.assertEqual(h1['history'], h2['history'])
+
+    def test_diversifiers_reproducible(self):
+        s1 = MaxMinDiversification(self.bounds, num_samples=6, seed=4).generate_diverse_samples(20)
+        s2 = MaxMinDiversification(self.bounds, num_samples=6, seed=4).generate_diverse_samples(20)
+        np.testing.assert_array_equal(np.array(s1), np.array(s2))
+        cats = {'solvent': ['water', 'ethanol'], 'atmosphere': ['air', 'N2', 'Ar']}
+        exported = []
+        for _ in range(2):
+            gen = ChemicalRecipeMaxMin([(0, 1), (10, 20)], cats, num_samples=5, seed=4)
+            gen.generate_diverse_recipes(candidates_per_iteration=10)
+            exported.append(gen.export_recipes_to_dict_list())
+        self.assertEqual(len(exported[0]), 5)
+        self.assertEqual(exported[0], exported[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import pickle
+import unittest
+import numpy as np
+from src.problems.sample_problem import (
+    ScherrerFitProblem,
+    scherrer_equation,
+    evaluate_solution,
+    evaluate_solutions,
+    get_problem_bounds,
+)
+from src.optimizers.evaluation import evaluate_population, get_evaluator
+from src.problems import sample_problem
+
+
+class TestScherrerFitObjective(unittest.TestCase):
+
+    def setUp(self):
+        lower = [lo for lo, _ in get_problem_bounds()]
+        upper = [hi for _, hi in get_problem_bounds()]
+        self.pop = np.random.default_rng(0).uniform(lower, upper, (30, 3))
+        self.problem = ScherrerFitProblem.synthetic(seed=1)
+
+    def test_batch_matches_scalar(self):
+        batch = self.problem(self.pop)
+        self.assertEqual(batch.shape, (30,))
+        for row, value in zip(self.pop, batch):
+            self.assertAlmostEqual(self.problem(row), value, places=6)
+
+    def test_batch_matches_reference_loop(self):
+        K, lam, B = self.pop[0]
+        theta, D = self.problem.theta_data, self.problem.D_measured
+        expected = np.mean((np.array([scherrer_equation(K, lam, B, t) for t in theta]) - D) ** 2)
+        self.assertAlmostEqual(self.problem(self.pop[0]), expected, places=6)
+
+    def test_invalid_B_is_nan(self):
+        pop = self.pop[:3].copy()
+        pop[1, 2] = 0.0
+        values = self.problem(pop)
+        self.assertTrue(np.isnan(values[1]))
+        self.assertTrue(np.all(np.isfinite(values[[0, 2]])))
+
+    def test_module_functions_use_default_problem(self):
+        np.testing.assert_allclose(evaluate_solutions(self.pop[:4]),
+                                   [evaluate_solution(x) for x in self.pop[:4]])
+
+    def test_pickle_round_trip(self):
+        clone = pickle.loads(pickle.dumps(self.problem))
+        np.testing.assert_array_equal(clone(self.pop), self.problem(self.pop))
+        self.assertTrue(clone.cos_theta.flags['C_CONTIGUOUS'])
+
+    def test_process_pool(self):
+        expected = evaluate_population(self.problem, self.pop)
+        with get_evaluator('process', n_workers=2, chunk_size=7) as ev:
+            np.testing.assert_array_equal(ev(self.problem, self.pop), expected)
+
+    def test_default_problem_is_deterministic(self):
+        # each pool worker builds the default problem on its own; all must see the same data
+        expected = evaluate_solutions(self.pop)
+        saved = sample_problem._default_problem
+        try:
+            sample_problem._default_problem = None
+            np.testing.assert_array_equal(evaluate_solutions(self.pop), expected)
+        finally:
+            sample_problem._default_problem = saved
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from src.optimizers.surrogate import SurrogateEvaluator
+from src.optimizers.hybrid_ga import HybridGA
+
+
+class TestSurrogateEvaluator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.X = rng.uniform(0, 1, (200, 4))
+        cls.y = cls.X[:, 0] - (cls.X[:, 1] - 0.5) ** 2 + 0.1 * cls.X[:, 2]
+        cls.rf = RandomForestRegressor(n_estimators=30, random_state=0).fit(cls.X, cls.y)
+        cls.P = rng.uniform(0, 1, (40, 4))
+
+    def test_matches_model_predict(self):
+        for threads in (1, 3):
+            with SurrogateEvaluator(self.rf, n_threads=threads, cache_size=0) as s:
+                np.testing.assert_allclose(s.predict(self.P), self.rf.predict(self.P), rtol=1e-12)
+
+    def test_non_forest_model(self):
+        lin = LinearRegression().fit(self.X, self.y)
+        with SurrogateEvaluator(lin) as s:
+            np.testing.assert_allclose(s.predict(self.P), lin.predict(self.P))
+
+    def test_multi_output_model_rejected(self):
+        Y = np.column_stack([self.y, -self.y])
+        with self.assertRaises(ValueError):
+            SurrogateEvaluator(RandomForestRegressor(n_estimators=5, random_state=0).fit(self.X, Y))
+        with SurrogateEvaluator(LinearRegression().fit(self.X, Y)) as s:
+            with self.assertRaises(ValueError):
+                s.predict(self.P)
+
+    def test_cache_skips_repeated_rows(self):
+        with SurrogateEvaluator(self.rf, n_threads=2) as s:
+            first = s.predict(self.P)
+            again = s.predict(np.vstack([self.P[:5], self.P[:5]]))
+            np.testing.assert_array_equal(again[:5], first[:5])
+            self.assertEqual(s.stats()['model_rows'], len(self.P))
+
+    def test_predict_many_splits_in_order(self):
+        with SurrogateEvaluator(self.rf, n_threads=2) as s:
+            parts = s.predict_many([self.P[:10], self.P[10:25], self.P[25:]])
+            self.assertEqual([len(p) for p in parts], [10, 15, 15])
+            np.testing.assert_allclose(np.concatenate(parts), self.rf.predict(self.P))
+
+    def test_hybrid_ga_same_result_with_wrapper(self):
+        bounds = [(0.0, 1.0)] * 4
+        plain = HybridGA(population_size=20, generations=10, seed=3).run(self.rf, bounds)
+        with SurrogateEvaluator(self.rf, n_threads=2) as s:
+            wrapped = HybridGA(population_size=20, generations=10, seed=3).run(s, bounds)
+        np.testing.assert_allclose(wrapped['best_solution'], plain['best_solution'])
+        self.assertAlmostEqual(wrapped['best_fitness'], plain['best_fitness'])
+        self.assertIn('surrogate_stats', wrapped)
+        self.assertGreater(wrapped['surrogate_stats']['cache']['hits'], 0)
+        self.assertEqual(set(plain['timing']), {'predict_s', 'operators_s', 'total_s'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from src.optimizers.differential_evolution import DifferentialEvolution
+from src.optimizers.evaluation import batched_objective
+from src.optimizers.genetic_algorithm import GeneticAlgorithm
+from src.optimizers.hybrid_ga import HybridGA
+from src.optimizers.termination import (
+    MaxEvaluations,
+    PopulationSpread,
+    StallGenerations,
+    TargetValue,
+    Termination,
+    WallClock,
+)
+
+
+@batched_objective
+def sphere(pop):
+    return np.sum(pop ** 2, axis=1)
+
+
+BOUNDS = [(-5.0, 5.0)] * 3
+
+
+def state(best, minimize=True, fitness=(0.0, 1.0), population=((0.0,), (1.0,)), evals=0):
+    return {'best_value': best, 'minimize': minimize, 'fitness': np.array(fitness),
+            'population': np.array(population), 'n_evaluations': evals, 'generation': 0}
+
+
+class TestCriteria(unittest.TestCase):
+
+    def test_stall(self):
+        c = StallGenerations(2, tol=0.1)
+        self.assertFalse(c(state(5.0)))
+        self.assertFalse(c(state(4.95)))
+        self.assertTrue(c(state(4.92)))
+        c.reset()
+        self.assertFalse(c(state(1.0, minimize=False)))
+        self.assertFalse(c(state(2.0, minimize=False)))
+
+    def test_target_spread_evaluations(self):
+        self.assertTrue(TargetValue(1.0)(state(0.5)))
+        self.assertFalse(TargetValue(1.0)(state(0.5, minimize=False)))
+        self.assertTrue(PopulationSpread(0.01)(state(0.0, fitness=(1.0, 1.005))))
+        self.assertFalse(PopulationSpread(0.01, on='position')(state(0.0)))
+        self.assertTrue(MaxEvaluations(10)(state(0.0, evals=10)))
+        with self.assertRaises(ValueError):
+            PopulationSpread(0.1, on='genes')
+
+    def test_first_firing_criterion_wins(self):
+        term = Termination([TargetValue(-1.0), MaxEvaluations(5), WallClock(0.0)])
+        term.start()
+        self.assertTrue(term.check(**state(0.0, evals=5)))
+        self.assertEqual(term.reason, 'max_evaluations')
+
+
+class TestOptimizersStopEarly(unittest.TestCase):
+
+    def test_differential_evolution(self):
+        de = DifferentialEvolution(population_size=10, generations=200, vectorized=True, seed=0)
+        result = de.run(sphere, BOUNDS, termination=MaxEvaluations(100))
+        self.assertEqual(result['stop_reason'], 'max_evaluations')
+        self.assertEqual(result['n_evaluations'], 100)
+        self.assertEqual(len(result['history']), 9)
+
+        full = DifferentialEvolution(population_size=10, generations=20, seed=0).run(sphere, BOUNDS)
+        self.assertEqual(full['stop_reason'], 'generations')
+        self.assertEqual(full['n_evaluations'], 10 + 20 * 10)
+
+    def test_genetic_algorithm_modes(self):
+        for mode in ('steady_state', 'generational'):
+            ga = GeneticAlgorithm(20, 0.1, 0.8, 500, mode=mode, seed=1)
+            result = ga.run(sphere, BOUNDS, termination=[StallGenerations(15), TargetValue(-1.0)])
+            self.assertEqual(result['stop_reason'], 'stall')
+            self.assertLess(len(result['history']), 500)
+
+    def test_hybrid_ga_target(self):
+        rng = np.random.default_rng(0)
+        X = rng.uniform(0, 1, (100, 2))
+        rf = RandomForestRegressor(n_estimators=10, random_state=0).fit(X, X.sum(axis=1))
+        ga = HybridGA(population_size=20, generations=100, seed=0)
+        result = ga.run(rf, [(0.0, 1.0)] * 2, termination=TargetValue(1.0))
+        self.assertEqual(result['stop_reason'], 'target')
+        self.assertGreaterEqual(result['best_fitness'], 1.0)
+        self.assertEqual(result['n_evaluations'], 20 * len(result['history']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from src.problems.xrd_data import load_xy, to_theta_radians
+from src.problems.sample_problem import ScherrerFitProblem
+
+
+class TestXRDLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.theta = np.sort(rng.uniform(0.1, 1.3, 1003))
+        self.D = rng.uniform(50, 150, 1003)
+        self.pop = rng.uniform([0.5, 1.0, 0.005], [1.2, 2.0, 0.05], (9, 3))
+        self.reference = ScherrerFitProblem(self.theta, self.D)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_csv_streamed_into_memmap(self):
+        path = self.path('scan.csv')
+        with open(path, 'w') as f:
+            f.write('# measured scan\ntheta,D,extra\n')
+            for t, d in zip(self.theta, self.D):
+                f.write(f'{float(t)!r},{float(d)!r},0\n')
+        x, y, cache = load_xy(path, skip_header=1, chunk_rows=100, cache_dir=self.path('cache'))
+        self.assertIsInstance(x.base, np.memmap)
+        self.assertTrue(cache.endswith('.npy'))
+        np.testing.assert_array_equal(x, self.theta)
+        np.testing.assert_array_equal(y, self.D)
+
+    def test_csv_cache_follows_parse_options(self):
+        path = self.path('scan.csv')
+        with open(path, 'w') as f:
+            for t, d in zip(self.theta[:5], self.D[:5]):
+                f.write(f'{float(t)!r},{float(d)!r}\n')
+        cache_dir = self.path('cache')
+        x, _, first = load_xy(path, cache_dir=cache_dir)
+        x_skipped, _, second = load_xy(path, skip_header=1, cache_dir=cache_dir)
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(x), 5)
+        np.testing.assert_array_equal(x_skipped, self.theta[1:5])
+        self.assertEqual(load_xy(path, cache_dir=cache_dir)[2], first)
+        self.assertEqual(load_xy(path, dtype=np.float32, cache_dir=cache_dir)[0].dtype, np.float32)
+
+    def test_default_cache_outside_data_folder(self):
+        data = self.path('data')
+        os.makedirs(data)
+        path = os.path.join(data, 'scan.csv')
+        with open(path, 'w') as f:
+            f.write('0.1,50\n0.2,60\n')
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.path('user-cache')}):
+            x, _, cache = load_xy(path)
+        self.assertTrue(cache.startswith(self.path('user-cache')))
+        self.assertEqual(os.listdir(data), ['scan.csv'])
+        np.testing.assert_array_equal(x, [0.1, 0.2])
+
+    def test_npy_layout(self):
+        square = np.arange(9.0).reshape(3, 3)
+        np.save(self.path('square.npy'), square)
+        with self.assertRaises(ValueError):
+            load_xy(self.path('square.npy'))
+        x, y, _ = load_xy(self.path('square.npy'), layout='rows')
+        np.testing.assert_array_equal(x, square[:, 0])
+        x, y, _ = load_xy(self.path('square.npy'), layout='columns')
+        np.testing.assert_array_equal(y, square[1])
+        with self.assertRaises(ValueError):
+            load_xy(self.path('square.npy'), layout='diagonal')
+
+    def test_npy_and_binary(self):
+        np.save(self.path('rows.npy'), np.column_stack([self.theta, self.D]))
+        np.save(self.path('cols.npy'), np.vstack([self.theta, self.D]))
+        np.column_stack([self.theta, self.D]).astype(np.float64).tofile(self.path('scan.bin'))
+        for name in ('rows.npy', 'cols.npy', 'scan.bin'):
+            x, y, _ = load_xy(self.path(name))
+            np.testing.assert_array_equal(x, self.theta)
+            np.testing.assert_array_equal(y, self.D)
+
+    def test_streaming_problem_matches_in_memory(self):
+        np.save(self.path('cols.npy'), np.vstack([self.theta, self.D]))
+        problem = ScherrerFitProblem.from_file(self.path('cols.npy'), chunk_size=128)
+        np.testing.assert_allclose(problem(self.pop), self.reference(self.pop), rtol=1e-12)
+        self.assertAlmostEqual(problem(self.pop[0]), self.reference(self.pop[0]))
+
+    def test_streaming_problem_predict(self):
+        np.save(self.path('cols.npy'), np.vstack([self.theta, self.D]))
+        problem = ScherrerFitProblem.from_file(self.path('cols.npy'), chunk_size=128)
+        np.testing.assert_allclose(problem.predict(self.pop[0]), self.reference.predict(self.pop[0]))
+
+    def test_angle_units(self):
+        two_theta_deg = np.degrees(self.theta) * 2
+        np.save(self.path('deg.npy'), np.vstack([two_theta_deg, self.D]))
+        problem = ScherrerFitProblem.from_file(self.path('deg.npy'), angle_unit='2theta_deg', chunk_size=100)
+        np.testing.assert_allclose(problem(self.pop), self.reference(self.pop), rtol=1e-10)
+        np.testing.assert_allclose(to_theta_radians(np.array([90.0]), '2theta_deg'), [np.pi / 4])
+
+    def test_file_problem_pickles_as_reference(self):
+        np.save(self.path('cols.npy'), np.vstack([self.theta, self.D]))
+        problem = ScherrerFitProblem.from_file(self.path('cols.npy'), chunk_size=256)
+        payload = pickle.dumps(problem)
+        self.assertLess(len(payload), 1000)
+        np.testing.assert_array_equal(pickle.loads(payload)(self.pop), problem(self.pop))
+
+
+if __name__ == '__main__':
+    unittest.main()